@@ -0,0 +1,214 @@
+# stdlib
+import os
+import subprocess
+import textwrap
+from io import StringIO
+
+# 3rd party
+import pytest
+from domdf_python_tools.paths import PathPlus
+from dulwich import porcelain
+from dulwich.index import Index, index_entry_from_stat
+from dulwich.objects import Blob
+from dulwich.repo import Repo
+from ruamel.yaml import YAML
+
+# this package
+from repo_helper.core import RepoHelper
+
+pytest_plugins = ("coincidence", "repo_helper.testing")
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_pathplus, monkeypatch) -> None:
+	monkeypatch.setenv("REPO_HELPER_CACHE_DIR", str(tmp_pathplus / ".repo_helper_cache"))
+
+
+def large_config(example_config: str, n_extras: int = 50) -> str:
+	"""
+	Returns ``example_config`` with many extras, keywords, ignore patterns and console scripts added.
+	"""
+
+	yaml = YAML()
+	config = yaml.load(example_config)
+
+	config["extras_require"] = {
+			f"extra{extra}": [f"package{extra}-{req}>=1.{req}.0" for req in range(10)]
+			for extra in range(n_extras)
+			}
+	config["keywords"] = [f"keyword{idx}" for idx in range(n_extras * 2)]
+	config["additional_ignore"] = [f"build/generated{idx}/*" for idx in range(n_extras * 10)]
+	config["console_scripts"] = [
+			f"command{idx} = repo_helper_demo.cli:command{idx}" for idx in range(n_extras)
+			]
+
+	stream = StringIO()
+	yaml.dump(config, stream)
+	return stream.getvalue()
+
+
+def make_repo(repo_path: PathPlus, config: str, n_modules: int = 0) -> PathPlus:
+	"""
+	Create a synthetic repository which ``repo_helper`` can be run on.
+
+	:param repo_path:
+	:param config: The contents of ``repo_helper.yml``.
+	:param n_modules: The number of (empty) Python modules to add to the package.
+	"""
+
+	repo_path.maybe_make(parents=True)
+	(repo_path / "repo_helper.yml").write_clean(config)
+	(repo_path / "requirements.txt").write_lines([f"dependency{idx}>=1.0" for idx in range(n_modules)])
+	(repo_path / "tests").maybe_make()
+	(repo_path / "tests" / "requirements.txt").write_lines(["pytest>=6.0"])
+	(repo_path / "doc-source").maybe_make()
+	(repo_path / "doc-source" / "index.rst").write_clean(".. start shields\n.. end shields\n")
+	(repo_path / ".pre-commit-config.yaml").touch()
+	(repo_path / "README.rst").write_clean(
+			textwrap.dedent(
+					"""\
+			================
+			repo_helper_demo
+			================
+
+			.. start short_desc
+
+			.. end short_desc
+
+			.. start shields
+
+			.. end shields
+
+			Installation
+			--------------
+
+			.. start installation
+
+			.. end installation
+			"""
+					),
+			)
+
+	package_dir = repo_path / "repo_helper_demo"
+	package_dir.maybe_make()
+	(package_dir / "__init__.py").write_clean('__version__: str = "0.0.1"')
+	for idx in range(n_modules):
+		(package_dir / f"module{idx}.py").write_clean(f"def function{idx}():\n\treturn {idx}")
+
+	return repo_path
+
+
+@pytest.fixture(params=["small", "large"])
+def synthetic_repo(request, tmp_pathplus: PathPlus, example_config: str) -> PathPlus:
+	if request.param == "large":
+		return make_repo(tmp_pathplus / "repo", large_config(example_config), n_modules=100)
+	else:
+		return make_repo(tmp_pathplus / "repo", example_config)
+
+
+@pytest.fixture()
+def loaded_repo_helper(synthetic_repo: PathPlus) -> RepoHelper:
+	rh = RepoHelper(synthetic_repo)
+	rh.load_settings()
+	return rh
+
+
+def make_git_repo(repo_path: PathPlus, n_files: int) -> PathPlus:
+	"""
+	Create a git repository with ``n_files`` committed files, in directories of 200 files.
+
+	:param repo_path:
+	:param n_files:
+	"""
+
+	repo_path.maybe_make(parents=True)
+	directories = []
+
+	for idx in range(n_files):
+		directory = repo_path / f"package{idx // 200}"
+		if not idx % 200:
+			directory.mkdir()
+			directories.append(os.fspath(directory))
+		(directory / f"module{idx % 200}.py").write_text(f"value = {idx}\n")
+
+	with porcelain.open_repo_closing(porcelain.init(os.fspath(repo_path))) as repo:
+		porcelain.add(repo, directories)
+		porcelain.commit(repo, b"Initial commit", author=b"Guido <guido@python.org>", committer=b"Guido <guido@python.org>")
+
+	return repo_path
+
+
+@pytest.fixture(scope="session")
+def git_repo_20k(tmp_path_factory) -> PathPlus:
+	return make_git_repo(PathPlus(tmp_path_factory.mktemp("git_repo_20k")), 20_000)
+
+
+def make_large_index(repo_path: PathPlus, n_entries: int) -> PathPlus:
+	"""
+	Create a git repository whose index has ``n_entries`` entries.
+
+	The files are not written to the working tree, only to the index.
+
+	:param repo_path:
+	:param n_entries:
+	"""
+
+	repo_path.maybe_make(parents=True)
+
+	with Repo.init(os.fspath(repo_path)) as repo:
+		blob = Blob.from_string(b"value = 0\n")
+		repo.object_store.add_object(blob)
+		(repo_path / "placeholder.py").write_bytes(blob.data)
+		entry = index_entry_from_stat(os.lstat(repo_path / "placeholder.py"), blob.id)
+
+		index = Index(repo.index_path(), read=False)
+		for idx in range(n_entries):
+			index[f"package{idx // 200}/module{idx % 200}.py".encode()] = entry
+		index.write()
+
+	return repo_path
+
+
+def make_git_history(repo_path: PathPlus, n_commits: int) -> PathPlus:
+	"""
+	Create a git repository with ``n_commits`` commits, each changing one file, using ``git fast-import``.
+
+	Every 100th commit is tagged, and the tag ``maintenance`` points to a commit on another branch.
+
+	:param repo_path:
+	:param n_commits:
+	"""
+
+	repo_path.maybe_make(parents=True)
+	subprocess.run(["git", "init", "--quiet", "--initial-branch=master", repo_path], check=True)
+
+	stream = []
+	for idx in range(n_commits):
+		message = f"Commit {idx}\n\nChanged module{idx % 200}.py\n"
+		content = f"value = {idx}\n"
+		stream.append(f"commit refs/heads/master\nmark :{idx + 1}")
+		stream.append(f"author Guido <guido@python.org> {1600000000 + idx * 60} +0100")
+		stream.append(f"committer Guido <guido@python.org> {1600000000 + idx * 60} +0100")
+		stream.append(f"data {len(message)}\n{message}")
+		if idx:
+			stream.append(f"from :{idx}")
+		stream.append(f"M 100644 inline module{idx % 200}.py\ndata {len(content)}\n{content}")
+		if not idx % 100:
+			stream.append(f"reset refs/tags/v{idx // 100}.0.0\nfrom :{idx + 1}\n")
+
+	# A release which isn't an ancestor of master.
+	message = "Backported fix\n"
+	stream.append(f"commit refs/heads/maintenance\nmark :{n_commits + 1}")
+	stream.append(f"committer Guido <guido@python.org> {1600000000 + n_commits * 60} +0100")
+	stream.append(f"data {len(message)}\n{message}")
+	stream.append(f"from :{max(n_commits - 100, 1)}")
+	stream.append(f"reset refs/tags/maintenance\nfrom :{n_commits + 1}\n")
+
+	subprocess.run(
+			["git", "-C", repo_path, "fast-import", "--quiet"],
+			input='\n'.join(stream).encode("UTF-8"),
+			check=True,
+			)
+	subprocess.run(["git", "-C", repo_path, "checkout", "--quiet", "master"], check=True)
+
+	return repo_path
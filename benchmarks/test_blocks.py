@@ -0,0 +1,37 @@
+# 3rd party
+from domdf_python_tools.paths import PathPlus
+
+# this package
+from repo_helper.blocks import ShieldsBlock
+from repo_helper.core import RepoHelper
+from repo_helper.files.readme import rewrite_readme
+
+
+def test_shields_block(benchmark):
+	shields_block = ShieldsBlock(
+			username="octocat",
+			repo_name="hello-world",
+			version="1.2.3",
+			conda=True,
+			tests=True,
+			docs=True,
+			docs_url="https://hello-world.readthedocs.io",
+			docker_shields=True,
+			docker_name="hello-world",
+			platforms=["Windows", "macOS", "Linux"],
+			primary_conda_channel="conda-forge",
+			)
+
+	assert ".. start shields" in str(benchmark(shields_block.make))
+
+
+def test_rewrite_readme(benchmark, loaded_repo_helper: RepoHelper):
+	repo_path = PathPlus(loaded_repo_helper.target_repo)
+	original = (repo_path / "README.rst").read_text()
+
+	def rewrite():
+		(repo_path / "README.rst").write_text(original)
+		return rewrite_readme(repo_path, loaded_repo_helper.templates)
+
+	assert benchmark(rewrite) == ["README.rst"]
+	assert "|actions_linux|" in (repo_path / "README.rst").read_text()
@@ -0,0 +1,14 @@
+# 3rd party
+from domdf_python_tools.paths import PathPlus
+
+# this package
+from repo_helper.core import RepoHelper
+from repo_helper.files.ci_cd import make_github_ci
+
+
+def test_make_github_ci(benchmark, tmp_pathplus: PathPlus, loaded_repo_helper: RepoHelper):
+	output_dir = tmp_pathplus / "output"
+
+	managed_files = benchmark(make_github_ci, output_dir, loaded_repo_helper.templates)
+	assert ".github/workflows/python_ci_linux.yml" in managed_files
+	assert (output_dir / ".github" / "workflows" / "python_ci_linux.yml").is_file()
@@ -0,0 +1,154 @@
+# stdlib
+from typing import List
+
+# 3rd party
+import pytest
+
+# this package
+from repo_helper.configupdater2 import ConfigUpdater
+
+
+def large_tox_ini(n_envs: int = 200) -> str:
+	lines: List[str] = ["[tox]", "envlist = " + ", ".join(f"py{idx}" for idx in range(n_envs)), '']
+
+	for idx in range(n_envs):
+		lines.extend([
+				f"[testenv:py{idx}]",
+				"# A comment",
+				"setenv =",
+				"    PYTHONDEVMODE=1",
+				"    PIP_DISABLE_PIP_VERSION_CHECK=1",
+				"deps =",
+				*(f"    dependency{dep}>={idx}.0" for dep in range(10)),
+				"commands =",
+				"    python --version",
+				"    python -m pytest tests/ {posargs}",
+				'',
+				])
+
+	return '\n'.join(lines)
+
+
+def large_setup_cfg(n_entries: int = 500) -> str:
+	lines: List[str] = [
+			"[metadata]",
+			"name = repo_helper_demo",
+			"version = 0.0.1",
+			"classifiers =",
+			*(f"    Topic :: Classifier {idx}" for idx in range(n_entries)),
+			'',
+			"[options]",
+			"install_requires =",
+			*(f"    dependency{idx}>=1.0" for idx in range(n_entries)),
+			'',
+			"[options.extras_require]",
+			*(f"extra{idx} = dependency{idx}>=1.0" for idx in range(n_entries)),
+			'',
+			"[options.entry_points]",
+			"console_scripts =",
+			*(f"    command{idx} = repo_helper_demo.cli:command{idx}" for idx in range(n_entries)),
+			'',
+			]
+
+	return '\n'.join(lines)
+
+
+@pytest.fixture(params=["tox.ini", "setup.cfg"])
+def large_ini(request) -> str:
+	if request.param == "tox.ini":
+		return large_tox_ini()
+	else:
+		return large_setup_cfg()
+
+
+def test_parse(benchmark, large_ini: str):
+
+	def parse() -> ConfigUpdater:
+		updater = ConfigUpdater()
+		updater.read_string(large_ini)
+		return updater
+
+	updater = benchmark(parse)
+	assert str(updater).rstrip() == large_ini.rstrip()
+
+
+def test_serialise(benchmark, large_ini: str):
+	updater = ConfigUpdater()
+	updater.read_string(large_ini)
+
+	assert benchmark(str, updater).rstrip() == large_ini.rstrip()
+
+
+@pytest.fixture(params=["tox.ini", "setup.cfg"])
+def ini_5000_lines(request) -> ConfigUpdater:
+	if request.param == "tox.ini":
+		ini = large_tox_ini(n_envs=300)
+	else:
+		ini = large_setup_cfg(n_entries=1250)
+
+	assert len(ini.splitlines()) >= 5000
+
+	updater = ConfigUpdater()
+	updater.read_string(ini)
+	return updater
+
+
+def test_lookup_5000_lines(benchmark, ini_5000_lines: ConfigUpdater):
+	names = [(section.name, section.options()) for section in ini_5000_lines.sections_blocks()]
+
+	def lookup() -> int:
+		found = 0
+		for section_name, options in names:
+			assert section_name in ini_5000_lines
+			section = ini_5000_lines[section_name]
+			for option in options:
+				if option in section:
+					found += len(section[option].value)
+		return found
+
+	assert benchmark(lookup)
+
+
+def test_update_5000_lines(benchmark, ini_5000_lines: ConfigUpdater):
+	# What IniConfigurator.copy_existing_value does for each managed key.
+	sections = ini_5000_lines.sections()
+
+	def update() -> None:
+		for section_name in sections:
+			section = ini_5000_lines[section_name]
+			section["deps"] = ["dependency>=1.0"]
+			if "commands" in section:
+				section["commands"] = section["commands"].value
+
+	benchmark(update)
+
+
+def test_serialise_sections_5000_lines(benchmark, ini_5000_lines: ConfigUpdater):
+	sections = ini_5000_lines.sections_blocks()
+	assert benchmark(lambda: sum(len(str(section)) for section in sections))
+
+
+@pytest.mark.parametrize("ini", [large_tox_ini(n_envs=300), large_setup_cfg(n_entries=1250)], ids=["tox.ini", "setup.cfg"])
+def test_round_trip_5000_lines(benchmark, ini: str):
+
+	def round_trip() -> str:
+		updater = ConfigUpdater()
+		updater.read_string(ini)
+		return str(updater)
+
+	assert benchmark(round_trip).rstrip() == ini.rstrip()
+
+
+def test_serialise_unchanged_5000_lines(benchmark, ini_5000_lines: ConfigUpdater):
+	expected = str(ini_5000_lines)
+	assert benchmark(str, ini_5000_lines) == expected
+
+
+def test_serialise_one_change_5000_lines(benchmark, ini_5000_lines: ConfigUpdater):
+	option = ini_5000_lines.sections_blocks()[-1].option_blocks()[-1]
+
+	def change() -> str:
+		option.value = option.value
+		return str(ini_5000_lines)
+
+	benchmark(change)
@@ -0,0 +1,43 @@
+# 3rd party
+import pytest
+from configconfig.parser import Parser
+from domdf_python_tools.paths import PathPlus
+
+# this package
+from repo_helper.configuration import RepoHelperParser, load_config, migrate_config, parse_yaml
+
+# this package
+from .conftest import large_config, make_repo
+
+
+def test_parse_yaml(benchmark, synthetic_repo: PathPlus):
+	config = benchmark(parse_yaml, synthetic_repo)
+	assert config["modname"] == "repo_helper_demo"
+
+
+@pytest.fixture()
+def config_2000_lines(tmp_pathplus: PathPlus, example_config: str) -> PathPlus:
+	config = large_config(example_config, n_extras=83)
+	assert len(config.splitlines()) >= 2000
+
+	repo_path = make_repo(tmp_pathplus / "repo", config)
+	# Remove the keys configconfig's parser would reject.
+	migrate_config(repo_path)
+	return repo_path / "repo_helper.yml"
+
+
+def test_load_config_2000_lines(benchmark, config_2000_lines: PathPlus):
+	config = benchmark(load_config, config_2000_lines)
+	assert len(config["extras_require"]) == 83
+
+
+@pytest.mark.parametrize("parser", ["configconfig", "fast"])
+def test_parse_2000_lines(benchmark, config_2000_lines: PathPlus, parser: str):
+	if parser == "fast":
+		run = RepoHelperParser().run
+	else:
+		# configconfig's implementation: a temporary schema file, and the pure-Python loader.
+		run = lambda filename: Parser.run(RepoHelperParser(), filename)  # noqa: E731
+
+	config = benchmark(run, config_2000_lines)
+	assert config["modname"] == "repo_helper_demo"
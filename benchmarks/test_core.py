@@ -0,0 +1,42 @@
+# stdlib
+import os
+
+# 3rd party
+import pytest
+from domdf_python_tools.paths import PathPlus
+
+# this package
+from repo_helper.core import RepoHelper
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_run(benchmark, synthetic_repo: PathPlus, jobs: int):
+	rh = RepoHelper(synthetic_repo)
+	rh.load_settings()
+
+	# Import the managers before timing starts.
+	assert rh.files
+
+	managed_files = benchmark.pedantic(rh.run, kwargs={"jobs": jobs}, rounds=5, warmup_rounds=1)
+	assert "tox.ini" in managed_files
+
+
+def test_run_unchanged(benchmark, synthetic_repo: PathPlus):
+	rh = RepoHelper(synthetic_repo)
+	rh.load_settings()
+	rh.run()
+
+	benchmark.pedantic(rh.run, rounds=5)
+	assert rh.changes == []
+
+
+def test_load_settings(benchmark, synthetic_repo: PathPlus):
+
+	def load() -> RepoHelper:
+		rh = RepoHelper(synthetic_repo)
+		rh.load_settings()
+		return rh
+
+	rh = benchmark(load)
+	assert rh.templates.globals["modname"] == "repo_helper_demo"
+	assert os.path.samefile(rh.target_repo, synthetic_repo)
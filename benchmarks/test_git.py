@@ -0,0 +1,207 @@
+# stdlib
+import os
+import shutil
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# 3rd party
+import pytest
+from domdf_python_tools.paths import PathPlus
+from dulwich.repo import Repo
+from southwark import status
+
+# this package
+from repo_helper.git import DulwichSession, SessionLog, managed_status, open_session
+
+# this package
+from .conftest import make_git_history, make_large_index
+
+requires_git = pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+backends = pytest.mark.parametrize("backend", ["dulwich", pytest.param("git", marks=requires_git)])
+
+
+@contextmanager
+def changed_file(filename: PathPlus) -> Iterator[None]:
+	"""
+	Change the content of a file in a shared repository, and restore it afterwards.
+
+	:param filename:
+	"""
+
+	content = filename.read_bytes()
+	filename.write_text("value = 'changed'\n")
+
+	try:
+		yield
+	finally:
+		filename.write_bytes(content)
+
+
+@pytest.mark.parametrize("mode", ["full", "managed"])
+def test_status_20k_files(benchmark, git_repo_20k: PathPlus, mode: str):
+	# About as many files as repo_helper manages.
+	managed_files = [f"package{idx}/module0.py" for idx in range(40)]
+
+	with changed_file(git_repo_20k / "package0" / "module0.py"):
+		if mode == "full":
+			stat = benchmark.pedantic(status, args=(git_repo_20k, ), rounds=3)
+		else:
+			stat = benchmark(managed_status, git_repo_20k, managed_files)
+
+	assert stat.unstaged == [PathPlus("package0/module0.py")]
+
+
+@pytest.mark.parametrize("mode", ["per_file", "batched"])
+def test_stage_50k_entries(benchmark, tmp_pathplus: PathPlus, mode: str):
+	repo_path = make_large_index(tmp_pathplus / "repo", 50_000)
+	managed_files = [f"package{idx}/module0.py" for idx in range(10)]
+	rounds = iter(range(100))
+
+	def setup() -> Tuple[Tuple[PathPlus, List[str]], Dict[str, Any]]:
+		content = f"value = {next(rounds)}\n"
+		for filename in managed_files:
+			(repo_path / filename).parent.maybe_make()
+			(repo_path / filename).write_text(content)
+		return (repo_path, managed_files), {}
+
+	if mode == "per_file":
+		# The approach used previously: the index is read and written for each file.
+		def stage(repo_path: PathPlus, files: List[str]) -> None:
+			with Repo(os.fspath(repo_path)) as repo:
+				worktree = repo.get_worktree() if hasattr(repo, "get_worktree") else repo
+				for filename in files:
+					worktree.stage(filename)
+
+		benchmark.pedantic(stage, setup=setup, rounds=1)
+	else:
+
+		def stage(repo_path: PathPlus, files: List[str]) -> None:
+			with DulwichSession(repo_path) as session:
+				assert session.stage_changes(files) == list(map(PathPlus, files))
+
+		benchmark.pedantic(stage, setup=setup, rounds=3)
+
+	with DulwichSession(repo_path) as session:
+		assert session.managed_status(managed_files).unstaged == []
+
+
+@backends
+def test_backend_status_20k_files(benchmark, git_repo_20k: PathPlus, backend: str):
+
+	def status(repo_path: PathPlus) -> List[PathPlus]:
+		with open_session(repo_path, backend) as session:
+			return session.status().unstaged
+
+	with changed_file(git_repo_20k / "package1" / "module0.py"):
+		unstaged = benchmark.pedantic(status, args=(git_repo_20k, ), rounds=3)
+
+	assert unstaged == [PathPlus("package1/module0.py")]
+
+
+@backends
+def test_backend_managed_status_20k_files(benchmark, git_repo_20k: PathPlus, backend: str):
+	managed_files = [f"package{idx}/module0.py" for idx in range(40)]
+
+	def status(repo_path: PathPlus) -> List[PathPlus]:
+		with open_session(repo_path, backend) as session:
+			return session.managed_status(managed_files).unstaged
+
+	with changed_file(git_repo_20k / "package2" / "module0.py"):
+		unstaged = benchmark(status, git_repo_20k)
+
+	assert unstaged == [PathPlus("package2/module0.py")]
+
+
+@backends
+def test_backend_stage_50k_entries(benchmark, tmp_pathplus: PathPlus, backend: str):
+	repo_path = make_large_index(tmp_pathplus / "repo", 50_000)
+	managed_files = [f"package{idx}/module0.py" for idx in range(10)]
+	rounds = iter(range(100))
+
+	def setup() -> Tuple[Tuple[PathPlus, List[str]], Dict[str, Any]]:
+		content = f"value = {next(rounds)}\n"
+		for filename in managed_files:
+			(repo_path / filename).parent.maybe_make()
+			(repo_path / filename).write_text(content)
+		return (repo_path, managed_files), {}
+
+	def stage(repo_path: PathPlus, files: List[str]) -> None:
+		with open_session(repo_path, backend) as session:
+			assert session.stage_changes(files) == list(map(PathPlus, files))
+
+	benchmark.pedantic(stage, setup=setup, rounds=3)
+
+	with DulwichSession(repo_path) as session:
+		assert session.managed_status(managed_files).unstaged == []
+
+
+@pytest.fixture(scope="module")
+def git_history_5k(tmp_path_factory) -> PathPlus:
+	if shutil.which("git") is None:
+		pytest.skip("git is not installed")
+
+	return make_git_history(PathPlus(tmp_path_factory.mktemp("git_history_5k")), 5000)
+
+
+@backends
+def test_backend_log_5k_commits(benchmark, git_history_5k: PathPlus, backend: str):
+
+	def log(repo_path: PathPlus) -> str:
+		with open_session(repo_path, backend) as session:
+			return SessionLog(session).log(colour=False)
+
+	commit_log = benchmark.pedantic(log, args=(git_history_5k, ), rounds=3)
+	assert commit_log.count("commit: ") == 5000
+	assert "(HEAD -> master)" in commit_log.splitlines()[0]
+
+
+@pytest.mark.parametrize("tag", ["v0.0.0", "v49.0.0", "maintenance"])
+@pytest.mark.parametrize("mode", ["walk", "dulwich", pytest.param("git", marks=requires_git)])
+def test_commits_since_release_5k_commits(benchmark, git_history_5k: PathPlus, mode: str, tag: str):
+	expected = {"v0.0.0": 4999, "v49.0.0": 99, "maintenance": -1}[tag]
+
+	if mode == "walk":
+		# The approach used previously: walk from HEAD until the tagged commit is found, if it ever is.
+		def count(repo_path: PathPlus) -> int:
+			with DulwichSession(repo_path) as session:
+				sha = {tag_name: sha for sha, tag_name in session.tags().items()}[tag]
+				for idx, commit in enumerate(session.iter_commits()):
+					if commit.id.decode("UTF-8") == sha:
+						return idx
+				return -1
+
+	else:
+		# Without the cache.
+		def count(repo_path: PathPlus) -> int:
+			with open_session(repo_path, mode) as session:
+				sha = {tag_name: sha for sha, tag_name in session.tags().items()}[tag]
+				result = session._count_commits_since(session.head(), sha)  # type: ignore[arg-type]
+				return -1 if result is None else result
+
+	assert benchmark.pedantic(count, args=(git_history_5k, ), rounds=3) == expected
+
+
+def test_commits_since_release_cached(benchmark, git_history_5k: PathPlus):
+
+	def count(repo_path: PathPlus) -> Optional[int]:
+		with DulwichSession(repo_path) as session:
+			sha = {tag_name: sha for sha, tag_name in session.tags().items()}["v0.0.0"]
+			return session.commits_since(sha)
+
+	assert count(git_history_5k) == 4999
+	assert benchmark(count, git_history_5k) == 4999
+
+
+@pytest.mark.parametrize("mode", ["full", "streamed"])
+@backends
+def test_log_first_entry_5k_commits(benchmark, git_history_5k: PathPlus, backend: str, mode: str):
+	# The time until the first entry can be shown in the pager.
+
+	def first_entry(repo_path: PathPlus) -> str:
+		with open_session(repo_path, backend) as session:
+			if mode == "full":
+				return SessionLog(session).log(colour=False).split("\n\n", 1)[0]
+			else:
+				return next(SessionLog(session).iter_log(colour=False))
+
+	assert benchmark.pedantic(first_entry, args=(git_history_5k, ), rounds=3).startswith("commit: ")
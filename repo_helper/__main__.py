@@ -26,17 +26,12 @@ Entry point for running ``repo_helper`` from the command line.
 # stdlib
 import sys
 
-# 3rd party
-from consolekit.utils import import_commands
-
 # this package
-import repo_helper.cli.commands
 from repo_helper.cli import cli
 
 __all__ = ["main"]
 
-# Load commands
-import_commands(repo_helper.cli.commands, entry_point="repo_helper.command")
+# Commands are imported when they are used; see repo_helper.registry
 
 
 def main():  # noqa: D103,MAN002
@@ -39,13 +39,13 @@ Core CLI tools.
 # stdlib
 import sys
 from functools import partial
-from typing import Optional
+from typing import List, Optional
 
 # 3rd party
 import click
 from click import Context
 from consolekit import CONTEXT_SETTINGS, SuggestionGroup, click_group
-from consolekit.options import force_option
+from consolekit.options import auto_default_option, flag_option, force_option
 from domdf_python_tools.paths import PathPlus
 from southwark.click import commit_message_option, commit_option
 
@@ -53,16 +53,98 @@ from southwark.click import commit_message_option, commit_option
 from repo_helper import __version__
 from repo_helper.cli.utils import run_repo_helper
 
-__all__ = ["cli", "cli_command", "cli_group"]
+__all__ = ["LazyCommandGroup", "cli", "cli_command", "cli_group"]
+
+
+class LazyCommandGroup(SuggestionGroup):
+	"""
+	A :class:`~consolekit.commands.SuggestionGroup` which imports the module defining a command when it is first used.
+
+	The modules are looked up in the :mod:`registry <repo_helper.registry>`.
+
+	.. versionadded:: 2026.10.16
+	"""
+
+	def list_commands(self, ctx: click.Context) -> List[str]:  # noqa: D102
+
+		# this package
+		from repo_helper.registry import load_registry
+
+		return sorted({*self.commands, *load_registry().commands})
+
+	def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:  # noqa: D102
+
+		# this package
+		from repo_helper.registry import import_command, load_registry
+
+		if cmd_name not in self.commands:
+			if cmd_name in load_registry().commands:
+				import_command(cmd_name)
+			else:
+				# Import every command so the closest match can be suggested.
+				for name in load_registry().commands:
+					import_command(name)
+
+		return super().get_command(ctx, cmd_name)
+
+
+def _validate_git_backend(ctx: Context, param: click.Parameter, value: Optional[str]) -> Optional[str]:
+	if value is None:
+		return None
+
+	# this package
+	from repo_helper.git import git_backends
+
+	if value not in git_backends:
+		raise click.BadParameter(f"Choose from: {', '.join(git_backends)}", ctx=ctx, param=param)
+
+	return value
 
 
 @click.version_option(__version__)
-@click_group(invoke_without_command=True)
+@auto_default_option(
+		"-j",
+		"--jobs",
+		type=click.IntRange(min=1),
+		help="The number of files to update concurrently.",
+		show_default=True,
+		)
+@click_group(invoke_without_command=True, cls=LazyCommandGroup)
 @force_option(help_text="Run 'repo_helper' even when the git working directory is not clean.")
 @commit_option(default=None)
 @commit_message_option("Updated files with 'repo_helper'.")
+@flag_option(
+		"--incremental",
+		help="Only update files whose inputs have changed since the last incremental run.",
+		)
+@flag_option("--dry-run", help="Show the changes which would be made, without writing any files.")
+@click.option(
+		"--profile",
+		type=click.Path(dir_okay=False, writable=True),
+		default=None,
+		metavar="FILENAME",
+		help="Write a Chrome trace of the time taken to FILENAME, and print a summary.",
+		)
+@click.option(
+		"--git-backend",
+		type=click.STRING,
+		default=None,
+		metavar="BACKEND",
+		callback=_validate_git_backend,
+		help="The implementation of git to use: 'dulwich' or 'git'. Defaults to $REPO_HELPER_GIT_BACKEND, or 'dulwich'.",
+		)
 @click.pass_context
-def cli(ctx: Context, force: bool, commit: Optional[bool], message: str) -> None:
+def cli(
+		ctx: Context,
+		force: bool,
+		commit: Optional[bool],
+		message: str,
+		incremental: bool = False,
+		dry_run: bool = False,
+		profile: Optional[str] = None,
+		jobs: int = 1,
+		git_backend: Optional[str] = None,
+		) -> None:
 	"""
 	Update files in the given repositories, based on settings in 'repo_helper.yml'.
 	"""
@@ -71,9 +153,27 @@ def cli(ctx: Context, force: bool, commit: Optional[bool], message: str) -> None
 	ctx.obj["PATH"] = path
 	ctx.obj["commit"] = commit
 	ctx.obj["force"] = force
+	ctx.obj["jobs"] = jobs
+	ctx.obj["incremental"] = incremental
+	ctx.obj["profile"] = profile
+
+	# Read by repo_helper.git.open_session for this command and its subcommands.
+	ctx.obj["git_backend"] = git_backend
 
 	if ctx.invoked_subcommand is None:
-		sys.exit(run_repo_helper(path=path, force=force, initialise=False, commit=commit, message=message))
+		sys.exit(
+				run_repo_helper(
+						path=path,
+						force=force,
+						initialise=False,
+						commit=commit,
+						message=message,
+						jobs=jobs,
+						incremental=incremental,
+						dry_run=dry_run,
+						profile=profile,
+						),
+				)
 
 	else:
 		if message != "Updated files with 'repo_helper'.":
@@ -199,17 +199,12 @@ def version(version: str) -> int:
 	from domdf_python_tools.paths import PathPlus
 
 	# this package
-	from repo_helper.configuration import YamlEditor
+	from repo_helper.configuration import YamlEditor, migrate_config
 	from repo_helper.core import RepoHelper
 
 	rh = RepoHelper(PathPlus.cwd())
 	rh.load_settings()
-
-	yaml = YamlEditor()
-
-	data = yaml.load_file(rh.target_repo / "repo_helper.yml")
-	if not isinstance(data, dict):
-		return 1
+	migrate_config(rh.target_repo)
 
 	def sort_key(value: str) -> str:
 		if value.endswith("-dev"):
@@ -217,14 +212,13 @@ def version(version: str) -> int:
 		else:
 			return value
 
-	if "python_versions" in data:
-		data["python_versions"] = natsorted(map(str, {*data["python_versions"], *version}), key=sort_key)
-		yaml.dump_to_file(data, rh.target_repo / "repo_helper.yml", mode='w')
-	else:
-		yaml.dump_to_file(
-				{"python_versions": natsorted(version, key=sort_key)},
-				rh.target_repo / "repo_helper.yml",
-				mode='a',
-				)
+	try:
+		transaction = YamlEditor().edit(rh.target_repo / "repo_helper.yml")
+	except TypeError:
+		return 1
+
+	with transaction as config:
+		python_versions = map(str, {*config.get("python_versions", ()), *version})
+		config["python_versions"] = natsorted(python_versions, key=sort_key)
 
 	return 0
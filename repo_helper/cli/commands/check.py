@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+#
+#  check.py
+"""
+Check whether the files managed by ``repo_helper`` are up to date.
+
+.. versionadded:: 2026.10.16
+"""
+#
+#  Copyright © 2026 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+
+# stdlib
+import sys
+
+# 3rd party
+import click
+
+# this package
+from repo_helper.cli import cli_command
+
+__all__ = ["check"]
+
+
+@cli_command()
+def check() -> None:
+	"""
+	Check whether the files managed by 'repo_helper' are up to date.
+
+	Exits with code 1 and lists the stale files if they are not.
+	"""
+
+	# 3rd party
+	from domdf_python_tools.paths import PathPlus, traverse_to_file
+
+	# this package
+	from repo_helper.manifest import echo_stale_files, find_stale_files
+
+	repo_dir = traverse_to_file(PathPlus.cwd(), "repo_helper.yml", "git_helper.yml")
+	stale_files = find_stale_files(repo_dir)
+
+	if stale_files:
+		echo_stale_files(stale_files)
+		sys.exit(1)
+
+	click.echo("All files are up to date.")
@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+#
+#  config.py
+"""
+Edit ``repo_helper.yml``.
+
+.. versionadded:: 2026.10.16
+"""
+#
+#  Copyright © 2026 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+
+# stdlib
+import re
+from functools import partial
+from typing import Any, Iterable, Tuple
+
+# 3rd party
+import click
+from consolekit import CONTEXT_SETTINGS
+from consolekit.options import flag_option
+
+# this package
+from repo_helper.cli import cli_group
+
+__all__ = ["config", "config_command", "parse_edit", "set_"]
+
+_edit_re = re.compile(r"^([A-Za-z_][A-Za-z0-9_]*)(\+=|-=|=)(.*)$", flags=re.DOTALL)
+
+
+@cli_group(invoke_without_command=False)
+def config() -> None:
+	"""
+	Edit 'repo_helper.yml'.
+	"""
+
+
+config_command = partial(config.command, context_settings=CONTEXT_SETTINGS)
+
+
+def _parse_value(value: str) -> Any:
+	"""
+	Convert a value given on the command line to the value to store in ``repo_helper.yml``.
+
+	:param value:
+	"""
+
+	# 3rd party
+	from ruamel.yaml import YAML
+
+	if value in {"true", "True", "false", "False"}:
+		return value.lower() == "true"
+	elif value[:1] in {'[', '{', '"', "'"}:
+		# Scalars within the sequence or mapping are loaded as strings, so '3.10' isn't changed to 3.1.
+		return YAML(typ="base").load(value)
+	else:
+		return value
+
+
+def parse_edit(edit: str) -> Tuple[str, str, Any]:
+	"""
+	Parse an edit in the form ``KEY=VALUE``, ``KEY+=VALUE`` or ``KEY-=VALUE``.
+
+	:param edit:
+
+	:returns: The key, the operator, and the value.
+	"""
+
+	match = _edit_re.match(edit)
+	if match is None:
+		raise click.BadParameter(f"{edit!r} is not in the form KEY=VALUE, KEY+=VALUE or KEY-=VALUE.")
+
+	key, operator, value = match.groups()
+	return key, operator, _parse_value(value)
+
+
+def _as_list(value: Any) -> Iterable[Any]:
+	if isinstance(value, list):
+		return value
+	else:
+		return [value]
+
+
+@flag_option("--sort", help="Sort lists after adding values to them.")
+@click.option(
+		"-d",
+		"--delete",
+		type=click.STRING,
+		multiple=True,
+		metavar="KEY",
+		help="Remove KEY from the file. May be given multiple times.",
+		)
+@click.argument("edits", type=click.STRING, nargs=-1, metavar="EDITS...")
+@config_command(name="set")
+def set_(edits: Tuple[str, ...], delete: Tuple[str, ...] = (), sort: bool = False) -> None:
+	"""
+	Change several values in 'repo_helper.yml' at once.
+
+	Each edit takes one of the forms:
+
+	\b
+	KEY=VALUE   Set KEY to VALUE.
+	KEY+=VALUE  Add VALUE to the list KEY.
+	KEY-=VALUE  Remove VALUE from the list KEY.
+
+	VALUE is a string, 'true' or 'false',
+	or a YAML flow sequence or mapping such as '[3.8, 3.9]'.
+
+	The file is only written if the edited configuration is valid.
+	"""
+
+	# 3rd party
+	import jsonschema
+	from domdf_python_tools.paths import PathPlus, traverse_to_file
+
+	# this package
+	from repo_helper.configuration import YamlEditor, migrate_config, validate_config
+
+	parsed_edits = [parse_edit(edit) for edit in edits]
+
+	repo_dir = traverse_to_file(PathPlus.cwd(), "repo_helper.yml", "git_helper.yml")
+	migrate_config(repo_dir)
+
+	with YamlEditor().edit(repo_dir / "repo_helper.yml") as transaction:
+		for key, operator, value in parsed_edits:
+			if operator == '=':
+				transaction[key] = value
+			elif operator == "+=":
+				transaction.merge(key, _as_list(value), sort=sort)
+			elif key not in transaction:
+				raise click.ClickException(f"Cannot remove values from {key!r} as it is not set.")
+			else:
+				transaction.remove(key, _as_list(value))
+
+		for key in delete:
+			if key not in transaction:
+				raise click.ClickException(f"Cannot delete {key!r} as it is not set.")
+			del transaction[key]
+
+		try:
+			validate_config(transaction.data)
+		except jsonschema.ValidationError as e:
+			location = '.'.join(map(str, e.absolute_path))
+			raise click.ClickException(f"Invalid configuration{f' for {location!r}' if location else ''}: {e.message}")
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+#
+#  daemon.py
+"""
+Run a long-lived ``repo_helper`` process.
+
+.. versionadded:: 2026.10.16
+"""
+#
+#  Copyright © 2026 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+
+# stdlib
+import sys
+from functools import partial
+from typing import Optional
+
+# 3rd party
+import click
+from consolekit import CONTEXT_SETTINGS
+from consolekit.options import auto_default_option
+
+# this package
+from repo_helper.cli import cli_group
+
+__all__ = ["daemon", "start", "stop"]
+
+socket_option = partial(
+		click.option,
+		"--socket",
+		"socket_path",
+		type=click.Path(dir_okay=False),
+		default=None,
+		help="The path of the socket. Defaults to $REPO_HELPER_DAEMON_SOCKET, or a file in $XDG_RUNTIME_DIR or the cache directory.",
+		)
+
+
+@cli_group(invoke_without_command=False)
+def daemon() -> None:
+	"""
+	Run a long-lived process which keeps repo_helper loaded.
+
+	Commands are sent to the daemon with 'python -m repo_helper.daemon {run,check,show} [ARGS]...'.
+	"""
+
+
+daemon_command = partial(daemon.command, context_settings=CONTEXT_SETTINGS)
+
+
+@auto_default_option(
+		"--idle-timeout",
+		type=click.FloatRange(min=0),
+		help="Stop after this many seconds without a request.",
+		show_default=True,
+		)
+@socket_option()
+@daemon_command()
+def start(socket_path: Optional[str] = None, idle_timeout: float = 3600) -> None:
+	"""
+	Start the daemon in the foreground.
+	"""
+
+	# this package
+	from repo_helper.daemon import DaemonServer, default_socket_path
+
+	socket_path = socket_path or default_socket_path()
+
+	try:
+		server = DaemonServer(socket_path, idle_timeout=idle_timeout)
+	except OSError as e:
+		raise click.ClickException(str(e))
+
+	click.echo(f"Listening on {socket_path}", err=True)
+	server.serve()
+
+
+@socket_option()
+@daemon_command()
+def stop(socket_path: Optional[str] = None) -> None:
+	"""
+	Stop the daemon.
+	"""
+
+	# this package
+	from repo_helper.daemon import send_request
+
+	if send_request({"command": "stop"}, socket_path) is None:
+		click.echo("The daemon is not running.", err=True)
+		sys.exit(1)
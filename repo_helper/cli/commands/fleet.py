@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+#
+#  fleet.py
+"""
+Run ``repo_helper`` for many repositories at once.
+
+.. versionadded:: 2026.10.16
+"""
+#
+#  Copyright © 2026 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+
+# stdlib
+import sys
+from typing import Optional, Sequence
+
+# 3rd party
+import click
+from consolekit.options import auto_default_option, flag_option
+
+# this package
+from repo_helper.cli import cli_command
+
+__all__ = ["fleet"]
+
+
+@flag_option("--json", "as_json", help="Print the report as JSON.")
+@flag_option("--dry-run", help="Show which repositories would change, without writing any files.")
+@auto_default_option(
+		"--max-tasks-per-child",
+		type=click.IntRange(min=1),
+		help="The number of repositories each worker process handles before it is replaced.",
+		show_default=True,
+		)
+@click.option(
+		"-p",
+		"--processes",
+		type=click.IntRange(min=1),
+		default=None,
+		help="The number of worker processes. Defaults to the number of CPUs.",
+		)
+@click.argument("paths", nargs=-1, required=True)
+@cli_command()
+def fleet(
+		paths: Sequence[str],
+		processes: Optional[int] = None,
+		max_tasks_per_child: int = 50,
+		dry_run: bool = False,
+		as_json: bool = False,
+		) -> None:
+	"""
+	Update files in many repositories.
+
+	PATHS may be paths to repositories or glob patterns matching them.
+	Files are not committed.
+	"""
+
+	# stdlib
+	import json
+	import time
+
+	# 3rd party
+	from consolekit.terminal_colours import Fore, resolve_color_default
+
+	# this package
+	from repo_helper.fleet import expand_paths, run_fleet, summarise
+
+	repos = expand_paths(paths)
+	if not repos:
+		raise click.UsageError("No repositories with a 'repo_helper.yml' file were found.")
+
+	start = time.perf_counter()
+	results = []
+	colours = {"changed": Fore.YELLOW, "unchanged": Fore.GREEN, "failed": Fore.RED}
+
+	for result in run_fleet(repos, processes=processes, dry_run=dry_run, max_tasks_per_child=max_tasks_per_child):
+		results.append(result)
+
+		if not as_json:
+			line = f"{result.status:<9} {result.path} ({result.duration:.2f}s)"
+			click.echo(colours[result.status](line), color=resolve_color_default())
+
+			for filename in result.changed_files:
+				click.echo(f"  {filename}")
+			if result.error:
+				click.echo(f"  {result.error}")
+
+	report = summarise(results, time.perf_counter() - start)
+
+	if as_json:
+		click.echo(json.dumps(report, indent=2))
+	else:
+		summary = report["summary"]
+		click.echo(
+				f"\n{summary['changed']} changed, {summary['unchanged']} unchanged, "
+				f"{summary['failed']} failed in {summary['duration']:.2f}s",
+				)
+
+	sys.exit(1 if report["summary"]["failed"] else 0)
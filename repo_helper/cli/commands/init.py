@@ -32,7 +32,6 @@ from typing import List, Sequence
 
 # 3rd party
 import click
-import jinja2
 from consolekit.options import force_option
 from domdf_python_tools.paths import PathPlus, maybe_make
 from domdf_python_tools.stringlist import StringList
@@ -41,7 +40,7 @@ from southwark.click import commit_message_option, commit_option
 # this package
 from repo_helper.cli import cli_command
 from repo_helper.cli.utils import run_repo_helper
-from repo_helper.templates import Environment, init_repo_template_dir
+from repo_helper.templates import Environment, init_repo_template_dir, template_environment
 from repo_helper.utils import get_license_text, license_lookup
 
 __all__ = ["init", "init_repo"]
@@ -68,6 +67,9 @@ def init(ctx: click.Context, force: bool, commit: bool, message: str) -> None:
 			initialise=True,
 			commit=commit,
 			message=message,
+			jobs=ctx.obj["jobs"],
+			incremental=ctx.obj["incremental"],
+			profile=ctx.obj["profile"],
 			)
 
 	sys.exit(ret)
@@ -96,10 +98,7 @@ def init_repo(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	repo_path = PathPlus(repo_path)
 	templates.globals["len"] = len
 
-	init_repo_templates = Environment(  # nosec: B701
-		loader=jinja2.FileSystemLoader(str(init_repo_template_dir)),
-		undefined=jinja2.StrictUndefined,
-	)
+	init_repo_templates = template_environment(init_repo_template_dir)
 	init_repo_templates.globals.update(templates.globals)
 
 	# package
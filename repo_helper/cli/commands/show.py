@@ -50,42 +50,50 @@ def show() -> None:
 show_command = partial(show.command, context_settings=CONTEXT_SETTINGS)
 
 
+@flag_option("--json", "as_json", help="Print the version and the number of commits since that release as JSON.")
 @flag_option("-q", "--quiet", help="Print only the version number.")
 @show_command()
-def version(quiet: bool = False) -> None:
+def version(quiet: bool = False, as_json: bool = False) -> None:
 	"""
 	Show the repository version.
 	"""
 
+	# stdlib
+	import json
+
 	# 3rd party
 	from domdf_python_tools.paths import PathPlus
-	from southwark import get_tags
-	from southwark.repo import Repo
 
 	# this package
 	from repo_helper.core import RepoHelper
+	from repo_helper.git import open_session
 
 	rh = RepoHelper(PathPlus.cwd())
 	rh.load_settings(allow_unknown_keys=True)
 	version = rh.templates.globals["version"]
 
-	if quiet:
+	if quiet and not as_json:
 		click.echo(f"v{version}")
+		return
 
-	else:
+	if not as_json:
 		click.echo(f"Current version: v{version}")
 
-		repo = Repo(rh.target_repo)
-		for sha, tag in get_tags(repo).items():
-			if tag == f"v{version}":
-				walker = repo.get_walker()
-				for idx, entry in enumerate(walker):
-					commit_id = entry.commit.id.decode("UTF-8")
-					if commit_id == sha:
-						click.echo(f"{idx} commit{'s' if idx > 1 else ''} since that release.")
-						break
+	tag: Optional[str] = None
+	commits_since: Optional[int] = None
+
+	with open_session(rh.target_repo) as session:
+		for sha, tag_name in session.tags().items():
+			if tag_name == f"v{version}":
+				tag = tag_name
+				commits_since = session.commits_since(sha)
 				break
 
+	if as_json:
+		click.echo(json.dumps({"version": version, "tag": tag, "commits_since_release": commits_since}))
+	elif commits_since is not None:
+		click.echo(f"{commits_since} commit{'s' if commits_since > 1 else ''} since that release.")
+
 
 @auto_default_option(
 		"-n",
@@ -117,19 +125,24 @@ def log(
 
 	# 3rd party
 	from consolekit.terminal_colours import resolve_color_default
-	from consolekit.utils import abort, long_echo
+	from consolekit.utils import abort
 	from domdf_python_tools.paths import PathPlus
-	from southwark.log import Log
-	from southwark.repo import Repo
 
-	repo = Repo(PathPlus.cwd())
+	# this package
+	from repo_helper.git import SessionLog, open_session
 
-	try:
-		commit_log = Log(repo).log(max_entries=entries, reverse=reverse, from_date=from_date, from_tag=from_tag)
-	except ValueError as e:
-		raise abort(f"ERROR: {e}")
+	with open_session(PathPlus.cwd()) as session:
+		try:
+			commit_log = SessionLog(session).iter_log(
+					max_entries=entries,
+					reverse=reverse,
+					from_date=from_date,
+					from_tag=from_tag,
+					)
+		except ValueError as e:
+			raise abort(f"ERROR: {e}")
 
-	long_echo(commit_log, use_pager=not no_pager, colour=resolve_color_default(colour))
+		_echo_log(commit_log, use_pager=not no_pager, colour=resolve_color_default(colour))
 
 	return 0
 
@@ -157,28 +170,50 @@ def changelog(
 
 	# 3rd party
 	from consolekit.terminal_colours import resolve_color_default
-	from consolekit.utils import abort, long_echo
+	from consolekit.utils import abort
 	from domdf_python_tools.paths import PathPlus
-	from southwark.log import Log
-	from southwark.repo import Repo
 
 	# this package
 	from repo_helper.core import RepoHelper
+	from repo_helper.git import SessionLog, open_session
 
 	rh = RepoHelper(PathPlus.cwd())
 	rh.load_settings(allow_unknown_keys=True)
-	repo = Repo(rh.target_repo)
-
-	try:
-		commit_log = Log(repo).log(
-				max_entries=entries,
-				reverse=reverse,
-				from_tag=f"v{rh.templates.globals['version']}",
-				)
-	except ValueError as e:
-		raise abort(f"ERROR: {e}")
-
-	long_echo(commit_log, use_pager=not no_pager, colour=resolve_color_default(colour))
+
+	with open_session(rh.target_repo) as session:
+		try:
+			commit_log = SessionLog(session).iter_log(
+					max_entries=entries,
+					reverse=reverse,
+					from_tag=f"v{rh.templates.globals['version']}",
+					)
+		except ValueError as e:
+			raise abort(f"ERROR: {e}")
+
+		_echo_log(commit_log, use_pager=not no_pager, colour=resolve_color_default(colour))
+
+
+def _echo_log(entries: Iterable[str], use_pager: bool, colour: Optional[bool]) -> None:
+	"""
+	Echo the commit log entries to the terminal, optionally via a pager, as each entry is formatted.
+
+	:param entries:
+	:param use_pager: Whether to use the pager.
+	:param colour: Whether to use coloured output.
+	"""
+
+	def lines() -> Iterator[str]:
+		# The same output as joining the entries with newlines.
+		for idx, entry in enumerate(entries):
+			yield f"\n{entry}" if idx else entry
+
+	if use_pager:
+		# The pager reads the entries as they are needed, and adds the trailing newline.
+		click.echo_via_pager(lines(), color=colour)
+	else:
+		for line in lines():
+			click.echo(line, nl=False, color=colour)
+		click.echo(color=colour)
 
 
 @no_pager_option()
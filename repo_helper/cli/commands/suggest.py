@@ -183,8 +183,9 @@ def classifiers(  # noqa: PRM002
 	if add:
 
 		# this package
-		from repo_helper.configuration import YamlEditor
+		from repo_helper.configuration import YamlEditor, migrate_config
 
+		migrate_config(rh.target_repo)
 		yaml = YamlEditor()
 		yaml.update_key(rh.target_repo / "repo_helper.yml", "classifiers", suggested_classifiers, sort=True)
 
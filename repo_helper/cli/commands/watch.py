@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+#
+#  watch.py
+"""
+Regenerate files as their inputs change.
+
+.. versionadded:: 2026.10.16
+"""
+#
+#  Copyright © 2026 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+
+# stdlib
+from typing import TYPE_CHECKING, List
+
+# 3rd party
+import click
+from consolekit.options import auto_default_option, flag_option
+
+# this package
+from repo_helper.cli import cli_command
+
+if TYPE_CHECKING:
+	# this package
+	from repo_helper.vfs import FileChange
+
+__all__ = ["watch"]
+
+
+@flag_option("--poll", help="Poll for changes instead of using inotify.")
+@auto_default_option(
+		"--debounce",
+		type=click.FloatRange(min=0),
+		help="Wait until there have been no changes for this many seconds before regenerating files.",
+		show_default=True,
+		)
+@cli_command()
+@click.pass_context
+def watch(ctx: click.Context, debounce: float = 0.2, poll: bool = False) -> None:
+	"""
+	Regenerate files whenever 'repo_helper.yml' or the files it refers to change.
+
+	Only the files whose inputs changed are regenerated.
+	Changes are not staged or committed. Press Ctrl+C to stop.
+	"""
+
+	# 3rd party
+	from domdf_python_tools.paths import PathPlus, traverse_to_file
+
+	# this package
+	from repo_helper.watch import watch as watch_repository
+
+	repo_dir = traverse_to_file(PathPlus.cwd(), "repo_helper.yml", "git_helper.yml")
+
+	def on_run(changes: List["FileChange"]) -> None:
+		for change in changes:
+			click.echo(f"Updated {change.filename}")
+		click.echo("Watching for changes...", err=True)
+
+	def on_error(error: Exception) -> None:
+		click.echo(f"Error: {error}", err=True)
+		click.echo("Watching for changes...", err=True)
+
+	try:
+		watch_repository(
+				repo_dir,
+				jobs=ctx.obj.get("jobs", 1),
+				debounce=debounce,
+				poll=poll,
+				on_run=on_run,
+				on_error=on_error,
+				)
+	except KeyboardInterrupt:
+		click.echo("Stopped watching.", err=True)
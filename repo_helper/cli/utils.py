@@ -25,22 +25,23 @@ CLI utility functions.
 
 # stdlib
 import logging
-import os
 import platform
 import textwrap
 from contextlib import suppress
-from typing import Iterable, Optional
+from typing import TYPE_CHECKING, Iterable, Optional
 
 # 3rd party
 import click
 from consolekit.input import confirm
 from consolekit.terminal_colours import Fore
 from consolekit.utils import abort
-from domdf_python_tools.paths import PathPlus, in_directory
+from domdf_python_tools.paths import PathPlus
 from domdf_python_tools.typing import PathLike
 from dulwich.errors import CommitError
-from southwark import assert_clean
-from southwark.repo import Repo
+
+if TYPE_CHECKING:
+	# this package
+	from repo_helper.git import GitSession
 
 __all__ = [
 		"commit_changed_files",
@@ -63,6 +64,7 @@ def commit_changed_files(
 		commit: Optional[bool] = None,
 		message: bytes = b"Updated files with 'repo_helper'.",
 		enable_pre_commit: bool = True,
+		session: Optional["GitSession"] = None,
 		) -> bool:
 	"""
 	Stage and commit any files that have been updated, added or removed.
@@ -73,24 +75,38 @@ def commit_changed_files(
 		:py:obj:`None` (default) indicates the user should be asked.
 	:param message: The commit message to use. Default ``"Updated files with 'repo_helper'."``
 	:param enable_pre_commit: Whether to install and configure pre-commit. Default :py:obj`True`.
+	:param session: An open :class:`~repo_helper.git.GitSession` for the repository.
+		If not given the repository is opened for this function, with the backend from :func:`repo_helper.git.open_session`.
 
 	:returns: :py:obj:`True` if the changes were committed. :py:obj:`False` otherwise.
-	"""
 
-	# this package
-	from repo_helper.utils import commit_changes, sort_paths, stage_changes
+	.. versionchanged:: 2026.10.16
 
-	repo_path = PathPlus(repo_path).absolute()
-	r = Repo(str(repo_path))
+		Added the ``session`` argument.
+		The pre-commit hook is only installed if it isn't already.
+	"""
 
-	staged_files = stage_changes(r.path, managed_files)
+	# this package
+	from repo_helper.git import open_session
+	from repo_helper.utils import sort_paths
+
+	if session is None:
+		with open_session(PathPlus(repo_path).absolute()) as session:
+			return commit_changed_files(
+					repo_path=repo_path,
+					managed_files=managed_files,
+					commit=commit,
+					message=message,
+					enable_pre_commit=enable_pre_commit,
+					session=session,
+					)
+
+	staged_files = session.stage_changes(managed_files)
 
 	# Ensure pre-commit hooks are installed
 	if enable_pre_commit and platform.system() == "Linux":
-		with in_directory(repo_path), suppress(ImportError):
-			# 3rd party
-			import pre_commit.main  # type: ignore[import-untyped]
-			pre_commit.main.main(["install"])
+		with suppress(ImportError):
+			session.install_pre_commit()
 
 	if staged_files:
 		click.echo("\nThe following files will be committed:")
@@ -104,12 +120,8 @@ def commit_changed_files(
 			commit = confirm("Commit?", default=True)
 
 		if commit:
-			if enable_pre_commit or "pre-commit" in r.hooks:
-				# Ensure the working directory for pre-commit is correct
-				r.hooks["pre-commit"].cwd = str(repo_path.absolute())  # type: ignore[attr-defined]
-
 			try:
-				commit_id = commit_changes(r, message.decode("UTF-8"))
+				commit_id = session.commit(message.decode("UTF-8"))
 				click.echo(f"Committed as {commit_id}")
 				return True
 
@@ -130,6 +142,10 @@ def run_repo_helper(
 		commit: Optional[bool],
 		message: str,
 		enable_pre_commit: bool = True,
+		jobs: int = 1,
+		incremental: bool = False,
+		dry_run: bool = False,
+		profile: Optional[PathLike] = None,
 		) -> int:
 	"""
 	Run repo_helper.
@@ -140,12 +156,43 @@ def run_repo_helper(
 	:param commit: Whether to commit unchanged files.
 	:param message: The commit message.
 	:param enable_pre_commit: Whether to install and configure pre-commit. Default :py:obj`True`.
+	:param jobs: The number of files to update concurrently.
+	:param incremental: Whether to skip files whose inputs have not changed since the last incremental run.
+	:param dry_run: Show the changes which would be made as a unified diff, without writing any files.
+	:param profile: If given, write a Chrome trace of the run to this file and print a summary of the time taken.
+
+	.. versionchanged:: 2026.10.16  Added the ``jobs``, ``incremental``, ``dry_run`` and ``profile`` arguments.
 	"""
 
+	if profile is not None:
+		# this package
+		from repo_helper.profiling import Profiler
+
+		profiler = Profiler()
+
+		try:
+			with profiler:
+				return run_repo_helper(
+						path=path,
+						force=force,
+						initialise=initialise,
+						commit=commit,
+						message=message,
+						enable_pre_commit=enable_pre_commit,
+						jobs=jobs,
+						incremental=incremental,
+						dry_run=dry_run,
+						)
+		finally:
+			profiler.dump_chrome_trace(profile)
+			click.echo(f"\n{profiler.summary()}", err=True)
+
 	# this package
 	from repo_helper.cli.commands.init import init_repo
 	from repo_helper.core import RepoHelper
+	from repo_helper.git import open_session
 	from repo_helper.utils import easter_egg
+	from repo_helper.vfs import unified_diff
 
 	try:
 		rh = RepoHelper(path)
@@ -154,32 +201,38 @@ def run_repo_helper(
 		error_block = textwrap.indent(str(e), '\t')
 		raise abort(f"Unable to run 'repo_helper'.\nThe error was:\n{error_block}")
 
-	if not assert_clean(rh.target_repo, allow_config=("repo_helper.yml", "git_helper.yml")):
-		if force:
-			click.echo(Fore.RED("Proceeding anyway"), err=True)
-		else:
+	if dry_run:
+		rh.run(jobs=jobs, incremental=incremental, dry_run=True)
+		click.echo(unified_diff(rh.changes, coloured=True), nl=False)
+		return 0
+
+	# The repository is opened once, and its index and status reused.
+	with open_session(rh.target_repo) as session:
+		if not session.assert_clean(allow_config=("repo_helper.yml", "git_helper.yml")):
+			if force:
+				click.echo(Fore.RED("Proceeding anyway"), err=True)
+			else:
+				return 1
+
+		if initialise:
+			session.stage(init_repo(rh.target_repo, rh.templates))
+
+		managed_files = rh.run(jobs=jobs, incremental=incremental)
+
+		try:
+			commit_changed_files(
+					repo_path=rh.target_repo,
+					managed_files=managed_files,
+					commit=commit,
+					message=message.encode("UTF-8"),
+					enable_pre_commit=enable_pre_commit,
+					session=session,
+					)
+		except CommitError as e:
+			indented_error = '\n'.join(f"\t{line}" for line in textwrap.wrap(str(e)))
+			click.echo(f"Unable to commit changes. The error was:\n\n{indented_error}", err=True)
 			return 1
 
-	if initialise:
-		r = Repo(rh.target_repo)
-		for filename in init_repo(rh.target_repo, rh.templates):
-			r.stage(os.path.normpath(filename))
-
-	managed_files = rh.run()
-
-	try:
-		commit_changed_files(
-				repo_path=rh.target_repo,
-				managed_files=managed_files,
-				commit=commit,
-				message=message.encode("UTF-8"),
-				enable_pre_commit=enable_pre_commit,
-				)
-	except CommitError as e:
-		indented_error = '\n'.join(f"\t{line}" for line in textwrap.wrap(str(e)))
-		click.echo(f"Unable to commit changes. The error was:\n\n{indented_error}", err=True)
-		return 1
-
 	easter_egg()
 
 	return 0
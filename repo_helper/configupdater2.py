@@ -40,6 +40,10 @@ lines that were parsed will be used to express the block. In case a block,
 e.g. an option, was changed, it is marked as `updated` and its values will
 be transformed into a corresponding string during an update of a
 configuration file.
+
+Parsed blocks refer to a span of the text of the file rather than holding copies
+of their lines, and sections and the updater itself cache their serialised text
+until something inside them changes.
 """
 
 # stdlib
@@ -118,12 +122,73 @@ class Container(ABC, Generic[_T]):
 	Abstract Mixin Class.
 	"""
 
+	__slots__ = ()
+
 	_structure: List[_T]
 
+	#: Maps the name of each named block to its position in ``_structure``.
+	#: Built on first use, and discarded whenever blocks are inserted, removed or renamed.
+	_index: Optional[Dict[str, int]]
+
 	def __init__(self, **kwargs):
 		self._structure = list()
+		self._index = None
 		super().__init__()
 
+	def _block_name(self, block: _T) -> Optional[str]:
+		"""
+		Returns the name ``block`` is looked up by, or :py:obj:`None` if it is not a named block.
+
+		:param block:
+		"""
+
+		return None
+
+	def _get_index(self) -> Dict[str, int]:
+		if self._index is None:
+			index: Dict[str, int] = {}
+			for idx, block in enumerate(self._structure):
+				name = self._block_name(block)
+				if name is not None:
+					# The first block with a given name wins, as with a linear search.
+					index.setdefault(name, idx)
+			self._index = index
+
+		return self._index
+
+	def _invalidate_index(self) -> None:
+		self._index = None
+		self._touch()
+
+	def _touch(self) -> None:
+		"""
+		Called when the container, or a block within it, is changed.
+		"""
+
+	def _append_block(self, block: _T) -> None:
+		self._structure.append(block)
+		self._touch()
+
+		if self._index is not None:
+			name = self._block_name(block)
+			if name is not None:
+				self._index.setdefault(name, len(self._structure) - 1)
+
+	def _add_span(self, block_type: Type["Block"], source: str, start: int, end: int) -> None:
+		"""
+		Add ``source[start:end]`` to the last block if it is a ``block_type``, or else to a new one.
+
+		Used during initial parsing.
+		"""
+
+		last_item = self.last_item
+		if isinstance(last_item, block_type) and last_item._source is source and last_item._end == start:
+			last_item._extend_span(start, end)
+		else:
+			block = block_type(container=self)
+			block._set_span(source, start, end)
+			self._append_block(block)  # type: ignore[arg-type]
+
 	@property
 	def structure(self) -> List[_T]:
 		return self._structure
@@ -144,14 +209,69 @@ class Block(ABC):
 	a reference to a container wherein the object resides.
 	"""
 
+	__slots__ = ("_container", "_source", "_start", "_end", "_lines", "_updated")
+
 	def __init__(self, container: Union[Container, List["Block"], None], **kwargs):
 		self._container = container
-		self.lines: List[str] = []
+
+		# Parsed blocks are ``_source[_start:_end]``; other blocks hold their own ``_lines``.
+		self._source: Optional[str] = None
+		self._start = self._end = 0
+		self._lines: List[str] = []
+
 		self._updated: bool = False
 		super().__init__()
 
+	def _set_span(self, source: str, start: int, end: int) -> None:
+		self._source = source
+		self._start = start
+		self._end = end
+		self._lines = []
+
+	def _extend_span(self, start: int, end: int) -> None:
+		"""
+		Add the line ``source[start:end]``, which immediately follows the block, during initial parsing.
+
+		The containers are not told, as their caches are reset once parsing has finished.
+		"""
+
+		self._end = end
+
+	def _has_lines(self) -> bool:
+		return self._source is not None or bool(self._lines)
+
+	def _changed(self) -> None:
+		# Comments and spaces added by older code may have a list as their container.
+		if self._container is not None and not isinstance(self._container, list):
+			self._container._touch()
+
+	@property
+	def lines(self) -> List[str]:
+		"""
+		The lines which make up the block.
+		"""
+
+		if self._source is None:
+			return self._lines
+
+		lines = self._source[self._start:self._end].split('\n')
+		last_line = lines.pop()
+		lines = [f"{line}\n" for line in lines]
+		if last_line:
+			lines.append(last_line)
+		return lines
+
+	@lines.setter
+	def lines(self, lines: List[str]) -> None:
+		self._source = None
+		self._lines = lines
+		self._changed()
+
 	def __str__(self) -> str:
-		return ''.join(self.lines)
+		if self._source is None:
+			return ''.join(self._lines)
+		else:
+			return self._source[self._start:self._end]
 
 	def __len__(self) -> int:
 		return len(self.lines)
@@ -169,7 +289,12 @@ class Block(ABC):
 		:param line: one line to add.
 		"""
 
-		self.lines.append(line)
+		if self._source is not None:
+			self._lines = self.lines
+			self._source = None
+
+		self._lines.append(line)
+		self._changed()
 		return self
 
 	@property
@@ -220,6 +345,7 @@ class BlockBuilder:
 			text = f"{text}\n"
 		comment.add_line(text)
 		self._container.structure.insert(self._idx, comment)
+		self._container._invalidate_index()
 		self._idx += 1
 		return self
 
@@ -241,10 +367,12 @@ class BlockBuilder:
 		elif not isinstance(section, Section):
 			raise ValueError("Parameter must be a string or Section type!")
 
-		if section.name in [block.name for block in self._container if isinstance(block, Section)]:
+		if section.name in self._container:
 			raise DuplicateSectionError(section.name)
 
+		section._container = self._container
 		self._container.structure.insert(self._idx, section)
+		self._container._invalidate_index()
 		self._idx += 1
 		return self
 
@@ -263,6 +391,7 @@ class BlockBuilder:
 			space.add_line('\n')
 
 		self._container.structure.insert(self._idx, space)
+		self._container._invalidate_index()
 		self._idx += 1
 		return self
 
@@ -293,6 +422,8 @@ class Comment(Block):
 	Comment block.
 	"""
 
+	__slots__ = ()
+
 	def __init__(self, container: Union[Container, List[Block], None] = None):
 		super().__init__(container=container)
 
@@ -305,6 +436,8 @@ class Space(Block):
 	Vertical space block of new lines.
 	"""
 
+	__slots__ = ()
+
 	def __init__(self, container: Union[Container, List["Block"], None] = None):
 		super().__init__(container=container)
 
@@ -319,14 +452,27 @@ class Section(Block, Container, MutableMapping):
 	:param name: name of the section.
 	"""
 
+	__slots__ = ("_name", "_structure", "_index", "_cache", "_pristine")
+
 	def __init__(self, name: str, container: Union[Container, List["Block"], None], **kwargs):
 		self._name: str = name
 		self._structure: List[Block] = []
 
+		# The serialised section, until it is changed.
+		self._cache: Optional[str] = None
+
+		# Whether the section and its blocks are an unchanged, contiguous span of the file.
+		self._pristine = False
+
 		# indicates name change or a new section.
 		self._updated = False
 		super().__init__(container=container, **kwargs)
 
+	def _touch(self) -> None:
+		self._cache = None
+		self._pristine = False
+		self._changed()
+
 	def add_option(self, entry: "Option") -> "Section":
 		"""
 		Add an Option object to the section.
@@ -336,7 +482,7 @@ class Section(Block, Container, MutableMapping):
 		:param entry: key value pair as Option object.
 		"""
 
-		self._structure.append(entry)
+		self._append_block(entry)
 		return self
 
 	def add_comment(self, line: str) -> "Section":
@@ -349,8 +495,7 @@ class Section(Block, Container, MutableMapping):
 		"""
 
 		if not isinstance(self.last_item, Comment):
-			comment = Comment(self._structure)
-			self._structure.append(comment)
+			self._append_block(Comment(self))
 
 		assert isinstance(self.last_item, Block)
 		self.last_item.add_line(line)
@@ -366,40 +511,65 @@ class Section(Block, Container, MutableMapping):
 		"""
 
 		if not isinstance(self.last_item, Space):
-			space = Space(self._structure)
-			self._structure.append(space)
+			self._append_block(Space(self))
 
 		assert isinstance(self.last_item, Block)
 		self.last_item.add_line(line)
 		return self
 
+	def _block_name(self, block: Block) -> Optional[str]:
+		return block.key if isinstance(block, Option) else None
+
 	def _get_option_idx(self, key: str) -> int:
-		idx = [i for i, entry in enumerate(self._structure) if isinstance(entry, Option) and entry.key == key]
-		if idx:
-			return idx[0]
-		else:
-			raise ValueError
+		try:
+			return self._get_index()[key]
+		except (KeyError, TypeError):
+			raise ValueError from None
+
+	def _is_contiguous(self) -> bool:
+		"""
+		Returns whether the section's blocks follow each other in the same source, starting with the header.
+		"""
+
+		end = self._end
+		for entry in self._structure:
+			if entry._source is not self._source or entry._start != end:
+				return False
+			end = entry._end
+
+		return self._source is not None
 
 	def __str__(self) -> str:
-		if not self.updated:
-			s = super().__str__()
+		if self._cache is not None:
+			return self._cache
+
+		if self._pristine:
+			end = self._structure[-1]._end if self._structure else self._end
+			s = self._source[self._start:end]  # type: ignore[index]
 		else:
-			s = f"[{self._name}]\n"
-		for entry in self._structure:
-			s += str(entry)
+			if not self.updated:
+				parts = [super().__str__()]
+			else:
+				parts = [f"[{self._name}]\n"]
+			parts.extend(str(entry) for entry in self._structure)
+			s = ''.join(parts)
 
-		if s.splitlines()[-1].strip():
+		# Only the final line needs splitting to see if it is blank.
+		last_line = s[s.rfind('\n', 0, len(s) - 1) + 1:]
+		if last_line.splitlines()[-1].strip():
 			s += '\n'
 
+		self._cache = s
 		return s
 
 	def __repr__(self) -> str:
 		return f"<Section: {self.name}>"
 
 	def __getitem__(self, key: str):  # noqa: MAN002
-		if key not in self.options():
-			raise KeyError(key)
-		return self._structure[self._get_option_idx(key=key)]
+		try:
+			return self._structure[self._get_option_idx(key=key)]
+		except ValueError:
+			raise KeyError(key) from None
 
 	def __setitem__(self, key: str, value: Any) -> None:
 		str_value = convert_to_string(value, key)
@@ -410,16 +580,21 @@ class Section(Block, Container, MutableMapping):
 		else:
 			option = Option(key, value, container=self)
 			option.value = str_value
-			self._structure.append(option)
+			self._append_block(option)
 
 	def __delitem__(self, key: str) -> None:
-		if key not in self.options():
-			raise KeyError(key)
-		idx = self._get_option_idx(key=key)
+		try:
+			idx = self._get_option_idx(key=key)
+		except ValueError:
+			raise KeyError(key) from None
 		del self._structure[idx]
+		self._invalidate_index()
 
 	def __contains__(self, key) -> bool:  # noqa: MAN001
-		return key in self.options()
+		try:
+			return key in self._get_index()
+		except TypeError:  # unhashable
+			return False
 
 	def __len__(self) -> int:
 		return len(self._structure)
@@ -469,7 +644,7 @@ class Section(Block, Container, MutableMapping):
 		"""
 
 		# if no lines were added, treat it as updated since we added it
-		return self._updated or not self.lines
+		return self._updated or not self._has_lines()
 
 	@property
 	def name(self) -> str:
@@ -479,6 +654,9 @@ class Section(Block, Container, MutableMapping):
 	def name(self, value: str) -> None:
 		self._name = str(value)
 		self._updated = True
+		self._touch()
+		if isinstance(self._container, Container):
+			self._container._invalidate_index()
 
 	# def set(self, option: str, value: Optional[str] = None) -> "Section":  # noqa: A003  # pylint: disable=redefined-builtin
 	# 	"""
@@ -519,6 +697,17 @@ class Option(Block):
 	:param line:
 	"""
 
+	__slots__ = (
+			"_key",
+			"_values",
+			"_value_is_none",
+			"_delimiter",
+			"_value",
+			"_multiline_value_joined",
+			"_space_around_delimiters",
+			"_pending_values",
+			)
+
 	def __init__(
 			self,
 			key: str,
@@ -537,10 +726,27 @@ class Option(Block):
 		self._updated: bool = False  # indicates name change or a new section
 		self._multiline_value_joined: bool = False
 		self._space_around_delimiters = space_around_delimiters
+
+		# Whether the values on continuation lines are still only in the span.
+		self._pending_values = False
+
 		if line:
-			self.lines.append(line)
+			self._lines.append(line)
+
+	def _set_span(self, source: str, start: int, end: int) -> None:
+		super()._set_span(source, start, end)
+		self._pending_values = True
+
+	def _all_values(self) -> List[Optional[str]]:
+		if not self._pending_values:
+			return self._values
+
+		# The continuation lines of a parsed option are only split out when needed.
+		return [*self._values, *(line.strip() for line in self.lines[1:])]
 
 	def add_line(self, line: str) -> "Option":
+		self._values = self._all_values()
+		self._pending_values = False
 		super().add_line(line)
 		self._values.append(line.strip())
 		return self
@@ -548,7 +754,8 @@ class Option(Block):
 	def _join_multiline_value(self) -> None:
 		if not self._multiline_value_joined and not self._value_is_none:
 			# do what `_join_multiline_value` in ConfigParser would do
-			self._value = '\n'.join(x for x in self._values if x and not x.lstrip()[0] in ";#").rstrip()
+			values = self._all_values()
+			self._value = '\n'.join(x for x in values if x and not x.lstrip()[0] in ";#").rstrip()  # type: ignore[union-attr]
 			self._multiline_value_joined = True
 
 	def __str__(self) -> str:
@@ -574,7 +781,7 @@ class Option(Block):
 		"""
 
 		# if no lines were added, treat it as updated since we added it
-		return self._updated or not self.lines
+		return self._updated or not self._has_lines()
 
 	@property
 	def key(self) -> str:
@@ -585,6 +792,8 @@ class Option(Block):
 		self._join_multiline_value()
 		self._key = value
 		self._updated = True
+		if isinstance(self._container, Container):
+			self._container._invalidate_index()
 
 	@property
 	def value(self) -> str:
@@ -597,6 +806,8 @@ class Option(Block):
 		self._multiline_value_joined = True
 		self._value = value
 		self._values = [value]
+		self._pending_values = False
+		self._changed()
 
 	#
 	# def set_values(
@@ -689,6 +900,8 @@ class ConfigUpdater(Container[Block], MutableMapping):
 		# _structure takes the actual role instead. Only use self._structure!
 		self._sections: Dict[str, MutableMapping] = self._dict()
 		self._structure = []
+		self._source = ''  # The text of the file, which parsed blocks refer to.
+		self._cache: Optional[str] = None  # The serialised configuration, until it is changed.
 		self._delimiters = tuple(delimiters)
 		if delimiters == ('=', ':'):
 			self._optcre = self.OPTCRE_NV if allow_no_value else self.OPTCRE
@@ -706,12 +919,17 @@ class ConfigUpdater(Container[Block], MutableMapping):
 		self._empty_lines_in_values = False
 		super().__init__()
 
+	def _block_name(self, block: Block) -> Optional[str]:
+		return block.name if isinstance(block, Section) else None
+
+	def _touch(self) -> None:
+		self._cache = None
+
 	def _get_section_idx(self, name: str) -> int:
-		idx = [i for i, entry in enumerate(self._structure) if isinstance(entry, Section) and entry.name == name]
-		if idx:
-			return idx[0]
-		else:
-			raise ValueError
+		try:
+			return self._get_index()[name]
+		except (KeyError, TypeError):
+			raise ValueError from None
 
 	def read(self, filename: PathLike, encoding: Optional[str] = "UTF-8") -> None:
 		"""
@@ -767,42 +985,37 @@ class ConfigUpdater(Container[Block], MutableMapping):
 		"""
 		return optionstr.lower()
 
-	def _update_curr_block(self, block_type: Type[Block]) -> None:
-		if not isinstance(self.last_item, block_type):
-			new_block = block_type(container=self)
-			self._structure.append(new_block)
+	# The parsing hooks below are given the position of the line in ``self._source``.
 
-	def _add_comment(self, line: str) -> None:
+	def _add_comment(self, start: int, end: int) -> None:
 		if isinstance(self.last_item, Section):
-			self.last_item.add_comment(line)
+			self.last_item._add_span(Comment, self._source, start, end)
 		elif self.last_item is not None:
-			self._update_curr_block(Comment)
-			self.last_item.add_line(line)
+			self._add_span(Comment, self._source, start, end)
 		# else:
 		# 	raise ValueError("Cannot add a comment without somewhere to add it to.")
 
-	def _add_section(self, sectname: str, line: str) -> None:
+	def _add_section(self, sectname: str, start: int, end: int) -> None:
 		new_section = Section(sectname, container=self)
-		new_section.add_line(line)
-		self._structure.append(new_section)
+		new_section._set_span(self._source, start, end)
+		self._append_block(new_section)
 
-	def _add_option(self, key: str, vi: str, value: Optional[str], line: str) -> None:
+	def _add_option(self, key: str, vi: str, value: Optional[str], start: int, end: int) -> None:
 		entry = Option(
 				key,
 				value,
 				delimiter=vi,
 				container=self.last_item,
 				space_around_delimiters=self._space_around_delimiters,
-				line=line,
 				)
+		entry._set_span(self._source, start, end)
 		self.last_item.add_option(entry)
 
-	def _add_space(self, line: str) -> None:
+	def _add_space(self, start: int, end: int) -> None:
 		if isinstance(self.last_item, Section):
-			self.last_item.add_space(line)
+			self.last_item._add_span(Space, self._source, start, end)
 		else:
-			self._update_curr_block(Space)
-			self.last_item.add_line(line)
+			self._add_span(Space, self._source, start, end)
 
 	def _read(self, fp: IO, fpname: str) -> None:
 		"""
@@ -827,7 +1040,10 @@ class ConfigUpdater(Container[Block], MutableMapping):
 		this german pun) for consistency reasons and later upgrades.
 		"""
 
+		lines = list(fp)
+		self._source = ''.join(lines)
 		self._structure = []
+		self._invalidate_index()
 		elements_added: Set[Any] = set()
 		cursect: Optional[MutableMapping] = None
 		sectname = None
@@ -838,7 +1054,9 @@ class ConfigUpdater(Container[Block], MutableMapping):
 		comment_start: Optional[int]
 
 		e = None  # None, or an exception
-		for lineno, line in enumerate(fp, start=1):
+		end = 0
+		for lineno, line in enumerate(lines, start=1):
+			start, end = end, end + len(line)
 			comment_start = sys.maxsize
 			# strip inline comments
 			inline_prefixes = {p: -1 for p in self._inline_comment_prefixes}
@@ -856,7 +1074,7 @@ class ConfigUpdater(Container[Block], MutableMapping):
 			for prefix in self._comment_prefixes:
 				if line.strip().startswith(prefix):
 					comment_start = 0
-					self._add_comment(line)  # HOOK
+					self._add_comment(start, end)  # HOOK
 					break
 			if comment_start == sys.maxsize:
 				comment_start = None
@@ -871,12 +1089,12 @@ class ConfigUpdater(Container[Block], MutableMapping):
 							):
 						cursect[optname].append('')  # newlines added at join
 						assert isinstance(self.last_item.last_item, Block)
-						self.last_item.last_item.add_line(line)  # HOOK
+						self.last_item.last_item._extend_span(start, end)  # HOOK
 				else:
 					# empty line marks end of value
 					indent_level = sys.maxsize
 				if comment_start is None:
-					self._add_space(line)
+					self._add_space(start, end)
 				continue
 			# continuation line?
 			first_nonspace = self.NONSPACECRE.search(line)
@@ -885,11 +1103,11 @@ class ConfigUpdater(Container[Block], MutableMapping):
 			if (cursect is not None and optname and cur_indent_level > indent_level):
 				cursect[optname].append(value)
 				assert isinstance(self.last_item.last_item, Block)
-				self.last_item.last_item.add_line(line)  # HOOK
+				self.last_item.last_item._extend_span(start, end)  # HOOK
 			elif (cursect is not None and optname and line[0] in {';', '#'}):
 				cursect[optname].append(value)
 				assert isinstance(self.last_item.last_item, Block)
-				self.last_item.last_item.add_line(line)  # HOOK
+				self.last_item.last_item._extend_span(start, end)  # HOOK
 			# a section header or option header?
 			else:
 				indent_level = cur_indent_level
@@ -908,7 +1126,7 @@ class ConfigUpdater(Container[Block], MutableMapping):
 						elements_added.add(sectname)
 					# So sections can't start with a continuation line
 					optname = None
-					self._add_section(sectname, line)  # HOOK
+					self._add_section(sectname, start, end)  # HOOK
 				# no section header in the file?
 				elif cursect is None:
 					raise MissingSectionHeaderError(fpname, lineno, line)
@@ -931,7 +1149,7 @@ class ConfigUpdater(Container[Block], MutableMapping):
 						else:
 							# valueless option handling
 							cursect[optname] = None
-						self._add_option(optname, vi, optval, line)  # HOOK
+						self._add_option(optname, vi, optval, start, end)  # HOOK
 					else:
 						# a non-fatal parsing error occurred. set up the
 						# exception but keep going. the exception will be
@@ -942,6 +1160,15 @@ class ConfigUpdater(Container[Block], MutableMapping):
 		if e:
 			raise e
 
+		# The values are held by the blocks; ConfigParser's copy is only needed while parsing.
+		self._sections.clear()
+
+		for block in self._structure:
+			if isinstance(block, Section):
+				block._cache = None
+				block._pristine = block._is_contiguous()
+		self._cache = None
+
 	def _handle_error(self, exc: Optional[ParsingError], fpname: str, lineno: int, line: str) -> ParsingError:
 		if not exc:
 			exc = ParsingError(fpname)
@@ -1001,22 +1228,24 @@ class ConfigUpdater(Container[Block], MutableMapping):
 		return [section.name for section in self.sections_blocks()]
 
 	def __str__(self) -> str:
-		return ''.join(str(block) for block in self._structure)
+		if self._cache is None:
+			self._cache = ''.join(str(block) for block in self._structure)
+		return self._cache
 
 	def __getitem__(self, key: str) -> Section:
-		for section in self.sections_blocks():
-			if section.name == key:
-				return section
-
-		raise KeyError(key)
+		try:
+			return self._structure[self._get_section_idx(key)]  # type: ignore[return-value]
+		except ValueError:
+			raise KeyError(key) from None
 
 	def __setitem__(self, key: str, value: Section) -> None:
 		if not isinstance(value, Section):
 			raise ValueError("Value must be of type Section!")
 		if isinstance(key, str) and key in self:
 			idx = self._get_section_idx(key)
-			del self._structure[idx]
-			self._structure.insert(idx, value)
+			value._container = self
+			self._structure[idx] = value
+			self._invalidate_index()
 		else:
 			# name the section by the key
 			value.name = key
@@ -1032,7 +1261,10 @@ class ConfigUpdater(Container[Block], MutableMapping):
 		Returns whether the given section exists.
 		"""
 
-		return section in self.sections()
+		try:
+			return section in self._get_index()
+		except TypeError:  # unhashable
+			return False
 
 	def __len__(self) -> int:
 		"""
@@ -1063,7 +1295,7 @@ class ConfigUpdater(Container[Block], MutableMapping):
 		:param section:
 		"""
 
-		if section in self.sections():
+		if section in self:
 			raise DuplicateSectionError(section)  # type: ignore[arg-type]
 
 		if isinstance(section, str):
@@ -1071,7 +1303,9 @@ class ConfigUpdater(Container[Block], MutableMapping):
 			section = Section(section, container=self)
 		elif not isinstance(section, Section):
 			raise ValueError("Parameter must be a string or Section type!")
-		self._structure.append(section)
+		else:
+			section._container = self
+		self._append_block(section)
 
 	def options(self, section: str) -> List[str]:
 		"""
@@ -1178,7 +1412,7 @@ class ConfigUpdater(Container[Block], MutableMapping):
 			raise NoSectionError(section) from None
 
 		option = self.optionxform(option)
-		existed = option in section_.options()
+		existed = option in section_
 
 		if existed:
 			del section_[option]
@@ -1199,6 +1433,7 @@ class ConfigUpdater(Container[Block], MutableMapping):
 		if existed:
 			idx = self._get_section_idx(name)
 			del self._structure[idx]
+			self._invalidate_index()
 
 		return existed
 
@@ -24,11 +24,16 @@ Configuration options.
 #
 
 # stdlib
+import functools
+import hashlib
 import itertools
 import json
+import os
+import pickle
 import re
 from contextlib import suppress
 from io import StringIO
+from types import TracebackType
 from typing import (
 		Any,
 		Callable,
@@ -41,12 +46,15 @@ from typing import (
 		Optional,
 		Sequence,
 		Set,
+		Tuple,
+		Type,
 		Union,
 		cast
 		)
 
 # 3rd party
 import click
+import jsonschema
 from configconfig.metaclass import ConfigVarMeta
 from configconfig.parser import Parser
 from configconfig.utils import make_schema
@@ -180,7 +188,7 @@ from repo_helper.configuration.travis import (
 		travis_ubuntu_version
 		)
 from repo_helper.configuration.utils import get_tox_python_versions, parse_extras
-from repo_helper.utils import no_dev_versions, resource
+from repo_helper.utils import cache_dir, no_dev_versions, resource
 
 __all__ = [
 		"RepoHelperParser",
@@ -217,7 +225,9 @@ __all__ = [
 		"intersphinx_mapping",
 		"keywords",
 		"license",
+		"load_config",
 		"manifest_additional",
+		"migrate_config",
 		"modname",
 		"mypy_deps",
 		"extra_formate_deps",
@@ -255,6 +265,7 @@ __all__ = [
 		"travis_extra_install_pre",
 		"travis_ubuntu_version",
 		"username",
+		"validate_config",
 		"version",
 		"yapf_exclude",
 		"mypy_version",
@@ -266,6 +277,7 @@ __all__ = [
 		"standalone_contrib_guide",
 		"assignee",
 		"YamlEditor",
+		"YamlTransaction",
 		"docs_url",
 		"third_party_version_matrix",
 		"entry_points",
@@ -283,6 +295,57 @@ __all__ = [
 _REMOVED_KEYS_RE = re.compile("^(use_travis|travis_pypi_secure|travis_site|use_experimental_backend)")
 
 
+def _strip_removed_keys(lines: Iterable[str]) -> StringList:
+	"""
+	Returns the lines of ``repo_helper.yml`` without the keys which are no longer used.
+
+	:param lines:
+	"""
+
+	lines_without_removed_keys = StringList(
+			itertools.filterfalse(
+					_REMOVED_KEYS_RE.match,  # type: ignore[arg-type]
+					lines,
+					),
+			)
+	lines_without_removed_keys.blankline(ensure_single=True)
+	return lines_without_removed_keys
+
+
+def migrate_config(repo_path: PathLike) -> bool:
+	"""
+	Update the configuration file to the current format.
+
+	``git_helper.yml`` (the old name) is renamed to ``repo_helper.yml``,
+	and keys which are no longer used are removed.
+
+	:param repo_path: Path to the repository root.
+
+	:returns: Whether the configuration file was changed.
+
+	.. versionadded:: 2026.10.16
+	"""
+
+	repo_path = PathPlus(repo_path)
+	changed = False
+
+	if (repo_path / "git_helper.yml").is_file():
+		(repo_path / "git_helper.yml").rename(repo_path / "repo_helper.yml")
+		changed = True
+
+	config_file = repo_path / "repo_helper.yml"
+
+	if config_file.is_file():
+		content_lines = config_file.read_lines()
+		lines_without_removed_keys = _strip_removed_keys(content_lines)
+
+		if lines_without_removed_keys != content_lines:
+			config_file.write_lines(lines_without_removed_keys)
+			changed = True
+
+	return changed
+
+
 def parse_yaml(repo_path: PathLike, allow_unknown_keys: bool = False) -> Dict[str, Any]:
 	"""
 	Parse configuration values from ``repo_helper.yml``.
@@ -293,33 +356,144 @@ def parse_yaml(repo_path: PathLike, allow_unknown_keys: bool = False) -> Dict[st
 	:returns: Mapping of configuration keys to values.
 
 	.. versionchanged:: 2021.2.18  Added the ``allow_unknown_keys`` argument.
+
+	.. versionchanged:: 2026.10.16
+
+		* The parsed configuration is cached in the :func:`cache directory <repo_helper.utils.cache_dir>`
+		  and reused until ``repo_helper.yml``, a requirements file it refers to, or ``repo_helper`` itself changes.
+		* The configuration file is no longer modified.
+		  Keys which are no longer used are ignored, and ``git_helper.yml`` is read if ``repo_helper.yml`` doesn't exist.
+		  Use :func:`~.migrate_config` to update the file.
 	"""
 
-	repo_path = PathPlus(repo_path)
+	return _parse_yaml(repo_path, allow_unknown_keys)[0]
 
-	if (repo_path / "git_helper.yml").is_file():
-		(repo_path / "git_helper.yml").rename(repo_path / "repo_helper.yml")
 
+def _parse_yaml(repo_path: PathLike, allow_unknown_keys: bool = False) -> Tuple[Dict[str, Any], List[PathPlus]]:
+	"""
+	Parse configuration values from ``repo_helper.yml``.
+
+	:param repo_path: Path to the repository root.
+	:param allow_unknown_keys: Whether unknown keys should be allowed in the configuration file.
+
+	:returns: The mapping of configuration keys to values, and the absolute paths of the files it depends on.
+		These are the configuration file followed by the files listed in :attr:`RepoHelperParser.referenced_files`.
+	"""
+
+	repo_path = PathPlus(repo_path)
 	config_file = repo_path / "repo_helper.yml"
 
+	if not config_file.is_file() and (repo_path / "git_helper.yml").is_file():
+		config_file = repo_path / "git_helper.yml"
+
 	if not config_file.is_file():
 		raise FileNotFoundError(f"'repo_helper.yml' not found in {repo_path}")
 
-	content_lines = config_file.read_lines()
+	cache = _ConfigCache(config_file, allow_unknown_keys)
+	cached = cache.load()
 
-	lines_without_removed_keys = StringList(
-			itertools.filterfalse(
-					_REMOVED_KEYS_RE.match,  # type: ignore[arg-type]
-					content_lines,
-					),
-			)
-	lines_without_removed_keys.blankline(ensure_single=True)
+	if cached is None:
+		parser = RepoHelperParser(allow_unknown_keys=allow_unknown_keys)
+		config = cast(Dict[str, Any], parser.run(config_file))
+		referenced_files: Iterable[str] = parser.referenced_files
+		cache.dump(config, referenced_files)
+	else:
+		config, referenced_files = cached
+
+	return config, [cache.config_file, *(cache.repo_path / filename for filename in referenced_files)]
+
+
+def _hash_file(filename: PathLike) -> Optional[str]:
+	try:
+		with open(filename, "rb") as fp:
+			return hashlib.sha256(fp.read()).hexdigest()
+	except OSError:
+		return None
+
+
+def _parser_key() -> str:
+	"""
+	Returns a string which changes when the configuration parser may have changed.
+	"""
+
+	parts = [repo_helper.__version__]
+
+	directory = os.path.dirname(os.path.abspath(__file__))
+	for filename in sorted(os.listdir(directory)):
+		if filename.endswith(".py"):
+			parts.append(f"{filename}:{os.stat(os.path.join(directory, filename)).st_mtime_ns}")
+
+	return '\n'.join(parts)
+
+
+class _ConfigCache:
+	"""
+	Cache of the parsed configuration for a repository.
+
+	The cache is only used if the configuration file and every file it refers to are unchanged.
+
+	:param config_file: The configuration file.
+	:param allow_unknown_keys: Whether unknown keys are allowed in the configuration file.
+	"""
+
+	def __init__(self, config_file: PathPlus, allow_unknown_keys: bool):
+		self.config_file = config_file.abspath()
+		self.repo_path = self.config_file.parent
+
+		key = f"{self.config_file}\n{allow_unknown_keys}".encode("UTF-8")
+		self.filename = cache_dir() / "config" / f"{hashlib.sha256(key).hexdigest()}.pickle"
+		self.parser_key = _parser_key()
+
+	def _input_hashes(self, referenced_files: Iterable[str]) -> Dict[str, Optional[str]]:
+		return {filename: _hash_file(self.repo_path / filename) for filename in referenced_files}
+
+	def load(self) -> Optional[Tuple[Dict[str, Any], List[str]]]:
+		"""
+		Returns the cached configuration and the files it depends on,
+		or :py:obj:`None` if it is missing or out of date.
+		"""
+
+		try:
+			with open(self.filename, "rb") as fp:
+				entry = pickle.load(fp)  # nosec: B301
+
+			if entry["parser_key"] != self.parser_key:
+				return None
+			if entry["config_hash"] != _hash_file(self.config_file):
+				return None
+			if entry["inputs"] != self._input_hashes(entry["inputs"]):
+				return None
+
+			return entry["config"], list(entry["inputs"])
+
+		except Exception:  # pylint: disable=broad-except
+			# Missing, corrupt, or written by an incompatible version.
+			return None
 
-	if lines_without_removed_keys != content_lines:
-		config_file.write_lines(lines_without_removed_keys)
+	def dump(self, config: Dict[str, Any], referenced_files: Iterable[str]) -> None:
+		"""
+		Save the parsed configuration to the cache.
+
+		Errors writing the cache are ignored.
+
+		:param config: The parsed configuration.
+		:param referenced_files: The files the configuration depends on, relative to the repository root.
+		"""
+
+		entry = {
+				"parser_key": self.parser_key,
+				"config_hash": _hash_file(self.config_file),
+				"inputs": self._input_hashes(referenced_files),
+				"config": config,
+				}
 
-	parser = RepoHelperParser(allow_unknown_keys=allow_unknown_keys)
-	return cast(Dict[str, Any], parser.run(config_file))
+		try:
+			self.filename.parent.maybe_make(parents=True)
+			tmp_filename = self.filename.with_suffix(f".{os.getpid()}.tmp")
+			tmp_filename.write_bytes(pickle.dumps(entry))
+			os.replace(tmp_filename, self.filename)
+		except (OSError, pickle.PicklingError):
+			pass
 
 
 all_values: List[ConfigVarMeta] = []
@@ -344,6 +518,70 @@ for module in [
 all_values.sort(key=lambda v: v.__name__)
 
 
+def load_config(filename: PathLike) -> Any:
+	"""
+	Load the raw contents of a ``repo_helper.yml`` file, without the keys which are no longer used.
+
+	The file is loaded with the ``libyaml``-based C loader if it is available.
+	The file is never modified; use :class:`~.YamlEditor` to edit it.
+
+	:param filename:
+
+	.. versionadded:: 2026.10.16
+	"""
+
+	content = str(_strip_removed_keys(PathPlus(filename).read_lines()))
+
+	# Falls back to the pure-Python loader if the C extension is not installed.
+	return YAML(typ="safe").load(content)
+
+
+@functools.lru_cache()
+def _schema_validator(config_vars: Tuple[ConfigVarMeta, ...], allow_unknown_keys: bool) -> Any:
+	"""
+	Returns a :mod:`jsonschema` validator for configuration files with the given variables.
+
+	:param config_vars:
+	:param allow_unknown_keys: Whether unknown keys should be allowed in the configuration file.
+	"""
+
+	# Round trip through JSON so the schema is the same as if it were loaded from a file.
+	schema = json.loads(json.dumps(make_schema(*config_vars)))
+	schema["additionalProperties"] = allow_unknown_keys
+
+	validator_cls = jsonschema.validators.validator_for(schema)
+	validator_cls.check_schema(schema)
+	return validator_cls(schema, format_checker=jsonschema.FormatChecker())
+
+
+def validate_config(
+		config: Mapping[str, Any],
+		allow_unknown_keys: bool = False,
+		*,
+		config_vars: Optional[Iterable[ConfigVarMeta]] = None,
+		) -> None:
+	"""
+	Validate the raw contents of a ``repo_helper.yml`` file against the schema.
+
+	:param config:
+	:param allow_unknown_keys: Whether unknown keys should be allowed in the configuration file.
+	:param config_vars: The configuration variables to validate against.
+		Defaults to all of those supported by ``repo_helper``.
+
+	:raises jsonschema.ValidationError: If the configuration is invalid.
+
+	.. versionadded:: 2026.10.16
+	"""
+
+	if config_vars is None:
+		config_vars = all_values
+
+	validator = _schema_validator(tuple(config_vars), allow_unknown_keys)
+	error = jsonschema.exceptions.best_match(validator.iter_errors(config))
+	if error is not None:
+		raise error
+
+
 class RepoHelperParser(Parser):
 	"""
 	Parses the configuration fron ``repo_helper.yml``.
@@ -351,6 +589,46 @@ class RepoHelperParser(Parser):
 
 	config_vars: List[ConfigVarMeta] = all_values
 
+	#: The files read while parsing the configuration, besides the configuration file itself,
+	#: relative to the repository root. Populated by :meth:`~.custom_parsing`.
+	#:
+	#: .. versionadded:: 2026.10.16
+	referenced_files: List[str]
+
+	def run(self, filename: PathLike) -> MutableMapping[str, Any]:
+		"""
+		Parse configuration from the given file.
+
+		Keys which are no longer used are ignored.
+
+		:param filename: The filename of the YAML configuration file.
+
+		.. versionchanged:: 2026.10.16
+
+			The file is loaded once, with the C-accelerated loader if it is available,
+			and validated against a schema which is built once per process.
+		"""
+
+		filename = PathPlus(filename)
+
+		if not filename.is_file():
+			raise FileNotFoundError(str(filename))
+
+		raw_config_vars: Mapping[str, Any] = load_config(filename)
+
+		try:
+			validate_config(raw_config_vars, self.allow_unknown_keys, config_vars=self.config_vars)
+		except jsonschema.ValidationError as e:
+			e.filename = str(filename)  # type: ignore[attr-defined]
+			raise
+
+		parsed_config_vars: MutableMapping[str, Any] = {}
+
+		for var in self.config_vars:
+			parsed_config_vars[var.__name__] = getattr(self, f"visit_{var.__name__}", var.get)(raw_config_vars)
+
+		return self.custom_parsing(raw_config_vars, parsed_config_vars, filename)
+
 	def custom_parsing(
 			self,
 			raw_config_vars: Mapping[str, Any],
@@ -367,11 +645,17 @@ class RepoHelperParser(Parser):
 
 		repo_path = filename.parent
 
+		# An extra given as a string is either a requirements file or a single requirement,
+		# depending on whether the file exists.
+		extras_files = [v for v in raw_config_vars.get("extras_require", {}).values() if isinstance(v, str)]
+
 		# Packaging
 		extras_require, additional_requirements_files = parse_extras(raw_config_vars, repo_path)
 		parsed_config_vars["extras_require"] = extras_require
 		parsed_config_vars["additional_requirements_files"] = additional_requirements_files
 
+		self.referenced_files = sorted({*additional_requirements_files, *extras_files})
+
 		# Python Versions
 		versions = no_dev_versions(parsed_config_vars["python_versions"])
 		parsed_config_vars["min_py_version"] = min_py_version = first(
@@ -395,6 +679,7 @@ class RepoHelperParser(Parser):
 		package_dir = package_parent_dir / parsed_config_vars["import_name"].replace('.', '/')
 		if (package_dir / "py.typed").is_file():
 			parsed_config_vars["classifiers"].append("Typing :: Typed")
+		self.referenced_files.append((package_dir / "py.typed").relative_to(repo_path).as_posix())
 
 		parsed_config_vars["classifiers"] = natsorted(set(parsed_config_vars["classifiers"]))
 
@@ -511,6 +796,24 @@ class YamlEditor(YAML):  # noqa: PRM002
 				fp.write('\n')
 				fp.write(self.dumps(data, explicit_start=False))
 
+	def edit(self, filename: PathLike) -> "YamlTransaction":
+		"""
+		Returns a transaction for making several changes to ``filename``, which is written once at the end.
+
+		.. code-block:: python
+
+			with YamlEditor().edit("repo_helper.yml") as config:
+				config["enable_docs"] = False
+				config.merge("keywords", ["yaml", "configuration"], sort=True)
+				del config["docs_url"]
+
+		:param filename:
+
+		.. versionadded:: 2026.10.16
+		"""
+
+		return YamlTransaction(self, filename)
+
 	def update_key(
 			self,
 			filename: PathLike,
@@ -526,19 +829,90 @@ class YamlEditor(YAML):  # noqa: PRM002
 		:param key:
 		:param new_value:
 		:param sort: Whether to sort the updated value.
+
+		.. seealso:: :meth:`~.YamlEditor.edit`, for changing several keys at once.
 		"""
 
-		data = self.load_file(filename)
+		with self.edit(filename) as config:
+			if isinstance(new_value, str) or not isinstance(new_value, Iterable):
+				config[key] = new_value
+			else:
+				config.merge(key, new_value, sort=sort)
+
+
+class YamlTransaction:
+	"""
+	A set of changes to a YAML file, which is loaded once and written once when the transaction is committed.
+
+	Used as a context manager the transaction is committed when the ``with`` block exits,
+	unless an exception was raised. Obtain one with :meth:`YamlEditor.edit() <.YamlEditor.edit>`.
+
+	If only new keys were added they are appended to the file, leaving the rest of it untouched.
+	Otherwise the whole file is rewritten.
+
+	:param editor: The editor used to load and dump the file.
+	:param filename: The file to edit.
+
+	:raises TypeError: If the file does not contain a mapping.
+
+	.. versionadded:: 2026.10.16
+	"""
+
+	#: The contents of the file, including the changes made so far.
+	data: MutableMapping[str, Any]
+
+	def __init__(self, editor: YamlEditor, filename: PathLike):
+		self.editor = editor
+		self.filename = PathPlus(filename)
 
+		data = editor.load_file(self.filename)
 		if not isinstance(data, dict):
-			raise TypeError("'update_key' can only be used with mappings.")
+			raise TypeError("Only YAML files containing a mapping can be edited.")
 
-		if isinstance(new_value, str) or not isinstance(new_value, Iterable):
-			if key in data:
-				data[key] = new_value
-				self.dump_to_file(data, filename, mode='w')
-			else:
-				self.dump_to_file({key: new_value}, filename, mode='a')
+		self.data = data
+		self._existing_keys = set(data)
+		self._rewrite = False
+		self._changed = False
+
+	def __getitem__(self, key: str) -> Any:
+		return self.data[key]
+
+	def __contains__(self, key: object) -> bool:
+		return key in self.data
+
+	def get(self, key: str, default: Any = None) -> Any:
+		"""
+		Returns the value of ``key``, or ``default`` if it is not set.
+
+		:param key:
+		:param default:
+		"""
+
+		return self.data.get(key, default)
+
+	def __setitem__(self, key: str, value: Any) -> None:
+		if key in self._existing_keys:
+			self._rewrite = True
+
+		self.data[key] = value
+		self._changed = True
+
+	def __delitem__(self, key: str) -> None:
+		del self.data[key]
+
+		if key in self._existing_keys:
+			self._rewrite = True
+
+		self._changed = True
+
+	def merge(self, key: str, values: Iterable, *, sort: bool = False) -> None:
+		"""
+		Add ``values`` to the list ``key``, omitting any which are already present.
+
+		:param key:
+		:param values:
+		:param sort: Whether to sort the updated list.
+		"""
 
 		sort_func: Callable[[Iterable], Iterable]
 
@@ -552,11 +926,58 @@ class YamlEditor(YAML):  # noqa: PRM002
 				else:
 					return values
 
-		if key in data:
-			data[key] = sort_func({*data[key], *new_value})  # type: ignore[misc]
-			self.dump_to_file(data, filename, mode='w')
+		if key in self.data:
+			self[key] = sort_func({*self.data[key], *values})
+		else:
+			self[key] = sort_func(values)
+
+	def remove(self, key: str, values: Iterable) -> None:
+		"""
+		Remove ``values`` from the list ``key``.
+
+		Values are compared as strings, as YAML loads unquoted values such as ``3.8`` as numbers.
+
+		:param key:
+		:param values:
+
+		:raises KeyError: If ``key`` is not set.
+		"""
+
+		to_remove = set(map(str, values))
+		self[key] = [value for value in self.data[key] if str(value) not in to_remove]
+
+	def commit(self) -> None:
+		"""
+		Write the changes to the file.
+
+		Nothing is written if no changes were made.
+		"""
+
+		if not self._changed:
+			return
+
+		if self._rewrite:
+			self.editor.dump_to_file(self.data, self.filename, mode='w')
 		else:
-			self.dump_to_file({key: sort_func(new_value)}, filename, mode='a')  # type: ignore[arg-type]
+			new_keys = {key: value for key, value in self.data.items() if key not in self._existing_keys}
+			if new_keys:
+				self.editor.dump_to_file(new_keys, self.filename, mode='a')
+
+		self._existing_keys = set(self.data)
+		self._rewrite = False
+		self._changed = False
+
+	def __enter__(self) -> "YamlTransaction":
+		return self
+
+	def __exit__(
+			self,
+			exc_type: Optional[Type[BaseException]],
+			exc_val: Optional[BaseException],
+			exc_tb: Optional[TracebackType],
+			) -> None:
+		if exc_type is None:
+			self.commit()
 
 
 _pypy_version_re = re.compile(r"pypy3([0-9]+)", flags=re.IGNORECASE)
@@ -24,25 +24,38 @@ Core functionality of ``repo_helper``.
 #
 
 # stdlib
+import copy
 import os.path
-from typing import List, Tuple, Type
+import pathlib
+import posixpath
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, List, Mapping, Optional, Set, Tuple
 
 # 3rd party
-import jinja2
-from domdf_python_tools.import_tools import discover
 from domdf_python_tools.paths import PathPlus, traverse_to_file
 from domdf_python_tools.typing import PathLike
 from domdf_python_tools.utils import enquote_value
 
 # this package
-import repo_helper.files
-from repo_helper.configuration import parse_yaml
-from repo_helper.files import Management, is_registered, management
+from repo_helper.configuration import migrate_config, parse_yaml
+from repo_helper.daemon import current_warm_state
+from repo_helper.files import (
+		Management,
+		Manager,
+		dependency_graph,
+		get_dependencies,
+		management,
+		topological_sort
+		)
 from repo_helper.files.docs import copy_docs_styling
 from repo_helper.files.linting import code_only_warning, lint_warn_list
-from repo_helper.files.testing import make_formate_toml, make_isort
-from repo_helper.templates import Environment, init_repo_template_dir, template_dir
-from repo_helper.utils import brace, discover_entry_points
+from repo_helper.incremental import IncrementalCache, trace_environment
+from repo_helper.manifest import MANIFEST_FILENAME, Manifest
+from repo_helper.profiling import Profiler, record_file_changes, span
+from repo_helper.registry import import_managers
+from repo_helper.templates import Environment, init_repo_template_dir, template_dir, template_environment
+from repo_helper.utils import brace
+from repo_helper.vfs import FileChange, VirtualFileSystem
 
 __all__ = [
 		"RepoHelper",
@@ -50,14 +63,18 @@ __all__ = [
 		]
 
 
-def import_registered_functions() -> List[Type]:
+def import_registered_functions() -> List[Manager]:
 	"""
 	Returns a list of all registered functions.
+
+	.. versionchanged:: 2026.10.16
+
+		The modules to import are read from the :mod:`registry <repo_helper.registry>`,
+		rather than searching for them on every call.
 	"""
 
-	local_functions = discover(repo_helper.files, is_registered)
-	third_party_commands = discover_entry_points("repo_helper.command", is_registered)
-	return [*local_functions, *third_party_commands]
+	import_managers()
+	return [function for function, *_ in management]
 
 
 class RepoHelper:
@@ -74,29 +91,46 @@ class RepoHelper:
 	#: Provides the templates and stores the configuration.
 	templates: Environment
 
-	#: List of functions to manage files.
-	files: Management
+	#: The files changed by the last call to :meth:`~.run`.
+	#: If ``dry_run`` was :py:obj:`True` these were not written to the repository.
+	#:
+	#: .. versionadded:: 2026.10.16
+	changes: List[FileChange]
 
 	def __init__(
 			self,
 			target_repo: PathLike,
 			managed_message: str = "This file is managed by 'repo_helper'. Don't edit it directly.",
 			):
-		import_registered_functions()
-
 		# Walk up the tree until a "repo_helper.yml" or "git_helper.yml" (old name) file is found.
 		self.target_repo = traverse_to_file(PathPlus(target_repo), "repo_helper.yml", "git_helper.yml")
 
-		self.templates = Environment(  # nosec: B701
-			loader=jinja2.FileSystemLoader(str(template_dir)),
-			undefined=jinja2.StrictUndefined,
-		)
+		self.templates = template_environment(template_dir)
 		self.templates.globals["managed_message"] = managed_message
 		self.templates.globals["brace"] = brace
 
-		# isort and formate.toml must always run last
-		self.files = management + [(make_isort, "isort", [])]
-		self.files = management + [(make_formate_toml, "formate", [])]
+		self._files: Optional[Management] = None
+		self.changes = []
+
+	@property
+	def files(self) -> Management:
+		"""
+		List of functions to manage files.
+
+		.. versionchanged:: 2026.10.16
+
+			The managers are imported the first time this is accessed, rather than when the class is created.
+		"""
+
+		if self._files is None:
+			import_registered_functions()
+			self._files = Management(management)
+
+		return self._files
+
+	@files.setter
+	def files(self, value: Management) -> None:
+		self._files = value
 
 	@property
 	def managed_message(self) -> str:
@@ -126,7 +160,14 @@ class RepoHelper:
 			* Added the ``allow_unknown_keys`` argument.
 		"""
 
-		config_vars = parse_yaml(self.target_repo, allow_unknown_keys=allow_unknown_keys)
+		warm_state = current_warm_state()
+
+		with span("parse_yaml", "config"):
+			if warm_state is None:
+				config_vars = parse_yaml(self.target_repo, allow_unknown_keys=allow_unknown_keys)
+			else:
+				config_vars = warm_state.parse_yaml(self.target_repo, allow_unknown_keys=allow_unknown_keys)
+
 		self.templates.globals.update(config_vars)
 		self.templates.globals["lint_warn_list"] = lint_warn_list
 		self.templates.globals["code_only_warning"] = code_only_warning
@@ -150,53 +191,310 @@ class RepoHelper:
 
 		return self.templates.globals["repo_name"]
 
-	def run(self) -> List[str]:
+	def run(
+			self,
+			jobs: int = 1,
+			incremental: bool = False,
+			dry_run: bool = False,
+			profiler: Optional[Profiler] = None,
+			) -> List[str]:
 		"""
 		Run Git Helper for the repository and update all managed files.
 
+		Files are first written to a :class:`~repo_helper.vfs.VirtualFileSystem`,
+		and only those whose contents changed are written to the repository.
+		The changes are stored in :attr:`~.changes`.
+
+		:param jobs: The number of managers to run concurrently.
+		:param incremental: Whether to skip managers whose inputs have not changed since the last run.
+			See :mod:`repo_helper.incremental` for details.
+		:param dry_run: Don't write any files to the repository.
+		:param profiler: If given, records the time taken by each manager and other operations.
+
 		:return: A list of files managed by Git Helper, regardless of whether they were added,
 			removed or modified.
+
+		.. versionchanged:: 2026.10.16
+
+			* Added the ``jobs``, ``incremental``, ``dry_run`` and ``profiler`` arguments.
+			* Only files whose contents changed are written.
+			* ``repo_helper.yml`` is updated to the current format with :func:`~.migrate_config`.
+			  Previously this was done by :meth:`~.load_settings`.
 		"""
 
+		if profiler is not None:
+			with profiler:
+				return self.run(jobs=jobs, incremental=incremental, dry_run=dry_run)
+
+		if not dry_run:
+			migrate_config(self.target_repo)
+
 		all_managed_files = []
 
-		if (
-				self.templates.globals["enable_docs"]
-				and not (self.target_repo / self.templates.globals["docs_dir"]).exists()
-				):
+		enabled_files = self.enabled_managers()
+
+		with VirtualFileSystem(self.target_repo) as vfs:
+			with span("load", "io"):
+				self._load_files(vfs, enabled_files)
+
+			if (
+					self.templates.globals["enable_docs"]
+					and not (self.target_repo / self.templates.globals["docs_dir"]).exists()
+					):
+
+				# this package
+				from repo_helper.cli.commands.init import enable_docs
 
-			# this package
-			from repo_helper.cli.commands.init import enable_docs
+				init_repo_templates = template_environment(init_repo_template_dir)
+				init_repo_templates.globals.update(self.templates.globals)
 
-			init_repo_templates = Environment(  # nosec: B701
-				loader=jinja2.FileSystemLoader(str(init_repo_template_dir)),
-				undefined=jinja2.StrictUndefined,
-			)
-			init_repo_templates.globals.update(self.templates.globals)
+				with span("enable_docs", "manager"):
+					all_managed_files.extend(enable_docs(vfs.root, self.templates, init_repo_templates))
 
-			all_managed_files.extend(enable_docs(self.target_repo, self.templates, init_repo_templates))
+			if not self.templates.globals["preserve_custom_theme"] and self.templates.globals["enable_docs"]:
+				with span("copy_docs_styling", "manager"):
+					all_managed_files.extend(copy_docs_styling(vfs.root, self.templates))
 
-		if not self.templates.globals["preserve_custom_theme"] and self.templates.globals["enable_docs"]:
-			all_managed_files.extend(copy_docs_styling(self.target_repo, self.templates))
+			graph = dependency_graph(enabled_files, self.templates.globals)
+			output_filenames: Dict[int, List[str]]
+			cache = IncrementalCache(self.target_repo, working_tree=vfs.root) if incremental else None
+
+			if jobs > 1:
+				output_filenames = self._run_concurrently(vfs.root, enabled_files, graph, jobs, cache)
+			else:
+				output_filenames = {}
+				for idx in topological_sort(graph):
+					output_filenames[idx] = self._run_manager(
+							*enabled_files[idx],
+							vfs.root,
+							self.templates,
+							cache,
+							)
+
+			for filenames in output_filenames.values():
+				all_managed_files.extend(map(str, filenames))
+
+			Manifest.create(
+					self.target_repo,
+					inputs=self._manifest_inputs(enabled_files),
+					files=all_managed_files,
+					working_tree=vfs.root,
+					).dump(vfs.root)
+			all_managed_files.append(MANIFEST_FILENAME)
+
+			with span("changes" if dry_run else "flush", "io") as flush_span:
+				if dry_run:
+					self.changes = vfs.changes()
+				else:
+					self.changes = vfs.flush()
+
+					if cache is not None:
+						cache.save()
+
+				changed_files = {change.filename: len(change.new or b'') for change in self.changes}
+
+				if flush_span is not None:
+					flush_span.args["files_changed"] = len(changed_files)
+					flush_span.args["bytes_written"] = 0 if dry_run else sum(changed_files.values())
+
+			record_file_changes(changed_files)
+
+		all_managed_files.append("repo_helper.yml")
+		all_managed_files.append("git_helper.yml")
+
+		return sorted(set(all_managed_files))
+
+	def _load_files(self, vfs: VirtualFileSystem, enabled_files: List[Tuple[Manager, str]]) -> None:
+		"""
+		Copy the files read and written by the given managers into the staging area.
+
+		:param vfs:
+		:param enabled_files: The managers to run, and their ``exclude_name``.
+		"""
+
+		docs_dir = self.templates.globals["docs_dir"]
+		vfs.load(
+				f"{docs_dir}/_static/style.css",
+				f"{docs_dir}/_templates/layout.html",
+				f"{docs_dir}/_templates/base.html",
+				f"{docs_dir}/_templates/sidebar/navigation.html",
+				)
+
+		for function_, _ in enabled_files:
+			dependencies = get_dependencies(function_)
+
+			if dependencies is None:
+				# Could read anything.
+				vfs.load_tree()
+				return
+
+			resolved = dependencies.resolve(self.templates.globals)
+			vfs.load(*resolved.reads, *resolved.writes)
+
+	def enabled_managers(self) -> List[Tuple[Manager, str]]:
+		"""
+		Returns the managers which are enabled by the configuration, and their ``exclude_name``.
+
+		.. versionadded:: 2026.10.16
+		"""
 
 		# TODO: this isn't respecting "enable_docs"
+		enabled_files = []
 		for function_, exclude_name, other_requirements in self.files:
 			if exclude_name not in self.exclude_files and all([
 					self.templates.globals[req] for req in other_requirements
 					]):
+				enabled_files.append((function_, exclude_name))
 
-				# print(f"{function_.__name__}{'.'*(75-len(function_.__name__))}", end='')
-				# sys.stdout.flush()
-				output_filenames = function_(self.target_repo, self.templates)
-				# print(f"{Back.GREEN('Done')}")
+		return enabled_files
 
-				for filename in output_filenames:
-					all_managed_files.append(str(filename))
+	def input_files(self) -> List[str]:
+		"""
+		Returns the files read when parsing the configuration and by the enabled managers.
 
-		all_managed_files.append("repo_helper.yml")
-		all_managed_files.append("git_helper.yml")
+		``repo_helper.yml`` itself is not included, nor are the inputs of managers which have not declared them.
 
-		return sorted(set(all_managed_files))
+		.. versionadded:: 2026.10.16
+		"""
+
+		return self._inputs(self.enabled_managers())
+
+	def _manifest_inputs(self, enabled_files: List[Tuple[Manager, str]]) -> Optional[List[str]]:
+		"""
+		Returns the files read when parsing the configuration and by the given managers.
+
+		:param enabled_files: The managers to run, and their ``exclude_name``.
+
+		:returns: :py:obj:`None` if any of the managers have not declared the files they read.
+		"""
+
+		if any(get_dependencies(function_) is None for function_, _ in enabled_files):
+			return None
+
+		return self._inputs(enabled_files)
+
+	def _inputs(self, enabled_files: List[Tuple[Manager, str]]) -> List[str]:
+		"""
+		Returns the files read when parsing the configuration and by the given managers which have declared them.
+
+		:param enabled_files: The managers to run, and their ``exclude_name``.
+		"""
+
+		import_path = self.templates.globals["import_name"].replace('.', '/')
+		inputs = [
+				*self.templates.globals["additional_requirements_files"],
+				posixpath.join(self.templates.globals["source_dir"], import_path, "py.typed"),
+				]
+
+		for function_, _ in enabled_files:
+			dependencies = get_dependencies(function_)
+			if dependencies is not None:
+				inputs.extend(dependencies.resolve(self.templates.globals).reads)
+
+		return inputs
+
+	def _run_concurrently(
+			self,
+			repo_path: PathPlus,
+			enabled_files: List[Tuple[Manager, str]],
+			graph: Mapping[int, Set[int]],
+			jobs: int,
+			cache: Optional[IncrementalCache] = None,
+			) -> Dict[int, List[str]]:
+		"""
+		Run the given managers in a thread pool, starting each once the managers it depends on have finished.
+
+		Each manager is given its own copy of the template globals, so changes made by one manager
+		(e.g. ``make_conf`` adding to ``html_context``) cannot be seen by others running at the same time.
+
+		:param repo_path: The directory to write files to.
+		:param enabled_files: The managers to run, and their ``exclude_name``.
+		:param graph: The dependencies between the managers, as returned by :func:`~.dependency_graph`.
+		:param jobs: The maximum number of managers to run at once.
+		:param cache: If given, managers whose inputs are unchanged are skipped.
+
+		:returns: A mapping of the index of each manager in ``enabled_files`` to its output filenames.
+		"""
+
+		# Raises ValueError for circular dependencies before anything is run.
+		order = topological_sort(graph)
+
+		outputs: Dict[int, List[str]] = {}
+		running: Dict[Future, int] = {}
+
+		with ThreadPoolExecutor(max_workers=jobs) as executor:
+			while len(outputs) < len(order):
+				for idx in order:
+					if idx in outputs or idx in running.values() or not graph[idx].issubset(outputs):
+						continue
+
+					future = executor.submit(
+							self._run_manager,
+							*enabled_files[idx],
+							repo_path,
+							_isolated_environment(self.templates),
+							cache,
+							)
+					running[future] = idx
+
+				done, _ = wait(running, return_when=FIRST_COMPLETED)
+				for future in done:
+					outputs[running.pop(future)] = future.result()
+
+		return outputs
+
+	def _run_manager(
+			self,
+			function_: Manager,
+			exclude_name: str,
+			repo_path: PathPlus,
+			templates: Environment,
+			cache: Optional[IncrementalCache] = None,
+			) -> List[str]:
+		"""
+		Run a single manager.
+
+		:param function_: The manager to run.
+		:param exclude_name: The name of the manager, used when profiling.
+		:param repo_path: The directory to write files to.
+		:param templates: The environment to run the manager with.
+		:param cache: If given, the manager is skipped if its inputs are unchanged,
+			and otherwise run with a traced copy of :attr:`~.templates`.
+
+		:returns: The output filenames of the manager.
+		"""
+
+		with span(exclude_name, "manager") as manager_span:
+			outputs = None
+
+			if cache is None:
+				outputs = function_(repo_path, templates)
+			else:
+				outputs = cache.get_outputs(function_, self.templates)
+
+				if outputs is None:
+					traced_environment = trace_environment(_isolated_environment(self.templates))
+					outputs = function_(repo_path, traced_environment)
+					cache.record(function_, self.templates, traced_environment, outputs)
+				elif manager_span is not None:
+					manager_span.args["skipped"] = True
+
+			if manager_span is not None:
+				manager_span.args["outputs"] = [pathlib.PurePath(output).as_posix() for output in outputs]
+
+		return outputs
+
+
+def _isolated_environment(templates: Environment) -> Environment:
+	"""
+	Returns an overlay of ``templates`` with a deep copy of its globals and an empty template cache.
+
+	:param templates:
+	"""
+
+	environment = templates.overlay(cache_size=50)
+	environment.globals = copy.deepcopy(templates.globals)
+	return environment
 
 
 # Legacy alias
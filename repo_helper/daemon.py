@@ -0,0 +1,421 @@
+#!/usr/bin/env python
+#
+#  daemon.py
+"""
+Long-running ``repo_helper`` process which keeps modules, templates and configuration loaded.
+
+Start the daemon with ``repo_helper daemon start``, then run commands through the client:
+
+.. code-block:: bash
+
+	python -m repo_helper.daemon run --no-commit
+	python -m repo_helper.daemon check
+	python -m repo_helper.daemon show version -q
+
+``run`` takes the same options as running ``repo_helper`` without a command.
+If ``--commit`` / ``--no-commit`` is not given, changes are not committed, as the daemon cannot ask.
+
+The client only imports ``click`` and the standard library, so it starts quickly.
+If the daemon isn't running the command is run in the client process instead.
+
+Within the daemon, compiled templates are kept in memory by the :class:`~repo_helper.templates.TemplateBytecodeCache`,
+and parsed configuration is reused until the modification time or size of ``repo_helper.yml``,
+or of a requirements file it refers to, changes.
+The daemon exits when the installed ``repo_helper`` or any plugin changes,
+after which the client falls back to running commands itself until the daemon is restarted.
+
+The daemon listens on a Unix socket, which defaults to ``repo_helper.sock`` in ``$XDG_RUNTIME_DIR``,
+or in a private directory within the cache directory if that isn't set.
+It can be changed with the ``REPO_HELPER_DAEMON_SOCKET`` environment variable.
+The client ignores sockets which belong to another user.
+
+.. versionadded:: 2026.10.16
+"""
+#
+#  Copyright © 2026 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+
+# stdlib
+import copy
+import json
+import os
+import socket
+import socketserver
+import sys
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+from types import TracebackType
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+
+# 3rd party
+import click
+
+__all__ = [
+		"DaemonServer",
+		"WarmState",
+		"current_warm_state",
+		"default_socket_path",
+		"main",
+		"send_request",
+		]
+
+#: The commands which can be forwarded to the daemon.
+forwarded_commands = ("run", "check", "show")
+
+_PathLike = Union[str, "os.PathLike[str]"]
+
+
+def default_socket_path() -> str:
+	"""
+	Returns the path of the socket the daemon listens on.
+
+	This is ``repo_helper.sock`` in ``$XDG_RUNTIME_DIR`` if that is set,
+	otherwise ``daemon/repo_helper.sock`` in the :func:`cache directory <repo_helper.utils.cache_dir>`.
+	The ``daemon`` directory is created if required, and is only accessible by the current user.
+	"""
+
+	if os.environ.get("REPO_HELPER_DAEMON_SOCKET"):
+		return os.environ["REPO_HELPER_DAEMON_SOCKET"]
+
+	if os.environ.get("XDG_RUNTIME_DIR"):
+		return os.path.join(os.environ["XDG_RUNTIME_DIR"], "repo_helper.sock")
+
+	# The same directory as repo_helper.utils.cache_dir, which is slow to import.
+	if os.environ.get("REPO_HELPER_CACHE_DIR"):
+		cache_dir = os.environ["REPO_HELPER_CACHE_DIR"]
+	else:
+		# 3rd party
+		import platformdirs
+
+		cache_dir = platformdirs.user_cache_dir("repo_helper")
+
+	directory = os.path.join(cache_dir, "daemon")
+	os.makedirs(directory, mode=0o700, exist_ok=True)
+	os.chmod(directory, 0o700)
+
+	return os.path.join(directory, "repo_helper.sock")
+
+
+class WarmState:
+	"""
+	Parsed configuration shared between :class:`~repo_helper.core.RepoHelper` instances.
+
+	While the state is active (in its ``with`` block) new :class:`~repo_helper.core.RepoHelper` instances use it.
+	"""
+
+	def __init__(self):
+		self._configs: Dict[Tuple[str, bool], Tuple[List[Tuple[str, Optional[Tuple[int, int]]]], Dict[str, Any]]] = {}
+		self._previous: List[Optional["WarmState"]] = []
+
+	def __enter__(self) -> "WarmState":
+		global _active_state
+		self._previous.append(_active_state)
+		_active_state = self
+		return self
+
+	def __exit__(
+			self,
+			exc_type: Optional[Type[BaseException]],
+			exc_val: Optional[BaseException],
+			exc_tb: Optional[TracebackType],
+			) -> None:
+		global _active_state
+		_active_state = self._previous.pop()
+
+	def parse_yaml(self, repo_path: _PathLike, allow_unknown_keys: bool = False) -> Dict[str, Any]:
+		"""
+		Parse configuration values from ``repo_helper.yml``, reusing the previous result if the files it was read from are unchanged.
+
+		These are ``repo_helper.yml`` and the requirements files it refers to.
+
+		:param repo_path: Path to the repository root.
+		:param allow_unknown_keys: Whether unknown keys should be allowed in the configuration file.
+
+		:returns: A copy of the mapping of configuration keys to values.
+		"""
+
+		# this package
+		from repo_helper.configuration import _parse_yaml
+
+		key = (os.path.abspath(repo_path), allow_unknown_keys)
+
+		if key in self._configs:
+			inputs, config = self._configs[key]
+			if all(_stat_key(filename) == stat for filename, stat in inputs):
+				return copy.deepcopy(config)
+
+		config, filenames = _parse_yaml(repo_path, allow_unknown_keys=allow_unknown_keys)
+		self._configs[key] = ([(filename, _stat_key(filename)) for filename in filenames], config)
+
+		return copy.deepcopy(config)
+
+
+def _stat_key(filename: _PathLike) -> Optional[Tuple[int, int]]:
+	"""
+	Returns the modification time and size of the file, or :py:obj:`None` if it doesn't exist.
+
+	:param filename:
+	"""
+
+	try:
+		stat = os.stat(filename)
+	except OSError:
+		return None
+
+	return stat.st_mtime_ns, stat.st_size
+
+
+_active_state: Optional[WarmState] = None
+
+
+def current_warm_state() -> Optional[WarmState]:
+	"""
+	Returns the active :class:`~.WarmState`, if any.
+	"""
+
+	return _active_state
+
+
+def _cli_args(argv: List[str]) -> List[str]:
+	"""
+	Convert the arguments given to the client to those for the ``repo_helper`` command.
+
+	:param argv:
+	"""
+
+	if argv[0] != "run":
+		return list(argv)
+
+	args = list(argv[1:])
+	if not {"-y", "-n", "--commit", "--no-commit"}.intersection(args):
+		args.append("--no-commit")
+
+	return args
+
+
+def _run_cli(args: List[str], color: Optional[bool] = None) -> int:
+	"""
+	Run the ``repo_helper`` command with the given arguments, and return the exit code.
+
+	:param args:
+	:param color: Whether to use coloured output. :py:obj:`None` to decide based on the terminal.
+	"""
+
+	# this package
+	from repo_helper.__main__ import cli
+
+	try:
+		cli.main(args=args, prog_name="repo_helper", obj={}, standalone_mode=False, color=color)
+	except SystemExit as e:
+		if e.code is None:
+			return 0
+		elif isinstance(e.code, int):
+			return e.code
+		else:
+			click.echo(e.code, err=True)
+			return 1
+	except click.ClickException as e:
+		e.show()
+		return e.exit_code
+	except click.Abort:
+		click.echo("Aborted!", err=True)
+		return 1
+
+	return 0
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+
+	def handle(self) -> None:
+		try:
+			request = json.loads(self.rfile.readline())
+		except ValueError:
+			return
+
+		response = self.server.daemon.dispatch(request)  # type: ignore[attr-defined]
+		self.wfile.write(json.dumps(response).encode("UTF-8") + b'\n')
+
+
+class DaemonServer:
+	"""
+	Server which runs forwarded commands in this process, one at a time.
+
+	:param socket_path: The path of the socket to listen on.
+	:param idle_timeout: The number of seconds without a request after which the server stops.
+	"""
+
+	def __init__(self, socket_path: _PathLike, idle_timeout: Optional[float] = 3600):
+
+		# this package
+		from repo_helper.registry import environment_key, load_registry
+
+		self.socket_path = os.fspath(socket_path)
+
+		if os.path.exists(self.socket_path):
+			if send_request({"command": "ping"}, self.socket_path) is not None:
+				raise OSError(f"The repo_helper daemon is already running at {self.socket_path!r}")
+			os.unlink(self.socket_path)
+
+		# Import the managers and commands now, so the first request is as fast as the rest.
+		load_registry()
+		self.environment_key = environment_key()
+		self.state = WarmState()
+		self.stopping = False
+
+		self._server = socketserver.UnixStreamServer(self.socket_path, _RequestHandler)
+		self._server.daemon = self  # type: ignore[attr-defined]
+		self._server.timeout = idle_timeout
+		self._server.handle_timeout = self._handle_timeout  # type: ignore[assignment]
+		os.chmod(self.socket_path, 0o600)
+
+	def serve(self) -> None:
+		"""
+		Handle requests until asked to stop, or until no request arrives within the idle timeout.
+		"""
+
+		try:
+			while not self.stopping:
+				self._server.handle_request()
+		finally:
+			self._server.server_close()
+			os.unlink(self.socket_path)
+
+	def _handle_timeout(self) -> None:
+		self.stopping = True
+
+	def dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+		"""
+		Handle a request from the client.
+
+		:param request:
+		"""
+
+		# this package
+		from repo_helper.registry import environment_key
+
+		command = request.get("command", "run")
+
+		if command == "ping":
+			return {"exit_code": 0}
+		elif command == "stop":
+			self.stopping = True
+			return {"exit_code": 0}
+
+		if environment_key() != self.environment_key:
+			# The installed code has changed; the client runs the command itself.
+			self.stopping = True
+			return {"fallback": True}
+
+		argv = request.get("argv") or []
+		if not argv or argv[0] not in forwarded_commands:
+			return {"stdout": '', "stderr": f"Cannot forward {argv[:1]!r} to the daemon.\n", "exit_code": 2}
+
+		return self.run_command(_cli_args(argv), request["cwd"], color=request.get("color"))
+
+	def run_command(self, args: List[str], cwd: str, color: Optional[bool] = None) -> Dict[str, Any]:
+		"""
+		Run the ``repo_helper`` command with the given arguments and capture its output.
+
+		:param args:
+		:param cwd: The directory to run the command in.
+		:param color: Whether to use coloured output.
+		"""
+
+		# 3rd party
+		from domdf_python_tools.paths import in_directory
+
+		stdout, stderr = StringIO(), StringIO()
+		stdin = sys.stdin
+		sys.stdin = StringIO()
+
+		try:
+			with self.state, in_directory(cwd), redirect_stdout(stdout), redirect_stderr(stderr):
+				try:
+					exit_code = _run_cli(args, color=color)
+				except Exception:  # pylint: disable=broad-except
+					traceback.print_exc()
+					exit_code = 1
+		finally:
+			sys.stdin = stdin
+
+		return {"stdout": stdout.getvalue(), "stderr": stderr.getvalue(), "exit_code": exit_code}
+
+
+def send_request(request: Dict[str, Any], socket_path: Optional[_PathLike] = None) -> Optional[Dict[str, Any]]:
+	"""
+	Send a request to the daemon and return its response.
+
+	:param request:
+	:param socket_path: The path of the socket the daemon listens on.
+		Defaults to the value of :func:`~.default_socket_path`.
+
+	:returns: :py:obj:`None` if the daemon is not running, or if the socket belongs to another user.
+	"""
+
+	if socket_path is None:
+		socket_path = default_socket_path()
+
+	try:
+		# Don't send the request to a socket created by another user.
+		if hasattr(os, "getuid") and os.stat(socket_path).st_uid != os.getuid():
+			return None
+
+		with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+			sock.connect(os.fspath(socket_path))
+			sock.sendall(json.dumps(request).encode("UTF-8") + b'\n')
+
+			with sock.makefile("rb") as fp:
+				response = fp.readline()
+	except (OSError, AttributeError):
+		# AttributeError if the platform does not support Unix sockets.
+		return None
+
+	if not response:
+		return None
+
+	return json.loads(response)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+	"""
+	Entry point for the client.
+
+	:param argv: The command to run, e.g. ``['show', 'version', '-q']``.
+	"""
+
+	if argv is None:
+		argv = sys.argv[1:]
+
+	if not argv or argv[0] not in forwarded_commands:
+		click.echo(f"Usage: python -m repo_helper.daemon {{{','.join(forwarded_commands)}}} [ARGS]...", err=True)
+		return 2
+
+	request = {"argv": argv, "cwd": os.getcwd(), "color": sys.stdout.isatty()}
+	response = send_request(request)
+
+	if response is None or response.get("fallback"):
+		return _run_cli(_cli_args(argv))
+
+	click.echo(response["stdout"], nl=False)
+	click.echo(response["stderr"], nl=False, err=True)
+	return response["exit_code"]
+
+
+if __name__ == "__main__":
+	sys.exit(main())
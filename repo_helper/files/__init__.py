@@ -26,7 +26,8 @@ Functions to create files.
 # stdlib
 import inspect
 import pathlib
-from typing import Any, Callable, List, Optional, Sequence, Tuple
+import posixpath
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Sequence, Set, Tuple
 
 # 3rd party
 import jinja2
@@ -37,12 +38,59 @@ from repo_helper.templates import Environment
 
 jinja2.Environment.__module__ = "jinja2"
 
-__all__ = ["Management", "management", "is_registered", "Manager"]
+__all__ = [
+		"Management",
+		"management",
+		"is_registered",
+		"Manager",
+		"ManagerDependencies",
+		"get_dependencies",
+		"dependency_graph",
+		"topological_sort",
+		]
 
 #: Type hint for a function that manages files.
 Manager = Callable[[pathlib.Path, Environment], List[str]]
 
 
+class ManagerDependencies(NamedTuple):
+	"""
+	The files read and written by a manager, and the managers it must run after.
+
+	Filenames are relative to the repository root, and may contain ``{placeholders}``
+	which are filled in from the configuration (e.g. ``'{docs_dir}/conf.py'``).
+	The additional placeholder ``{import_path}`` gives ``import_name`` with dots replaced by slashes.
+
+	.. versionadded:: 2026.10.16
+	"""
+
+	#: Files, other than those in :attr:`~.writes`, whose contents affect the output of the manager.
+	reads: Tuple[str, ...] = ()
+
+	#: Files created, modified or removed by the manager.
+	writes: Tuple[str, ...] = ()
+
+	#: The ``exclude_name`` of managers which must run before this one.
+	after: Tuple[str, ...] = ()
+
+	def resolve(self, config: Mapping[str, Any]) -> "ManagerDependencies":
+		"""
+		Fill in the placeholders in :attr:`~.reads` and :attr:`~.writes` from the given configuration.
+
+		:param config: The parsed configuration, usually the template globals.
+		"""
+
+		format_vars = dict(config)
+
+		if "import_name" in config:
+			format_vars["import_path"] = config["import_name"].replace('.', '/')
+
+		def resolve_all(filenames: Sequence[str]) -> Tuple[str, ...]:
+			return tuple(posixpath.normpath(filename.format_map(format_vars)) for filename in filenames)
+
+		return self._replace(reads=resolve_all(self.reads), writes=resolve_all(self.writes))
+
+
 class Management(UserList[Tuple[Manager, str, Sequence[str]]]):  # noqa: PRM002
 	"""
 	Class to store functions that manage files.
@@ -52,6 +100,9 @@ class Management(UserList[Tuple[Manager, str, Sequence[str]]]):  # noqa: PRM002
 	* the function,
 	* a string to use in ``exclude_files`` to disable this function,
 	* a list of strings representing config values that must be true to call the function.
+
+	The files each function reads and writes, and the functions it must run after,
+	are available from :func:`~.get_dependencies`.
 	"""
 
 	def __init__(self, *args, **kwargs):
@@ -63,6 +114,9 @@ class Management(UserList[Tuple[Manager, str, Sequence[str]]]):  # noqa: PRM002
 			exclude_unless_true: Sequence[str] = (),
 			*,
 			name: Optional[str] = None,
+			reads: Sequence[str] = (),
+			writes: Sequence[str] = (),
+			after: Sequence[str] = (),
 			) -> Callable:
 		"""
 		Decorator to register a function.
@@ -80,10 +134,19 @@ class Management(UserList[Tuple[Manager, str, Sequence[str]]]):  # noqa: PRM002
 		:param exclude_unless_true: A list of strings representing config values that must be true to call the function.
 		:param name: Optional name to use for the function in the output. Defaults to the name of the function.
 		:no-default name:
+		:param reads: Files, other than those in ``writes``, whose contents affect the output of the function.
+		:param writes: Files created, modified or removed by the function.
+		:param after: The ``exclude_name`` of functions which must run before this one.
+
+		``reads`` and ``writes`` may contain placeholders, as described in :class:`~.ManagerDependencies`.
+		Functions which declare none of ``reads``, ``writes`` and ``after`` are never run concurrently with
+		others, and keep their position relative to the other registered functions.
 
 		:return: The registered function.
 
 		:raises: :exc:`SyntaxError` if the decorated function does not take the correct arguments.
+
+		.. versionchanged:: 2026.10.16  Added the ``reads``, ``writes`` and ``after`` arguments.
 		"""
 
 		def _decorator(function: Callable) -> Callable:
@@ -100,6 +163,10 @@ class Management(UserList[Tuple[Manager, str, Sequence[str]]]):  # noqa: PRM002
 
 			setattr(function, "_repo_helper_registered", True)
 
+			if reads or writes or after:
+				dependencies = ManagerDependencies(tuple(reads), tuple(writes), tuple(after))
+				setattr(function, "_repo_helper_dependencies", dependencies)
+
 			return function
 
 		return _decorator
@@ -121,3 +188,99 @@ def is_registered(obj: Any) -> bool:
 		return bool(getattr(obj, "_repo_helper_registered", False))
 
 	return False
+
+
+def get_dependencies(function: Manager) -> Optional[ManagerDependencies]:
+	"""
+	Returns the files read and written by ``function``, and the managers it must run after.
+
+	.. versionadded:: 2026.10.16
+
+	:param function: A registered function.
+
+	:returns: :py:obj:`None` if the function was registered without this information.
+	"""
+
+	return getattr(function, "_repo_helper_dependencies", None)
+
+
+def dependency_graph(
+		managers: Sequence[Tuple[Manager, str]],
+		config: Mapping[str, Any],
+		) -> Dict[int, Set[int]]:
+	"""
+	Determine which managers must run before which others.
+
+	A manager runs after:
+
+	* any manager it names in ``after``;
+	* any manager which writes a file it reads;
+	* any earlier manager which writes the same file as it does;
+	* all earlier managers, if either manager was registered without its dependencies.
+
+	.. versionadded:: 2026.10.16
+
+	:param managers: A list of ``(function, exclude_name)`` tuples, in registration order.
+	:param config: The parsed configuration, used to fill in placeholders in filenames.
+
+	:returns: A mapping of the index of each manager in ``managers`` to the indices of the managers it must run after.
+	"""
+
+	resolved = []
+	for function, _ in managers:
+		dependencies = get_dependencies(function)
+		resolved.append(None if dependencies is None else dependencies.resolve(config))
+
+	graph: Dict[int, Set[int]] = {idx: set() for idx in range(len(managers))}
+
+	for later_idx, (_, later_name) in enumerate(managers):
+		later = resolved[later_idx]
+
+		for earlier_idx, (_, earlier_name) in enumerate(managers[:later_idx]):
+			earlier = resolved[earlier_idx]
+
+			if earlier is None or later is None:
+				graph[later_idx].add(earlier_idx)
+				continue
+
+			if (
+					earlier_name in later.after or set(earlier.writes).intersection(later.reads)
+					or set(earlier.writes).intersection(later.writes)
+					):
+				graph[later_idx].add(earlier_idx)
+
+			if later_name in earlier.after or set(later.writes).intersection(earlier.reads):
+				graph[earlier_idx].add(later_idx)
+
+	return graph
+
+
+def topological_sort(graph: Mapping[int, Set[int]]) -> List[int]:
+	"""
+	Returns the nodes of ``graph`` in an order where each node comes after the nodes it depends on.
+
+	Where there is a choice, nodes with a lower number come first.
+
+	.. versionadded:: 2026.10.16
+
+	:param graph: A mapping of nodes to the nodes which must come before them, as returned by :func:`~.dependency_graph`.
+
+	:raises: :exc:`ValueError` if the graph contains a cycle.
+	"""
+
+	remaining = {node: set(dependencies) for node, dependencies in graph.items()}
+	order: List[int] = []
+
+	while remaining:
+		ready = [node for node, dependencies in remaining.items() if not dependencies]
+		if not ready:
+			raise ValueError(f"Circular dependency between managers {sorted(remaining)}")
+
+		node = min(ready)
+		order.append(node)
+		del remaining[node]
+
+		for dependencies in remaining.values():
+			dependencies.discard(node)
+
+	return order
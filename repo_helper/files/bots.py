@@ -45,7 +45,7 @@ __all__ = [
 		]
 
 
-@management.register("stale_bot")
+@management.register("stale_bot", writes=[".github/stale.yml"])
 def make_stale_bot(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Add configuration for ``stale`` to the desired repo.
@@ -62,7 +62,14 @@ def make_stale_bot(repo_path: pathlib.Path, templates: Environment) -> List[str]
 	return [stale_file.relative_to(repo_path).as_posix()]
 
 
-@management.register("auto_assign")
+@management.register(
+		"auto_assign",
+		writes=[
+				".github/workflows/assign.yml",
+				".github/workflow/assign.yml",
+				".github/auto_assign.yml",
+				],
+		)
 def make_auto_assign_action(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Add configuration for ``auto-assign`` to the desired repo.
@@ -126,7 +133,7 @@ def make_auto_assign_action(repo_path: pathlib.Path, templates: Environment) ->
 			]
 
 
-@management.register("dependabot")
+@management.register("dependabot", writes=[".dependabot/config.yml"])
 def make_dependabot(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Add configuration for ``dependabot`` to the desired repo.
@@ -153,7 +160,7 @@ def make_dependabot(repo_path: pathlib.Path, templates: Environment) -> List[str
 	return [return_filename]
 
 
-@management.register("dependabotv2")
+@management.register("dependabotv2", writes=[".github/dependabot.yml"])
 def make_dependabotv2(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Add configuration for ``dependabot`` to the desired repo.
@@ -188,7 +195,7 @@ def make_dependabotv2(repo_path: pathlib.Path, templates: Environment) -> List[s
 	return [dependabot_file.relative_to(repo_path).as_posix()]
 
 
-@management.register("imgbot")
+@management.register("imgbot", writes=[".imgbotconfig"])
 def make_imgbot(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Add configuration for ``imgbot`` to the desired repo.
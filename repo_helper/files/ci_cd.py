@@ -61,7 +61,16 @@ __all__ = [
 		]
 
 
-@management.register("actions_deploy_conda", ["enable_conda"])
+@management.register(
+		"actions_deploy_conda",
+		["enable_conda"],
+		writes=[
+				".github/actions_build_conda.sh",
+				".ci/actions_build_conda.sh",
+				".github/actions_deploy_conda.sh",
+				".ci/actions_deploy_conda.sh",
+				],
+		)
 def make_actions_deploy_conda(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Add script to build Conda package and deploy to Anaconda.
@@ -83,7 +92,7 @@ def make_actions_deploy_conda(repo_path: pathlib.Path, templates: Environment) -
 	return [x.relative_to(repo_path).as_posix() for x in files]
 
 
-@management.register("actions_milestones")
+@management.register("actions_milestones", writes=[".github/milestones.py"])
 def make_actions_milestones(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Add script to close milestones on release.
@@ -101,7 +110,16 @@ def make_actions_milestones(repo_path: pathlib.Path, templates: Environment) ->
 	return [milestones_file.relative_to(repo_path).as_posix()]
 
 
-@management.register("actions")
+@management.register(
+		"actions",
+		reads=["pyproject.toml"],
+		writes=[
+				".github/workflows/python_ci.yml",
+				".github/workflows/python_ci_macos.yml",
+				".github/workflows/python_ci_linux.yml",
+				".github/workflows/rustpython_ci_linux.yml",
+				],
+		)
 def make_github_ci(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Add configuration for `GitHub Actions` to the desired repo.
@@ -610,7 +628,7 @@ Mapping of platform names to the GitHub Actions platform tags.
 """
 
 
-@management.register("conda_actions")
+@management.register("conda_actions", reads=["pyproject.toml"], writes=[".github/workflows/conda_ci.yml"])
 def make_conda_actions_ci(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Add configuration for testing conda packages on `GitHub Actions` to the desired repo.
@@ -652,7 +670,7 @@ def make_conda_actions_ci(repo_path: pathlib.Path, templates: Environment) -> Li
 	return [conda_ci_file.relative_to(repo_path).as_posix()]
 
 
-@management.register("manylinux")
+@management.register("manylinux", writes=[".github/workflows/manylinux_build.yml"])
 def make_github_manylinux(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Add configuration for `GitHub Actions` manylinux wheel builds the desired repo.
@@ -705,7 +723,7 @@ def make_github_manylinux(repo_path: pathlib.Path, templates: Environment) -> Li
 	return [file.relative_to(repo_path).as_posix()]
 
 
-@management.register("docs_action")
+@management.register("docs_action", writes=[".github/workflows/docs_test_action.yml"])
 def make_github_docs_test(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Add configuration for GitHub Actions documentation check to the desired repo.
@@ -743,7 +761,7 @@ def make_github_docs_test(repo_path: pathlib.Path, templates: Environment) -> Li
 	return [file.relative_to(repo_path).as_posix()]
 
 
-@management.register("octocheese")
+@management.register("octocheese", writes=[".github/workflows/octocheese.yml"])
 def make_github_octocheese(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Add configuration for the OctoCheese GitHub Action.
@@ -763,7 +781,7 @@ def make_github_octocheese(repo_path: pathlib.Path, templates: Environment) -> L
 	return [file.relative_to(repo_path).as_posix()]
 
 
-@management.register("flake8_action")
+@management.register("flake8_action", writes=[".github/workflows/flake8.yml"])
 def make_github_flake8(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Add configuration for the Flake8 GitHub Action.
@@ -783,7 +801,7 @@ def make_github_flake8(repo_path: pathlib.Path, templates: Environment) -> List[
 	return [filename.as_posix()]
 
 
-@management.register("mypy_action")
+@management.register("mypy_action", writes=[".github/workflows/mypy.yml"])
 def make_github_mypy(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Add configuration for the mypy GitHub Action.
@@ -806,7 +824,7 @@ def make_github_mypy(repo_path: pathlib.Path, templates: Environment) -> List[st
 	return [filename.as_posix()]
 
 
-@management.register("bumpversion")
+@management.register("bumpversion", reads=["{source_dir}/{import_path}/__init__.py"], writes=[".bumpversion.cfg"])
 def ensure_bumpversion(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Add configuration for ``bumpversion`` to the desired repo.
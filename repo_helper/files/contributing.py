@@ -87,7 +87,13 @@ def sphinx_bash_block(*commands: str) -> str:
 	return buf
 
 
-@management.register("contributing")
+@management.register(
+		"contributing",
+		writes=[
+				"CONTRIBUTING.rst",
+				"CONTRIBUTING.md",
+				],
+		)
 def make_contributing(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Add ``CONTRIBUTING.rst`` to the desired repo.
@@ -107,7 +113,7 @@ def make_contributing(repo_path: pathlib.Path, templates: Environment) -> List[s
 	return [file.name, old_file.name]
 
 
-@management.register("contributing", ["enable_docs"])
+@management.register("contributing", ["enable_docs"], writes=["{docs_dir}/contributing.rst"])
 def make_docs_contributing(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Add CONTRIBUTING.rst to the documentation directory of the repo.
@@ -134,7 +140,13 @@ def make_docs_contributing(repo_path: pathlib.Path, templates: Environment) -> L
 	return [file.relative_to(repo_path).as_posix()]
 
 
-@management.register("issue_templates")
+@management.register(
+		"issue_templates",
+		writes=[
+				".github/ISSUE_TEMPLATE/bug_report.md",
+				".github/ISSUE_TEMPLATE/feature_request.md",
+				],
+		)
 def make_issue_templates(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Add issue templates for GitHub to the desired repo.
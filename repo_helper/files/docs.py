@@ -184,7 +184,7 @@ class DocRequirementsManager(RequirementsManager):
 		return comments
 
 
-@management.register("doc_requirements", ["enable_docs"])
+@management.register("doc_requirements", ["enable_docs"], writes=["{docs_dir}/requirements.txt"])
 def ensure_doc_requirements(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Ensure ``<docs_dir>/requirements.txt`` contains the required entries.
@@ -197,7 +197,7 @@ def ensure_doc_requirements(repo_path: pathlib.Path, templates: Environment) ->
 	return [req_file.relative_to(repo_path).as_posix()]
 
 
-@management.register("rtfd", ["enable_docs"])
+@management.register("rtfd", ["enable_docs"], reads=["{docs_dir}/rtd-extra-deps.txt"], writes=[".readthedocs.yml"])
 def make_rtfd(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Add configuration for ``ReadTheDocs``.
@@ -282,7 +282,7 @@ def make_rtfd(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	return [file.relative_to(repo_path).as_posix()]
 
 
-@management.register("docutils_conf", ["enable_docs"])
+@management.register("docutils_conf", ["enable_docs"], writes=["{docs_dir}/docutils.conf"])
 def make_docutils_conf(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Add configuration for ``Docutils``.
@@ -317,7 +317,7 @@ def make_docutils_conf(repo_path: pathlib.Path, templates: Environment) -> List[
 	return [file.relative_to(repo_path).as_posix()]
 
 
-@management.register("conf", ["enable_docs"])
+@management.register("conf", ["enable_docs"], writes=["{docs_dir}/conf.py"])
 def make_conf(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Add ``conf.py`` configuration file for ``Sphinx``.
@@ -607,7 +607,7 @@ def copy_docs_styling(repo_path: pathlib.Path, templates: Environment) -> List[s
 			]
 
 
-@management.register("index.rst", ["enable_docs"])
+@management.register("index.rst", ["enable_docs"], writes=["{docs_dir}/index.rst"])
 def rewrite_docs_index(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Update blocks in the documentation ``index.rst`` file.
@@ -708,7 +708,14 @@ def rewrite_docs_index(repo_path: pathlib.Path, templates: Environment) -> List[
 	return [index_rst_file.relative_to(repo_path).as_posix()]
 
 
-@management.register("404", ["enable_docs"])
+@management.register(
+		"404",
+		["enable_docs"],
+		writes=[
+				"{docs_dir}/404.rst",
+				"{docs_dir}/not-found.png",
+				],
+		)
 def make_404_page(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 
@@ -733,7 +740,15 @@ def make_404_page(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 			]
 
 
-@management.register("Source_rst", ["enable_docs"])
+@management.register(
+		"Source_rst",
+		["enable_docs"],
+		writes=[
+				"{docs_dir}/Source.rst",
+				"{docs_dir}/Building.rst",
+				"{docs_dir}/git_download.png",
+				],
+		)
 def make_docs_source_rst(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Create the "Source" page in the documentation, and add the associated image.
@@ -781,7 +796,7 @@ _docs_license_lookup = {
 		}
 
 
-@management.register("license_rst", ["enable_docs"])
+@management.register("license_rst", ["enable_docs"], writes=["{docs_dir}/license.rst"])
 def make_docs_license_rst(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Create the "License" page in the documentation.
@@ -221,7 +221,7 @@ ignores.extend((
 		))
 
 
-@management.register("gitignore")
+@management.register("gitignore", writes=[".gitignore"])
 def make_gitignore(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Add .gitignore file to the given repository.
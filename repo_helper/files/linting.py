@@ -321,7 +321,7 @@ lint_warn_list.extend([
 		])
 
 
-@management.register("pylintrc")
+@management.register("pylintrc", writes=[".pylintrc"])
 def make_pylintrc(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Copy ``.pylintrc`` into the desired repository.
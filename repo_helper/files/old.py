@@ -45,7 +45,13 @@ __all__ = [
 		]
 
 
-@management.register("travis")
+@management.register(
+		"travis",
+		writes=[
+				".travis.yml",
+				".ci/travis_deploy_conda.sh",
+				],
+		)
 def travis_bad(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Removes Travis CI configuration.
@@ -64,7 +70,7 @@ def travis_bad(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	return [".travis.yml", conda_file.relative_to(repo_path).as_posix()]
 
 
-@management.register("copy_pypi_2_github", ["enable_releases"])
+@management.register("copy_pypi_2_github", ["enable_releases"], writes=[".ci/copy_pypi_2_github.py"])
 def remove_copy_pypi_2_github(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Remove deprecated copy_pypi_2_github.py script.
@@ -82,7 +88,7 @@ def remove_copy_pypi_2_github(repo_path: pathlib.Path, templates: Environment) -
 	return [copier.relative_to(repo_path).as_posix()]
 
 
-@management.register("make_conda_recipe", ["enable_conda"])
+@management.register("make_conda_recipe", ["enable_conda"], writes=["make_conda_recipe.py"])
 def remove_make_conda_recipe(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Remove the old script to create a Conda recipe.
@@ -110,7 +116,11 @@ def remove_make_conda_recipe(repo_path: pathlib.Path, templates: Environment) ->
 # 	return [file.name]
 
 
-@management.register("autodoc_augment_defaults", ["enable_docs"])
+@management.register(
+		"autodoc_augment_defaults",
+		["enable_docs"],
+		writes=["{docs_dir}/autodoc_augment_defaults.py"],
+		)
 def remove_autodoc_augment_defaults(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Remove the redundant "autodoc_augment_defaults" extension.
@@ -127,7 +137,7 @@ def remove_autodoc_augment_defaults(repo_path: pathlib.Path, templates: Environm
 	return [target_file.relative_to(repo_path).as_posix()]
 
 
-@management.register("lint_roller")
+@management.register("lint_roller", writes=["lint_roller.sh"])
 def remove_lint_roller(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Remove the old lint_roller.sh script to the desired repo.
@@ -161,7 +171,7 @@ def make_lint_roller(repo_path: pathlib.Path, templates: Environment) -> List[st
 	return [lint_file.name]
 
 
-@management.register("artefact_cleaner")
+@management.register("artefact_cleaner", writes=[".github/workflows/cleanup.yml"])
 def remove_artefact_cleaner(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Remove configuration for https://github.com/marketplace/actions/github-actions-artifact-cleaner
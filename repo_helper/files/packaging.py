@@ -40,7 +40,6 @@ from shippinglabel.requirements import ComparableRequirement, combine_requiremen
 
 # this package
 import repo_helper.files
-from repo_helper.configupdater2 import ConfigUpdater
 from repo_helper.configuration import _pypy_version_re
 from repo_helper.configuration.utils import get_version_classifiers
 from repo_helper.files import management
@@ -86,7 +85,7 @@ class DefaultDict(Dict[_KT, _VT_co]):
 		return super().__getitem__(item)
 
 
-@management.register("manifest")
+@management.register("manifest", writes=["MANIFEST.in"])
 def make_manifest(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Update the ``MANIFEST.in`` file for ``setuptools``.
@@ -134,7 +133,7 @@ def make_manifest(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 pre_release_re = re.compile(".*(-dev|alpha|beta)", re.IGNORECASE)
 
 
-@management.register("pyproject")
+@management.register("pyproject", reads=["requirements.txt"], writes=["pyproject.toml"])
 def make_pyproject(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Create the ``pyproject.toml`` file for :pep:`517`.
@@ -485,7 +484,7 @@ def make_pyproject(repo_path: pathlib.Path, templates: Environment) -> List[str]
 	return [pyproject_file.name]
 
 
-@management.register("setup")
+@management.register("setup", writes=["setup.py"])
 def make_setup(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Update the ``setup.py`` script.
@@ -542,6 +541,36 @@ class SetupCfgConfig(IniConfigurator):
 			"options.entry_points",
 			]
 
+	section_keys = {
+			"metadata": (
+					"author",
+					"classifiers",
+					"docs_url",
+					"email",
+					"enable_docs",
+					"keywords",
+					"license",
+					"platforms",
+					"pypi_name",
+					"python_versions",
+					"repo_name",
+					"username",
+					"version",
+					),
+			"options": ("import_name", "min_py_version", "requires_python", "stubs_package"),
+			"options.packages.find": ("docs_dir", "tests_dir"),
+			"mypy": ("mypy_plugins", "python_deploy_version"),
+			"options.entry_points": (
+					"console_scripts",
+					"entry_points",
+					"meson_no_py",
+					"use_flit",
+					"use_hatch",
+					"use_maturin",
+					"use_whey",
+					),
+			}
+
 	def __init__(self, repo_path: pathlib.Path, templates: Environment):
 		self._globals = templates.globals
 
@@ -636,9 +665,8 @@ class SetupCfgConfig(IniConfigurator):
 
 	def merge_existing(self, ini_file: pathlib.Path) -> None:
 
-		if ini_file.is_file():
-			existing_config = ConfigUpdater()
-			existing_config.read(str(ini_file))
+		existing_config = self.read_existing(ini_file)
+		if existing_config is not None:
 
 			for section in existing_config.sections_blocks():
 				if section.name == "options.packages.find" and "exclude" in section:
@@ -687,19 +715,17 @@ class SetupCfgConfig(IniConfigurator):
 
 		ini_file = PathPlus(self.base_path / self.filename)
 
-		for section_name in self.managed_sections:
-			getattr(self, re.sub("[:.-]", '_', section_name))()
-
+		self.generate_sections(ini_file)
 		self.merge_existing(ini_file)
 
 		if not self._ini.sections():
 			ini_file.unlink(missing_ok=True)
 		else:
 			self._output.append(str(self._ini))
-			ini_file.write_lines(self._output)
+			self._write(ini_file)
 
 
-@management.register("setup_cfg")
+@management.register("setup_cfg", writes=["setup.cfg"])
 def make_setup_cfg(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Update the ``setup.py`` script.
@@ -740,7 +766,7 @@ def _get_classifiers(__globals: Dict[str, Any]) -> List[str]:
 	return natsorted(classifiers)
 
 
-@management.register("pkginfo")
+@management.register("pkginfo", writes=["__pkginfo__.py"])
 def make_pkginfo(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Update the ``__pkginfo__.py`` file.
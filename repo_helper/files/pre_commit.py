@@ -252,7 +252,12 @@ rust = Repo(
 		)
 
 
-@management.register("pre-commit", ["enable_pre_commit"])
+@management.register(
+		"pre-commit",
+		["enable_pre_commit"],
+		reads=["{source_dir}/{import_path}/__init__.py"],
+		writes=[".pre-commit-config.yaml"],
+		)
 def make_pre_commit(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Add configuration for ``pre-commit``.
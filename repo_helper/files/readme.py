@@ -47,7 +47,7 @@ from repo_helper.templates import Environment
 __all__ = ["rewrite_readme"]
 
 
-@management.register("readme")
+@management.register("readme", writes=["README.rst"])
 def rewrite_readme(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Update blocks in the ``README.rst`` file.
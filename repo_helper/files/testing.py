@@ -106,6 +106,63 @@ class ToxConfig(IniConfigurator):
 			"pytest",
 			]
 
+	# The keys read by get_source_files(), and so by get_mypy_commands().
+	_source_files_keys = (
+			"enable_tests",
+			"extra_lint_paths",
+			"import_name",
+			"meson_no_py",
+			"py_modules",
+			"source_dir",
+			"stubs_package",
+			"tests_dir",
+			"use_maturin",
+			)
+
+	# The testenv:py3XX sections are generated by testenv_py312_dev(), which also adds and removes sections,
+	# so they are always generated.
+	section_keys = {
+			"tox": (
+					*_source_files_keys,
+					"pypi_name",
+					"python_deploy_version",
+					"python_versions",
+					"third_party_version_matrix",
+					"tox_requirements",
+					),
+			"envlists": (*_source_files_keys, "python_deploy_version", "python_versions", "third_party_version_matrix"),
+			"testenv": (
+					"enable_devmode",
+					"enable_tests",
+					"extra_testenv_commands",
+					"import_name",
+					"stubs_package",
+					"tests_dir",
+					"third_party_version_matrix",
+					"tox_testenv_extras",
+					),
+			"testenv:.package": ("enable_devmode", ),
+			"testenv:docs": ("docs_dir", "enable_docs", "python_deploy_version", "tox_testenv_extras"),
+			"testenv:build": ("enable_devmode", "meson_no_py", "tox_build_requirements"),
+			"testenv:lint": (*_source_files_keys, "pypi_name", "python_deploy_version"),
+			"testenv:perflint": ("import_name", "python_deploy_version"),
+			"testenv:mypy": (*_source_files_keys, "mypy_deps", "mypy_version", "python_deploy_version", "tox_testenv_extras"),
+			"testenv:pyup": (*_source_files_keys, "python_deploy_version", "tox_testenv_extras"),
+			"testenv:coverage": ("enable_tests", "pypi_name", "python_deploy_version"),
+			"flake8": ("docs_dir", "min_py_version", "requires_python", "tests_dir"),
+			"coverage:run": ("import_name", ),
+			"coverage:report": ("min_coverage", ),
+			"check-wheel-contents": (
+					"import_name",
+					"meson_no_py",
+					"pure_python",
+					"py_modules",
+					"source_dir",
+					"stubs_package",
+					),
+			"pytest": ("enable_tests", ),
+			}
+
 	def get_setenv(self, prefer_binary: bool = True, setuptools_stdlib: bool = True) -> List[str]:
 		"""
 		Return environment variables to be set in the testenv.
@@ -154,6 +211,17 @@ class ToxConfig(IniConfigurator):
 
 		return self._globals[item]
 
+	def section_inputs(self, section_name: str) -> Dict[str, Any]:  # noqa: D102
+		inputs = super().section_inputs(section_name)
+
+		# Read by get_mypy_dependencies() and get_source_files()
+		inputs["stubs.txt"] = (self.base_path / "stubs.txt").is_file()
+		if self["use_maturin"]:
+			init_file = posixpath.join(self["source_dir"], self["import_name"].replace('.', '/'), "__init__.py")
+			inputs[init_file] = (self.base_path / init_file).is_file()
+
+		return inputs
+
 	def get_source_files(self) -> List[str]:
 		"""
 		Compile the list of source files.
@@ -525,7 +593,7 @@ class ToxConfig(IniConfigurator):
 		``[testenv:lint]``.
 		"""
 
-		self._ini["testenv:lint"]["basepython"] = "python{python_deploy_version}".format(**self._globals)
+		self._ini["testenv:lint"]["basepython"] = f"python{self['python_deploy_version']}"
 		self._ini["testenv:lint"]["changedir"] = "{toxinidir}"
 		self._ini["testenv:lint"]["ignore_errors"] = True
 
@@ -585,7 +653,7 @@ class ToxConfig(IniConfigurator):
 		# 		*self.get_setenv(),
 		# 		"PYTHONWARNINGS=ignore",
 		# 		])
-		self._ini["testenv:perflint"]["basepython"] = "python{python_deploy_version}".format(**self._globals)
+		self._ini["testenv:perflint"]["basepython"] = f"python{self['python_deploy_version']}"
 		self._ini["testenv:perflint"]["changedir"] = "{toxinidir}"
 		self._ini["testenv:perflint"]["ignore_errors"] = True
 
@@ -601,7 +669,7 @@ class ToxConfig(IniConfigurator):
 		``[testenv:mypy]``.
 		"""
 
-		self._ini["testenv:mypy"]["basepython"] = "python{python_deploy_version}".format(**self._globals)
+		self._ini["testenv:mypy"]["basepython"] = f"python{self['python_deploy_version']}"
 		self._ini["testenv:mypy"]["ignore_errors"] = True
 		self._ini["testenv:mypy"]["changedir"] = "{toxinidir}"
 
@@ -622,7 +690,7 @@ class ToxConfig(IniConfigurator):
 		``[testenv:pyup]``.
 		"""
 
-		self._ini["testenv:pyup"]["basepython"] = "python{python_deploy_version}".format(**self._globals)
+		self._ini["testenv:pyup"]["basepython"] = f"python{self['python_deploy_version']}"
 		self._ini["testenv:pyup"]["skip_install"] = True
 		self._ini["testenv:pyup"]["ignore_errors"] = True
 		self._ini["testenv:pyup"]["changedir"] = "{toxinidir}"
@@ -750,9 +818,9 @@ class ToxConfig(IniConfigurator):
 		self._ini["check-wheel-contents"]["ignore"] = "W002"
 
 		if self["py_modules"]:
-			self._ini["check-wheel-contents"]["toplevel"] = "{import_name}.py".format(**self._globals)
+			self._ini["check-wheel-contents"]["toplevel"] = f"{self['import_name']}.py"
 		elif self["stubs_package"]:
-			self._ini["check-wheel-contents"]["toplevel"] = "{import_name}-stubs".format(**self._globals)
+			self._ini["check-wheel-contents"]["toplevel"] = f"{self['import_name']}-stubs"
 
 			if self["pure_python"]:
 				# Don't check contents for packages with binary extensions
@@ -788,9 +856,8 @@ class ToxConfig(IniConfigurator):
 		:param ini_file: The existing ``.ini`` file.
 		"""
 
-		if ini_file.is_file():
-			existing_config = ConfigUpdater()
-			existing_config.read(str(ini_file))
+		existing_config = self.read_existing(ini_file)
+		if existing_config is not None:
 
 			if "fixups" in self["tox_unmanaged"]:
 				for env in self._get_third_party_envs_list():
@@ -875,7 +942,14 @@ class ToxConfig(IniConfigurator):
 	#     tox.ini
 
 
-@management.register("tox")
+@management.register(
+		"tox",
+		reads=[
+				"stubs.txt",
+				"{source_dir}/{import_path}/__init__.py",
+				],
+		writes=["tox.ini"],
+		)
 def make_tox(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Add configuration for ``Tox``.
@@ -890,7 +964,7 @@ def make_tox(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	return [ToxConfig.filename]
 
 
-@management.register("yapf")
+@management.register("yapf", writes=[".style.yapf"])
 def make_yapf(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Add configuration for ``yapf``.
@@ -965,6 +1039,11 @@ def make_isort(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 # 	return [isort_file.name]
 
 
+@management.register(
+		"formate",
+		reads=["requirements.txt", "{tests_dir}/requirements.txt"],
+		writes=["formate.toml", ".isort.cfg"],
+		)
 def make_formate_toml(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Add configuration for ``formate``.
@@ -1135,7 +1214,7 @@ class TestsRequirementsManager(RequirementsManager):
 		return comments
 
 
-@management.register("test_requirements", ["enable_tests"])
+@management.register("test_requirements", ["enable_tests"], writes=["{tests_dir}/requirements.txt"])
 def ensure_tests_requirements(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Ensure ``tests/requirements.txt`` contains the required entries.
@@ -1148,7 +1227,7 @@ def ensure_tests_requirements(repo_path: pathlib.Path, templates: Environment) -
 	return [(PathPlus(templates.globals["tests_dir"]) / "requirements.txt").as_posix()]
 
 
-@management.register("justfile")
+@management.register("justfile", writes=["justfile"])
 def make_justfile(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 	Add configuration for ``just``.
@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+#
+#  fleet.py
+"""
+Run ``repo_helper`` for many repositories in a pool of worker processes.
+
+Compiled templates are shared through the :class:`~repo_helper.templates.TemplateBytecodeCache`,
+so they are only compiled once rather than once per repository.
+Workers are replaced after a number of repositories to bound their memory usage.
+
+.. versionadded:: 2026.10.16
+"""
+#
+#  Copyright © 2026 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+
+# stdlib
+import glob
+import multiprocessing
+import os
+import time
+from functools import partial
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+# 3rd party
+from domdf_python_tools.paths import PathPlus
+from domdf_python_tools.typing import PathLike
+
+__all__ = ["RepoResult", "expand_paths", "run_fleet", "summarise"]
+
+
+class RepoResult(NamedTuple):
+	"""
+	The result of running ``repo_helper`` for one repository.
+	"""
+
+	#: The path to the repository.
+	path: str
+
+	#: Either ``'changed'``, ``'unchanged'`` or ``'failed'``.
+	status: str
+
+	#: The files which were changed, relative to the repository root.
+	changed_files: List[str]
+
+	#: The time taken, in seconds.
+	duration: float
+
+	#: The error message, if the run failed.
+	error: Optional[str] = None
+
+
+def _run_repo(path: str, dry_run: bool = False) -> RepoResult:
+	"""
+	Run ``repo_helper`` for the given repository.
+
+	:param path:
+	:param dry_run: Don't write any files to the repository.
+	"""
+
+	# this package
+	from repo_helper.core import RepoHelper
+
+	start = time.perf_counter()
+
+	try:
+		rh = RepoHelper(path)
+		rh.load_settings()
+		rh.run(dry_run=dry_run)
+	except Exception as e:  # pylint: disable=broad-except
+		return RepoResult(path, "failed", [], time.perf_counter() - start, f"{type(e).__name__}: {e}")
+
+	changed_files = [change.filename for change in rh.changes]
+	status = "changed" if changed_files else "unchanged"
+	return RepoResult(path, status, changed_files, time.perf_counter() - start)
+
+
+def expand_paths(paths: Iterable[str]) -> List[str]:
+	"""
+	Expand glob patterns in ``paths``, and return the directories which contain a ``repo_helper.yml`` file.
+
+	:param paths: Paths to repositories, or glob patterns matching them.
+	"""
+
+	repos: Dict[str, None] = {}
+
+	for path in paths:
+		if any(char in path for char in "*?["):
+			matches = sorted(glob.glob(os.path.expanduser(path)))
+		else:
+			matches = [os.path.expanduser(path)]
+
+		for match in matches:
+			if (PathPlus(match) / "repo_helper.yml").is_file():
+				repos[os.path.abspath(match)] = None
+
+	return list(repos)
+
+
+def run_fleet(
+		paths: Iterable[PathLike],
+		processes: Optional[int] = None,
+		dry_run: bool = False,
+		max_tasks_per_child: Optional[int] = 50,
+		) -> Iterator[RepoResult]:
+	"""
+	Run ``repo_helper`` for each of the given repositories.
+
+	Results are yielded as each repository finishes, which may not be the order of ``paths``.
+
+	:param paths: Paths to the repositories.
+	:param processes: The number of worker processes. Defaults to the number of CPUs.
+	:param dry_run: Don't write any files to the repositories.
+	:param max_tasks_per_child: The number of repositories each worker process handles before being replaced.
+		:py:obj:`None` to keep workers for the life of the pool.
+	"""
+
+	paths = [os.fspath(path) for path in paths]
+	if not paths:
+		return
+
+	processes = min(processes or os.cpu_count() or 1, len(paths))
+
+	with multiprocessing.Pool(
+			processes=processes,
+			maxtasksperchild=max_tasks_per_child,
+			) as pool:
+		yield from pool.imap_unordered(partial(_run_repo, dry_run=dry_run), paths)
+
+
+def summarise(results: Iterable[RepoResult], duration: float) -> Dict[str, Any]:
+	"""
+	Aggregate the results of :func:`~.run_fleet` into a JSON-serialisable report.
+
+	:param results:
+	:param duration: The total time taken, in seconds.
+	"""
+
+	results = sorted(results, key=lambda result: result.path)
+	counts = {"changed": 0, "unchanged": 0, "failed": 0}
+
+	for result in results:
+		counts[result.status] += 1
+
+	return {
+			"repositories": [result._asdict() for result in results],
+			"summary": {**counts, "total": len(results), "duration": round(duration, 3)},
+			}
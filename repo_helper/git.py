@@ -0,0 +1,1413 @@
+#!/usr/bin/env python
+#
+#  git.py
+"""
+Git operations on the files managed by ``repo_helper``.
+
+Rather than checking the whole working tree, only the managed files are compared with the index and ``HEAD``.
+A :class:`~.GitSession` opens the repository once, and is shared by the steps of a ``repo_helper`` run.
+
+Two git backends are available: :class:`~.DulwichSession`, which uses dulwich and is the default,
+and :class:`~.GitCLISession`, which runs the ``git`` executable and is faster for large repositories.
+The backend is chosen with the ``REPO_HELPER_GIT_BACKEND`` environment variable.
+
+.. versionadded:: 2026.10.16
+"""
+#
+#  Copyright © 2026 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+
+# stdlib
+import binascii
+import json
+import os
+import shlex
+import shutil
+import stat
+import struct
+import subprocess  # nosec: B404
+import sys
+import tempfile
+from abc import ABC, abstractmethod
+from datetime import datetime
+from types import TracebackType
+from typing import Collection, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Type, Union
+
+# 3rd party
+import click
+import dulwich.repo
+from consolekit.terminal_colours import Fore, strip_ansi
+from domdf_python_tools.paths import PathPlus, in_directory
+from domdf_python_tools.typing import PathLike
+from dulwich.errors import CommitError
+from dulwich.ignore import IgnoreFilterManager
+from dulwich.index import ConflictedIndexEntry, Index
+from dulwich.index import IndexEntry as DulwichIndexEntry
+from dulwich.index import blob_from_path_and_stat, get_unstaged_changes, index_entry_from_stat
+from dulwich.object_store import tree_lookup_path
+from dulwich.objects import parse_timezone
+from dulwich.porcelain import tag_create
+from southwark import GitStatus, StagedDict, format_git_status, get_tags, get_untracked_paths, open_repo_closing
+from southwark.log import Log
+from southwark.repo import Repo
+
+# this package
+from repo_helper.profiling import span
+
+__all__ = [
+		"CommitInfo",
+		"DulwichSession",
+		"GitCLISession",
+		"GitSession",
+		"IndexEntry",
+		"SessionLog",
+		"git_backends",
+		"managed_status",
+		"open_session",
+		"read_index_entries",
+		]
+
+_ENTRY_HEADER = struct.Struct(">LLLLLLLLLL20sH")
+_FLAG_EXTENDED = 0x4000
+_FLAG_NAMEMASK = 0x0fff
+
+
+class IndexEntry(NamedTuple):
+	"""
+	The parts of an entry in the git index which are needed to tell whether a file changed.
+	"""
+
+	#: The file mode.
+	mode: int
+
+	#: The hex SHA of the blob.
+	sha: bytes
+
+	#: The modification time of the file when it was staged, in nanoseconds.
+	mtime_ns: int
+
+	#: The size of the file when it was staged.
+	size: int
+
+	#: The merge stage. Non-zero if the file has conflicts.
+	stage: int = 0
+
+
+def read_index_entries(index_path: PathLike, paths: Collection[bytes]) -> Dict[bytes, List[IndexEntry]]:
+	"""
+	Read the entries for the given paths from a git index file.
+
+	Only the entries for ``paths`` are decoded, rather than the whole index.
+
+	:param index_path: The path to the index file.
+	:param paths: The paths to read, relative to the repository root, as used in the index.
+
+	:returns: A mapping of paths to their entries (more than one if the file has conflicts).
+		Paths which are not in the index are omitted.
+	"""
+
+	try:
+		with open(index_path, "rb") as fp:
+			data = fp.read()
+	except FileNotFoundError:
+		return {}
+
+	if data[:4] != b"DIRC":
+		raise ValueError(f"Invalid index file header: {data[:4]!r}")
+
+	version, num_entries = struct.unpack_from(">LL", data, 4)
+	if version not in {2, 3}:
+		# Version 4 compresses paths, so every entry must be decoded.
+		return _read_index_entries_dulwich(index_path, paths)
+
+	paths = set(paths)
+	entries: Dict[bytes, List[IndexEntry]] = {}
+	header_size = _ENTRY_HEADER.size
+	offset = 12
+
+	for _ in range(num_entries):
+		flags = int.from_bytes(data[offset + 60:offset + 62], "big")
+		name_start = offset + header_size + (2 if flags & _FLAG_EXTENDED else 0)
+
+		name_length = flags & _FLAG_NAMEMASK
+		if name_length == _FLAG_NAMEMASK:
+			name_length = data.index(b"\0", name_start) - name_start
+
+		name_end = name_start + name_length
+		name = data[name_start:name_end]
+
+		if name in paths:
+			(
+					_ctime_s,
+					_ctime_ns,
+					mtime_s,
+					mtime_ns,
+					_dev,
+					_ino,
+					mode,
+					_uid,
+					_gid,
+					size,
+					sha,
+					_flags,
+					) = _ENTRY_HEADER.unpack_from(data, offset)
+
+			entries.setdefault(name, []).append(
+					IndexEntry(
+							mode=mode,
+							sha=binascii.hexlify(sha),
+							mtime_ns=mtime_s * 1_000_000_000 + mtime_ns,
+							size=size,
+							stage=(flags >> 12) & 3,
+							)
+					)
+
+		# Entries are padded with 1-8 NUL bytes to a multiple of 8 bytes.
+		offset += (name_end - offset + 8) & ~7
+
+	return entries
+
+
+def _read_index_entries_dulwich(index_path: PathLike, paths: Iterable[bytes]) -> Dict[bytes, List[IndexEntry]]:
+	return _index_entries(Index(os.fspath(index_path)), paths)
+
+
+def _index_entries(index: Index, paths: Iterable[bytes]) -> Dict[bytes, List[IndexEntry]]:
+	entries: Dict[bytes, List[IndexEntry]] = {}
+
+	for path in paths:
+		if path not in index:
+			continue
+
+		index_entry = index[path]
+		if isinstance(index_entry, ConflictedIndexEntry):
+			stages = [(1, index_entry.ancestor), (2, index_entry.this), (3, index_entry.other)]
+		else:
+			stages = [(0, index_entry)]
+
+		for stage_number, entry in stages:
+			if entry is None:
+				continue
+
+			if isinstance(entry.mtime, tuple):
+				mtime_ns = entry.mtime[0] * 1_000_000_000 + entry.mtime[1]
+			else:
+				mtime_ns = int(entry.mtime * 1_000_000_000)
+
+			entries.setdefault(path, []).append(IndexEntry(entry.mode, entry.sha, mtime_ns, entry.size, stage_number))
+
+	return entries
+
+
+def _index_entry_from_stat(st: os.stat_result, sha: bytes) -> DulwichIndexEntry:
+	try:
+		return index_entry_from_stat(st, sha)
+	except TypeError:  # pragma: no cover
+		# dulwich < 0.21 also takes the entry's flags
+		return index_entry_from_stat(st, sha, 0)  # type: ignore[call-arg]
+
+
+def managed_status(
+		repo: Union[PathLike, dulwich.repo.Repo],
+		files: Iterable[PathLike],
+		index: Optional[Index] = None,
+		) -> GitStatus:
+	"""
+	Returns the staged, unstaged and untracked changes to the given files.
+
+	Unlike :func:`southwark.status` only the given files are checked, rather than the whole working tree.
+	Files whose modification time and size match the index are assumed to be unchanged, as with ``git status``.
+
+	:param repo: The repository.
+	:param files: The files to check, either absolute or relative to the repository root.
+	:param index: The repository's index, if it has already been read.
+	"""
+
+	with open_repo_closing(repo) as repo:
+		repo_path = PathPlus(repo.path)
+
+		filenames: Dict[bytes, PathPlus] = {}
+		for filename in map(PathPlus, files):
+			if filename.is_absolute():
+				filename = filename.relative_to(repo_path)
+			filenames.setdefault(filename.as_posix().encode("UTF-8"), filename)
+
+		index_path = repo.index_path()
+		if index is None:
+			index_entries = read_index_entries(index_path, filenames)
+		else:
+			index_entries = _index_entries(index, filenames)
+
+		try:
+			# Files modified in the same instant the index was written can't be trusted to match (racy git).
+			index_mtime_ns: Optional[int] = os.stat(index_path).st_mtime_ns
+		except FileNotFoundError:
+			index_mtime_ns = None
+
+		try:
+			head_tree: Optional[bytes] = repo[b"HEAD"].tree  # type: ignore[attr-defined]
+		except KeyError:
+			head_tree = None
+
+		normalizer = repo.get_blob_normalizer()
+		ignore_manager: Optional[IgnoreFilterManager] = None
+
+		staged: StagedDict = {"add": [], "delete": [], "modify": []}
+		unstaged: List[PathPlus] = []
+		untracked: List[PathPlus] = []
+
+		for tree_path, filename in filenames.items():
+			entries = index_entries.get(tree_path, [])
+
+			if any(entry.stage for entry in entries):
+				# Conflicted files are always unstaged.
+				unstaged.append(filename)
+				continue
+
+			entry = entries[0] if entries else None
+
+			# Index vs HEAD
+			head_entry: Optional[Tuple[int, bytes]] = None
+			if head_tree is not None:
+				try:
+					head_entry = tree_lookup_path(repo.object_store.__getitem__, head_tree, tree_path)
+				except KeyError:
+					pass
+
+			if entry is not None and head_entry is None:
+				staged["add"].append(filename)
+			elif entry is None and head_entry is not None:
+				staged["delete"].append(filename)
+			elif entry is not None and head_entry is not None and head_entry != (entry.mode, entry.sha):
+				staged["modify"].append(filename)
+
+			# Working tree vs index
+			full_path = os.path.join(repo_path, filename)
+			try:
+				st = os.lstat(full_path)
+			except FileNotFoundError:
+				if entry is not None:
+					unstaged.append(filename)
+				continue
+
+			if not (stat.S_ISREG(st.st_mode) or stat.S_ISLNK(st.st_mode)):
+				continue
+
+			if entry is None:
+				if ignore_manager is None:
+					ignore_manager = IgnoreFilterManager.from_repo(repo)
+				if not ignore_manager.is_ignored(filename.as_posix()):
+					untracked.append(filename)
+
+			elif (
+					st.st_mtime_ns != entry.mtime_ns or st.st_size != entry.size
+					or index_mtime_ns is None or entry.mtime_ns >= index_mtime_ns
+					):
+				blob = blob_from_path_and_stat(os.fsencode(full_path), st)
+				blob = normalizer.checkin_normalize(blob, tree_path)
+				if blob.id != entry.sha:
+					unstaged.append(filename)
+
+		return GitStatus(staged, unstaged, untracked)
+
+
+class CommitInfo(NamedTuple):
+	"""
+	A commit, as returned by :meth:`GitSession.iter_commits`.
+
+	The attributes are the same as those of :class:`dulwich.objects.Commit`.
+	"""
+
+	#: The hex SHA of the commit.
+	id: bytes  # noqa: A003  # pylint: disable=redefined-builtin
+
+	#: The hex SHAs of the commit's parents.
+	parents: List[bytes]
+
+	#: The commit's author, as ``Name <email>``.
+	author: bytes
+
+	#: The commit's committer, as ``Name <email>``.
+	committer: bytes
+
+	#: The time the commit was authored, in seconds since the epoch.
+	author_time: int
+
+	#: The offset of the author's timezone from UTC, in seconds.
+	author_timezone: int
+
+	#: The time the commit was committed, in seconds since the epoch.
+	commit_time: int
+
+	#: The commit message.
+	message: bytes
+
+
+class GitSession(ABC):
+	"""
+	A git repository which is opened once and shared by the steps of a ``repo_helper`` run.
+
+	The status of the repository is read the first time it is needed and then reused.
+	It is read again after changes are staged or committed through the session,
+	or after :meth:`~.invalidate` is called.
+
+	Can be used as a context manager, which closes the repository on exit.
+
+	This is the abstract base class for the git backends. Use :func:`~.open_session` to open a repository
+	with the configured backend.
+
+	:param repo_path: The path to the repository root.
+	"""
+
+	def __init__(self, repo_path: PathLike):
+		#: The path to the repository root.
+		self.path = PathPlus(repo_path)
+
+		self._staged: Optional[StagedDict] = None
+		self._unstaged: Optional[List[PathPlus]] = None
+		self._untracked: Optional[List[PathPlus]] = None
+
+	def invalidate(self) -> None:
+		"""
+		Discard the cached status, for example after files are changed outside the session.
+		"""
+
+		self._staged = None
+		self._unstaged = None
+		self._untracked = None
+
+	def staged(self) -> StagedDict:
+		"""
+		Returns the changes in the index relative to ``HEAD``.
+		"""
+
+		if self._staged is None:
+			with span("staged", "git"):
+				self._staged = self._read_staged()
+
+		return self._staged
+
+	def unstaged(self) -> List[PathPlus]:
+		"""
+		Returns the files in the working tree which differ from the index.
+		"""
+
+		if self._unstaged is None:
+			with span("unstaged", "git"):
+				self._unstaged = self._read_unstaged()
+
+		return self._unstaged
+
+	def untracked(self) -> List[PathPlus]:
+		"""
+		Returns the files in the working tree which are not in the index, and are not ignored.
+		"""
+
+		if self._untracked is None:
+			with span("untracked", "git"):
+				self._untracked = self._read_untracked()
+
+		return self._untracked
+
+	@abstractmethod
+	def _read_staged(self) -> StagedDict:
+		"""
+		Read the changes in the index relative to ``HEAD``, for :meth:`~.staged`.
+		"""
+
+	@abstractmethod
+	def _read_unstaged(self) -> List[PathPlus]:
+		"""
+		Read the files in the working tree which differ from the index, for :meth:`~.unstaged`.
+		"""
+
+	@abstractmethod
+	def _read_untracked(self) -> List[PathPlus]:
+		"""
+		Read the untracked files which are not ignored, for :meth:`~.untracked`.
+		"""
+
+	def status(self) -> GitStatus:
+		"""
+		Returns the staged, unstaged and untracked changes in the repository.
+		"""
+
+		return GitStatus(self.staged(), self.unstaged(), self.untracked())
+
+	def assert_clean(self, allow_config: Sequence[PathLike] = ()) -> bool:
+		"""
+		Returns :py:obj:`True` if the working directory is clean.
+
+		If not, returns :py:obj:`False` and prints a helpful error message to stderr.
+
+		Untracked files are ignored, so they are only looked for if the working directory isn't clean.
+
+		:param allow_config: Files which may have been modified.
+		"""
+
+		allowed = {PathPlus(filename) for filename in allow_config}
+		staged = self.staged()
+
+		modified_files = {*staged["add"], *staged["delete"], *staged["modify"], *self.unstaged()}
+		if modified_files <= allowed:
+			return True
+
+		click.echo(Fore.RED("Git working directory is not clean:"), err=True)
+
+		for line in format_git_status(self.status()):
+			click.echo(Fore.RED(f"  {line}"), err=True)
+
+		return False
+
+	@abstractmethod
+	def managed_status(self, files: Iterable[PathLike]) -> GitStatus:
+		"""
+		Returns the staged, unstaged and untracked changes to the given files.
+
+		Only the given files are checked, rather than the whole working tree.
+
+		:param files: The files to check, either absolute or relative to the repository root.
+		"""
+
+	@abstractmethod
+	def stage(self, files: Iterable[PathLike]) -> None:
+		"""
+		Stage the given files, or remove them from the index if they have been deleted.
+
+		The index is written once, however many files are staged.
+
+		:param files: The files to stage, either absolute or relative to the repository root.
+		"""
+
+	def stage_changes(self, files: Iterable[PathLike]) -> List[PathPlus]:
+		"""
+		Stage any of the given files which have been updated, added or removed.
+
+		:param files: The files to stage, either absolute or relative to the repository root.
+
+		:returns: A list of staged files.
+			Not all files in ``files`` will have been changed, and only changes are staged.
+		"""
+
+		with span("stage_changes", "git"):
+			files = [self._relative(filename) for filename in files]
+
+			with span("status", "git"):
+				changes = self.managed_status(files)
+
+			to_stage = {*changes.unstaged, *changes.untracked}
+			already_staged = {*changes.staged["add"], *changes.staged["modify"], *changes.staged["delete"]}
+
+			staged_files = []
+			changed_files = []
+
+			for filename in files:
+				if filename in to_stage:
+					changed_files.append(filename)
+					staged_files.append(filename)
+
+				elif filename in already_staged:
+					staged_files.append(filename)
+
+			if changed_files:
+				self.stage(changed_files)
+
+		return staged_files
+
+	@abstractmethod
+	def commit(self, message: str = "Updated files with 'repo_helper'.") -> str:
+		"""
+		Commit staged changes, running the repository's commit hooks.
+
+		:param message: The commit message to use.
+
+		:returns: The SHA of the commit.
+
+		:raises dulwich.errors.CommitError: If the commit failed, for example because a hook failed.
+		"""
+
+	@abstractmethod
+	def tags(self) -> Dict[str, str]:
+		"""
+		Returns a mapping of commit SHAs to tags.
+		"""
+
+	@abstractmethod
+	def tag_create(self, tag: str) -> None:
+		"""
+		Create a lightweight tag pointing to ``HEAD``.
+
+		:param tag: The name of the tag.
+		"""
+
+	@abstractmethod
+	def refs(self) -> Dict[str, str]:
+		"""
+		Returns a mapping of refs, other than tags, to commit SHAs.
+
+		``HEAD`` is included unless the current branch has no commits.
+		"""
+
+	@abstractmethod
+	def current_branch(self) -> str:
+		"""
+		Returns the name of the current branch, or an empty string if ``HEAD`` is detached.
+		"""
+
+	@abstractmethod
+	def head(self) -> Optional[str]:
+		"""
+		Returns the SHA of the commit ``HEAD`` points to, or :py:obj:`None` if there are no commits yet.
+		"""
+
+	def commits_since(self, sha: str) -> Optional[int]:
+		"""
+		Returns the number of commits reachable from ``HEAD`` which are not reachable from the given commit.
+
+		The walk stops at ``sha`` rather than continuing through its ancestors.
+		The result is cached on disk, keyed on the SHAs of ``HEAD`` and ``sha``.
+
+		:param sha: The SHA of a commit, such as the one a release was tagged at.
+
+		:returns: The number of commits, or :py:obj:`None` if ``sha`` is not an ancestor of ``HEAD``.
+		"""
+
+		head = self.head()
+		if head is None:
+			return None
+
+		cache = _CommitCountCache()
+		key = f"{sha}..{head}"
+
+		if key in cache:
+			return cache[key]
+
+		with span("commits_since", "git"):
+			count = cache[key] = self._count_commits_since(head, sha)
+
+		cache.save()
+		return count
+
+	@abstractmethod
+	def _count_commits_since(self, head: str, sha: str) -> Optional[int]:
+		"""
+		Count the commits reachable from ``head`` which are not reachable from ``sha``, for :meth:`~.commits_since`.
+
+		:param head: The SHA of ``HEAD``.
+		:param sha:
+		"""
+
+	@abstractmethod
+	def iter_commits(
+			self,
+			max_entries: Optional[int] = None,
+			reverse: bool = False,
+			since: Optional[float] = None,
+			) -> Iterator[CommitInfo]:
+		"""
+		Iterate over the commits reachable from ``HEAD``, newest first.
+
+		:param max_entries: The maximum number of commits.
+		:param reverse: Return the commits oldest first. This is applied after ``max_entries``.
+		:param since: Only return commits made after this time, in seconds since the epoch.
+		"""
+
+	@property
+	@abstractmethod
+	def git_dir(self) -> PathPlus:
+		"""
+		The path to the ``.git`` directory which contains the hooks.
+		"""
+
+	@abstractmethod
+	def _hooks_path_set(self) -> bool:
+		"""
+		Returns whether the ``core.hooksPath`` option is set, in which case ``pre-commit`` won't install its hook.
+		"""
+
+	def pre_commit_installed(self) -> bool:
+		"""
+		Returns whether the ``pre-commit`` git hook is installed, and is the same as ``pre-commit install`` would write.
+		"""
+
+		# 3rd party
+		from pre_commit.commands.install_uninstall import TEMPLATE_END, TEMPLATE_START  # type: ignore[import-untyped]
+		from pre_commit.util import resource_text  # type: ignore[import-untyped]
+
+		if self._hooks_path_set():
+			# pre-commit refuses to install the hook.
+			return False
+
+		config_file = self.path / ".pre-commit-config.yaml"
+		if config_file.is_file() and "default_install_hook_types" in config_file.read_text():
+			# Other hooks may also need to be installed.
+			return False
+
+		hook_path = self.git_dir / "hooks" / "pre-commit"
+		if not os.access(hook_path, os.X_OK):
+			return False
+
+		# The same as pre-commit's _install_hook_script
+		try:
+			before, rest = resource_text("hook-tmpl").split(TEMPLATE_START)
+			_, after = rest.split(TEMPLATE_END)
+		except ValueError:
+			return False
+
+		args = ["hook-impl", "--config=.pre-commit-config.yaml", "--hook-type=pre-commit"]
+		expected = ''.join([
+				before,
+				TEMPLATE_START,
+				f"INSTALL_PYTHON={shlex.quote(sys.executable)}\n",
+				f"ARGS=({' '.join(map(shlex.quote, args))})\n",
+				TEMPLATE_END,
+				after,
+				])
+
+		return hook_path.read_text() == expected
+
+	def install_pre_commit(self) -> None:
+		"""
+		Install the ``pre-commit`` git hook, unless it is already installed.
+
+		:raises ImportError: If ``pre-commit`` is not installed.
+		"""
+
+		# 3rd party
+		import pre_commit.main  # type: ignore[import-untyped]
+
+		with span("install", "pre-commit"):
+			if not self.pre_commit_installed():
+				with in_directory(self.path):
+					pre_commit.main.main(["install"])
+
+	def _relative(self, filename: PathLike) -> PathPlus:
+		filename = PathPlus(filename)
+		if filename.is_absolute():
+			filename = filename.relative_to(self.path)
+		return filename
+
+	def close(self) -> None:
+		"""
+		Close the repository.
+		"""
+
+		self.invalidate()
+
+	def __enter__(self) -> "GitSession":
+		return self
+
+	def __exit__(
+			self,
+			exc_type: Optional[Type[BaseException]],
+			exc_val: Optional[BaseException],
+			exc_tb: Optional[TracebackType],
+			) -> None:
+		self.close()
+
+
+class DulwichSession(GitSession):
+	"""
+	A :class:`~.GitSession` which uses :mod:`dulwich`, a pure-Python implementation of git.
+
+	The index is read once and cached with the status.
+	Changes are staged by updating the cached index and writing it once.
+
+	:param repo: The repository, or the path to it.
+		If a :class:`dulwich.repo.Repo` is given it is not closed with the session.
+	"""
+
+	#: The repository.
+	repo: dulwich.repo.Repo
+
+	def __init__(self, repo: Union[PathLike, dulwich.repo.Repo]):
+		if isinstance(repo, dulwich.repo.Repo):
+			self.repo = repo
+			self._owns_repo = False
+		else:
+			self.repo = Repo(os.fspath(repo))
+			self._owns_repo = True
+
+		super().__init__(self.repo.path)
+		self._index: Optional[Index] = None
+
+	@property
+	def index(self) -> Index:
+		"""
+		The repository's index.
+		"""
+
+		if self._index is None:
+			with span("read index", "git"):
+				self._index = self.repo.open_index()
+
+		return self._index
+
+	def invalidate(self) -> None:
+		"""
+		Discard the cached index and status, for example after files are changed outside the session.
+		"""
+
+		super().invalidate()
+		self._index = None
+
+	def _read_staged(self) -> StagedDict:
+		staged: StagedDict = {"add": [], "delete": [], "modify": []}
+
+		try:
+			head_tree: Optional[bytes] = self.repo[b"HEAD"].tree  # type: ignore[attr-defined]
+		except KeyError:
+			head_tree = None
+
+		for (old_path, new_path), _, _ in self.index.changes_from_tree(self.repo.object_store, head_tree):
+			if not old_path:
+				staged["add"].append(PathPlus(new_path.decode("UTF-8")))
+			elif not new_path:
+				staged["delete"].append(PathPlus(old_path.decode("UTF-8")))
+			else:
+				staged["modify"].append(PathPlus(old_path.decode("UTF-8")))
+
+		return staged
+
+	def _read_unstaged(self) -> List[PathPlus]:
+		filter_callback = self.repo.get_blob_normalizer().checkin_normalize
+		return [
+				PathPlus(path.decode("UTF-8"))
+				for path in get_unstaged_changes(self.index, os.fspath(self.path), filter_callback)
+				]
+
+	def _read_untracked(self) -> List[PathPlus]:
+		ignore_manager = IgnoreFilterManager.from_repo(self.repo)
+		return [
+				PathPlus(path)
+				for path in get_untracked_paths(self.path, self.index)
+				if not ignore_manager.is_ignored(path)
+				]
+
+	def managed_status(self, files: Iterable[PathLike]) -> GitStatus:  # noqa: D102
+		return managed_status(self.repo, files, index=self.index)
+
+	def stage(self, files: Iterable[PathLike]) -> None:  # noqa: D102
+		index = self.index
+		normalizer = self.repo.get_blob_normalizer()
+		object_store = self.repo.object_store
+
+		with span("stage", "git"):
+			for filename in map(self._relative, files):
+				tree_path = filename.as_posix().encode("UTF-8")
+				full_path = os.fsencode(self.path / filename)
+
+				try:
+					st = os.lstat(full_path)
+				except (FileNotFoundError, NotADirectoryError):
+					st = None
+
+				if st is None or not (stat.S_ISREG(st.st_mode) or stat.S_ISLNK(st.st_mode)):
+					# Deleted, or replaced by a directory.
+					if tree_path in index:
+						del index[tree_path]
+					continue
+
+				blob = normalizer.checkin_normalize(blob_from_path_and_stat(full_path, st), tree_path)
+				object_store.add_object(blob)
+				index[tree_path] = _index_entry_from_stat(st, blob.id)
+
+			index.write()
+
+		# The index in memory is up to date, but the status isn't.
+		super().invalidate()
+
+	def commit(self, message: str = "Updated files with 'repo_helper'.") -> str:  # noqa: D102
+		# this package
+		from repo_helper.utils import commit_changes
+
+		if "pre-commit" in self.repo.hooks:
+			# Ensure the working directory for pre-commit is correct
+			self.repo.hooks["pre-commit"].cwd = os.fspath(self.path)  # type: ignore[attr-defined]
+
+		try:
+			return commit_changes(self.repo, message)
+		finally:
+			self.invalidate()
+
+	def tags(self) -> Dict[str, str]:  # noqa: D102
+		return get_tags(self.repo)
+
+	def tag_create(self, tag: str) -> None:  # noqa: D102
+		tag_create(self.repo, tag)
+
+	def refs(self) -> Dict[str, str]:  # noqa: D102
+		return {
+				ref.decode("UTF-8"): sha.decode("UTF-8")
+				for ref, sha in self.repo.get_refs().items()
+				if not ref.startswith(b"refs/tags/")
+				}
+
+	def current_branch(self) -> str:  # noqa: D102
+		ref = self.repo.refs.follow(b"HEAD")[0][-1]
+		return ref[11:].decode("UTF-8") if ref.startswith(b"refs/heads/") else ''
+
+	def head(self) -> Optional[str]:  # noqa: D102
+		try:
+			return self.repo.head().decode("ASCII")
+		except KeyError:
+			return None
+
+	def _count_commits_since(self, head: str, sha: str) -> Optional[int]:
+		if head == sha:
+			return 0
+
+		count = 0
+		reachable = False
+
+		# Excluding sha hides its ancestors, so the walk stops when only they remain.
+		for entry in self.repo.get_walker(include=[head.encode("ASCII")], exclude=[sha.encode("ASCII")]):
+			count += 1
+			if sha.encode("ASCII") in entry.commit.parents:
+				reachable = True
+
+		return count if reachable else None
+
+	def iter_commits(  # noqa: D102
+		self,
+		max_entries: Optional[int] = None,
+		reverse: bool = False,
+		since: Optional[float] = None,
+		) -> Iterator[CommitInfo]:
+		try:
+			walker = self.repo.get_walker(max_entries=max_entries, reverse=reverse, since=since)
+		except KeyError:
+			# No commits yet.
+			return
+
+		for entry in walker:
+			commit = entry.commit
+			yield CommitInfo(
+					id=commit.id,
+					parents=list(commit.parents),
+					author=commit.author,
+					committer=commit.committer,
+					author_time=commit.author_time,
+					author_timezone=commit.author_timezone,
+					commit_time=commit.commit_time,
+					message=commit.message,
+					)
+
+	@property
+	def git_dir(self) -> PathPlus:  # noqa: D102
+		return PathPlus(self.repo.commondir())
+
+	def _hooks_path_set(self) -> bool:
+		try:
+			self.repo.get_config_stack().get((b"core", ), b"hooksPath")
+		except KeyError:
+			return False
+		else:
+			return True
+
+	def close(self) -> None:
+		"""
+		Close the repository, if it was opened by the session.
+		"""
+
+		super().close()
+		if self._owns_repo:
+			self.repo.close()
+
+
+class GitCLISession(GitSession):
+	"""
+	A :class:`~.GitSession` which runs the ``git`` executable.
+
+	This is faster than :class:`~.DulwichSession` for repositories with large histories or indexes,
+	but requires git to be installed.
+
+	:param repo_path: The path to the repository root.
+
+	:raises FileNotFoundError: If the ``git`` executable can't be found.
+	"""
+
+	def __init__(self, repo_path: Union[PathLike, dulwich.repo.Repo]):
+		if isinstance(repo_path, dulwich.repo.Repo):
+			repo_path = repo_path.path
+
+		executable = shutil.which("git")
+		if executable is None:
+			raise FileNotFoundError("The 'git' executable could not be found.")
+
+		#: The path to the ``git`` executable.
+		self.executable = executable
+
+		super().__init__(PathPlus(repo_path).absolute())
+
+	def _git(self, *args: str, input: Optional[bytes] = None) -> bytes:  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Run git in the repository and return its output.
+
+		:raises subprocess.CalledProcessError: If git failed.
+		"""
+
+		process = subprocess.run(  # nosec: B603
+				[self.executable, "-C", os.fspath(self.path), "--literal-pathspecs", *args],
+				input=input,
+				stdout=subprocess.PIPE,
+				stderr=subprocess.PIPE,
+				check=True,
+				)
+		return process.stdout
+
+	def _git_stream(self, *args: str) -> Iterator[bytes]:
+		"""
+		Run git in the repository and yield its NUL-separated output as it is written.
+
+		git is stopped if the iterator is closed before the output ends.
+
+		:raises subprocess.CalledProcessError: If git failed.
+		"""
+
+		command = [self.executable, "-C", os.fspath(self.path), "--literal-pathspecs", *args]
+		process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)  # nosec: B603
+		assert process.stdout is not None
+
+		finished = False
+
+		try:
+			remainder = b''
+			for chunk in iter(lambda: process.stdout.read1(65536), b''):  # type: ignore[union-attr]
+				*fields, remainder = (remainder + chunk).split(b"\0")
+				yield from fields
+
+			if remainder:
+				yield remainder
+
+			finished = True
+
+		finally:
+			if not finished:
+				process.kill()
+			_, stderr = process.communicate()
+
+		if process.returncode:
+			raise subprocess.CalledProcessError(process.returncode, command, stderr=stderr)
+
+	def _porcelain_status(self, *args: str) -> Iterator[Tuple[str, PathPlus]]:
+		# With --no-renames each entry is "XY path", separated by NULs.
+		output = self._git("status", "--porcelain=v1", "-z", "--no-renames", *args)
+		for entry in output.split(b"\0"):
+			if entry:
+				yield entry[:2].decode("ASCII"), PathPlus(os.fsdecode(entry[3:]))
+
+	def _read_status(self) -> None:
+		staged: StagedDict = {"add": [], "delete": [], "modify": []}
+		unstaged: List[PathPlus] = []
+
+		for code, filename in self._porcelain_status("--untracked-files=no"):
+			if 'U' in code or code in {"AA", "DD"}:
+				# Conflicts
+				unstaged.append(filename)
+				continue
+
+			if code[0] == 'A':
+				staged["add"].append(filename)
+			elif code[0] == 'D':
+				staged["delete"].append(filename)
+			elif code[0] in "MT":
+				staged["modify"].append(filename)
+
+			if code[1] in "MTD":
+				unstaged.append(filename)
+
+		self._staged = staged
+		self._unstaged = unstaged
+
+	def _read_staged(self) -> StagedDict:
+		# Staged and unstaged changes are read together.
+		self._read_status()
+		assert self._staged is not None
+		return self._staged
+
+	def _read_unstaged(self) -> List[PathPlus]:
+		self._read_status()
+		assert self._unstaged is not None
+		return self._unstaged
+
+	def _read_untracked(self) -> List[PathPlus]:
+		output = self._git("ls-files", "-z", "--others", "--exclude-standard")
+		return [PathPlus(os.fsdecode(path)) for path in output.split(b"\0") if path]
+
+	def managed_status(self, files: Iterable[PathLike]) -> GitStatus:  # noqa: D102
+		filenames = list(dict.fromkeys(map(self._relative, files)))
+		if not filenames:
+			return GitStatus({"add": [], "delete": [], "modify": []}, [], [])
+
+		codes = {
+				filename: code
+				for code, filename in self._porcelain_status("--untracked-files=all", "--", *map(os.fspath, filenames))
+				}
+
+		staged: StagedDict = {"add": [], "delete": [], "modify": []}
+		unstaged: List[PathPlus] = []
+		untracked: List[PathPlus] = []
+
+		# In the order the files were given.
+		for filename in filenames:
+			code = codes.get(filename)
+			if code is None:
+				continue
+			elif code == "??":
+				untracked.append(filename)
+			elif 'U' in code or code in {"AA", "DD"}:
+				unstaged.append(filename)
+			else:
+				if code[0] == 'A':
+					staged["add"].append(filename)
+				elif code[0] == 'D':
+					staged["delete"].append(filename)
+				elif code[0] in "MT":
+					staged["modify"].append(filename)
+
+				if code[1] in "MTD":
+					unstaged.append(filename)
+
+		return GitStatus(staged, unstaged, untracked)
+
+	def stage(self, files: Iterable[PathLike]) -> None:  # noqa: D102
+		paths = b''.join(os.fsencode(filename.as_posix()) + b"\0" for filename in map(self._relative, files))
+
+		with span("stage", "git"):
+			# Files which don't exist are removed from the index.
+			self._git("update-index", "--add", "--remove", "-z", "--stdin", input=paths)
+
+		self.invalidate()
+
+	def commit(self, message: str = "Updated files with 'repo_helper'.") -> str:  # noqa: D102
+		try:
+			self._git("commit", "--quiet", "--cleanup=verbatim", "--file=-", input=message.encode("UTF-8"))
+		except subprocess.CalledProcessError as e:
+			raise CommitError(e.stderr.decode("UTF-8", "replace").strip() or str(e))
+		finally:
+			self.invalidate()
+
+		return self._git("rev-parse", "HEAD").decode("ASCII").strip()
+
+	def tags(self) -> Dict[str, str]:  # noqa: D102
+		tags: Dict[str, str] = {}
+
+		output = self._git("for-each-ref", "--format=%(objectname) %(*objectname) %(refname)", "refs/tags")
+		for line in output.decode("UTF-8").splitlines():
+			sha, peeled, ref = line.split(' ', 2)
+			tags[peeled or sha] = ref[len("refs/tags/"):]
+
+		return tags
+
+	def tag_create(self, tag: str) -> None:  # noqa: D102
+		self._git("tag", tag)
+
+	def refs(self) -> Dict[str, str]:  # noqa: D102
+		refs: Dict[str, str] = {}
+
+		try:
+			refs["HEAD"] = self._git("rev-parse", "--verify", "--quiet", "HEAD").decode("ASCII").strip()
+		except subprocess.CalledProcessError:
+			# No commits yet.
+			pass
+
+		output = self._git("for-each-ref", "--format=%(objectname) %(refname)")
+		for line in output.decode("UTF-8").splitlines():
+			sha, ref = line.split(' ', 1)
+			if not ref.startswith("refs/tags/"):
+				refs[ref] = sha
+
+		return refs
+
+	def current_branch(self) -> str:  # noqa: D102
+		try:
+			ref = self._git("symbolic-ref", "--quiet", "HEAD").decode("UTF-8").strip()
+		except subprocess.CalledProcessError:
+			return ''
+
+		return ref[11:] if ref.startswith("refs/heads/") else ''
+
+	def head(self) -> Optional[str]:  # noqa: D102
+		try:
+			return self._git("rev-parse", "--verify", "--quiet", "HEAD").decode("ASCII").strip()
+		except subprocess.CalledProcessError:
+			return None
+
+	def _count_commits_since(self, head: str, sha: str) -> Optional[int]:
+		try:
+			self._git("merge-base", "--is-ancestor", sha, head)
+		except subprocess.CalledProcessError:
+			return None
+
+		return int(self._git("rev-list", "--count", f"{sha}..{head}"))
+
+	def iter_commits(  # noqa: D102
+		self,
+		max_entries: Optional[int] = None,
+		reverse: bool = False,
+		since: Optional[float] = None,
+		) -> Iterator[CommitInfo]:
+		try:
+			self._git("rev-parse", "--verify", "--quiet", "HEAD")
+		except subprocess.CalledProcessError:
+			# No commits yet.
+			return
+
+		args = ["log", "-z", "--date=raw", f"--format={_LOG_FORMAT}"]
+		if max_entries is not None:
+			args.append(f"--max-count={max_entries}")
+		if reverse:
+			args.append("--reverse")
+		if since is not None:
+			args.append(f"--max-age={int(since)}")
+
+		# The commits are read as git writes them, so the walk can stop early.
+		fields = self._git_stream(*args)
+
+		try:
+			for sha, parents, author, committer, author_date, commit_time, message in zip(*[fields] * 7):
+				author_time, timezone = author_date.split(b' ')
+				yield CommitInfo(
+						id=sha,
+						parents=parents.split(),
+						author=author,
+						committer=committer,
+						author_time=int(author_time),
+						author_timezone=parse_timezone(timezone)[0],
+						commit_time=int(commit_time),
+						message=message,
+						)
+		finally:
+			fields.close()
+
+	@property
+	def git_dir(self) -> PathPlus:  # noqa: D102
+		git_dir = self._git("rev-parse", "--git-common-dir").decode("UTF-8").strip()
+		return self.path / git_dir
+
+	def _hooks_path_set(self) -> bool:
+		try:
+			self._git("config", "--get", "core.hooksPath")
+		except subprocess.CalledProcessError:
+			return False
+		else:
+			return True
+
+
+class _CommitCountCache:
+	"""
+	The number of commits between pairs of commits, as returned by :meth:`GitSession.commits_since`.
+
+	Commits can't change, so the entries never become stale, and the cache is shared by all repositories.
+	"""
+
+	#: The maximum number of entries to keep.
+	max_entries: int = 1000
+
+	def __init__(self):
+		# this package
+		from repo_helper.utils import cache_dir
+
+		self.filename = cache_dir() / "git" / "commits_since.json"
+
+		try:
+			self.counts: Dict[str, Optional[int]] = dict(self.filename.load_json()["counts"])
+		except (OSError, ValueError, KeyError, TypeError):
+			# Missing, corrupt, or from an older version.
+			self.counts = {}
+
+	def __contains__(self, key: str) -> bool:
+		return key in self.counts
+
+	def __getitem__(self, key: str) -> Optional[int]:
+		return self.counts[key]
+
+	def __setitem__(self, key: str, count: Optional[int]) -> None:
+		# Keep the most recent entries at the end.
+		self.counts.pop(key, None)
+		self.counts[key] = count
+
+	def save(self) -> None:
+		"""
+		Write the cache to disk.
+		"""
+
+		counts = dict(list(self.counts.items())[-self.max_entries:])
+
+		# Write to a temporary file first, as other processes may be reading the cache.
+		try:
+			self.filename.parent.maybe_make(parents=True)
+			fd, tmp_filename = tempfile.mkstemp(dir=self.filename.parent, suffix=".tmp")
+			try:
+				with os.fdopen(fd, 'w', encoding="UTF-8") as fp:
+					json.dump({"counts": counts}, fp)
+				os.replace(tmp_filename, self.filename)
+			except BaseException:
+				os.unlink(tmp_filename)
+				raise
+		except OSError:
+			pass
+
+
+# The fields of each commit, separated by NULs.
+_LOG_FORMAT = "%H%x00%P%x00%an <%ae>%x00%cn <%ce>%x00%ad%x00%ct%x00%B"
+
+#: The available git backends.
+git_backends: Dict[str, Type[GitSession]] = {
+		"dulwich": DulwichSession,
+		"git": GitCLISession,
+		}
+
+
+def open_session(repo: Union[PathLike, dulwich.repo.Repo], backend: Optional[str] = None) -> GitSession:
+	"""
+	Open a git repository with the given backend.
+
+	:param repo: The repository, or the path to it.
+	:param backend: The name of the backend in :data:`~.git_backends`.
+		If not given the backend chosen with the ``--git-backend`` option of the running ``repo_helper`` command is used,
+		or else the ``REPO_HELPER_GIT_BACKEND`` environment variable, which defaults to ``'dulwich'``.
+	"""
+
+	if backend is None:
+		ctx = click.get_current_context(silent=True)
+		if ctx is not None and isinstance(ctx.find_root().obj, dict):
+			backend = ctx.find_root().obj.get("git_backend")
+
+	if backend is None:
+		backend = os.environ.get("REPO_HELPER_GIT_BACKEND", '') or "dulwich"
+
+	if backend not in git_backends:
+		raise ValueError(f"Unknown git backend {backend!r}. Choose from: {', '.join(git_backends)}")
+
+	return git_backends[backend](repo)
+
+
+class SessionLog(Log):
+	"""
+	Python implementation of ``git log``, which reads the repository through a :class:`~.GitSession`.
+
+	:param session: The open repository.
+	"""
+
+	def __init__(self, session: GitSession):  # pylint: disable=super-init-not-called
+		#: The open repository.
+		self.session = session
+
+		#: Mapping of commit SHAs to tags.
+		self.tags = session.tags()
+
+		#: Mapping of git refs to commit SHAs.
+		self.refs = session.refs()
+
+		#: Mapping of local branches to the SHA of the latest commit in that branch.
+		self.local_branches: Dict[str, str] = {}
+
+		#: Mapping of remote branches to the SHA of the latest commit in that branch.
+		self.remote_branches: Dict[str, str] = {}
+
+		#: The name of the current branch
+		self.current_branch = session.current_branch()
+
+		for key, value in self.refs.items():
+			if key.startswith("refs/heads/"):
+				self.local_branches[key[11:]] = value
+			elif key.startswith("refs/remotes/"):
+				self.remote_branches[key[13:]] = value
+
+	def iter_log(
+			self,
+			max_entries: Optional[int] = None,
+			reverse: bool = False,
+			from_date: Optional[datetime] = None,
+			from_tag: Optional[str] = None,
+			colour: bool = True
+			) -> Iterator[str]:
+		"""
+		Returns an iterator over the formatted commit log entries.
+
+		Each commit is read and formatted as the entry is needed,
+		and the walk stops as soon as ``max_entries``, ``from_date`` or ``from_tag`` is reached.
+
+		:param max_entries: Maximum number of entries to display
+		:default max_entries: all entries
+		:param reverse: Print entries in reverse order.
+		:param from_date: Show commits after the given date.
+		:param from_tag: Show commits after the given tag.
+		:param colour: Show coloured output.
+
+		:raises ValueError: If the arguments are invalid. This is raised before any commits are read.
+		"""
+
+		since: Optional[float] = None
+
+		if from_date is not None and from_tag is not None:
+			raise ValueError("'from_date' and 'from_tag' are exclusive.")
+		elif from_date:
+			since = from_date.timestamp()
+		elif from_tag and not any(from_tag == tag for tag in self.tags.values()):
+			raise ValueError(f"No such tag {from_tag!r}")
+
+		if from_tag:
+			commits = self._iter_commits_from_tag(from_tag, max_entries, reverse)
+		else:
+			commits = self.session.iter_commits(max_entries=max_entries, reverse=reverse, since=since)
+
+		entries = (str(self.format_commit(commit)) for commit in commits)  # type: ignore[arg-type]
+
+		if colour:
+			return entries
+		else:
+			return map(strip_ansi, entries)
+
+	def _iter_commits_from_tag(self, from_tag: str, max_entries: Optional[int], reverse: bool) -> Iterator[CommitInfo]:
+		# Walk back from HEAD and stop at the tagged commit.
+		def walk() -> Iterator[CommitInfo]:
+			for commit in self.session.iter_commits(max_entries=max_entries):
+				yield commit
+
+				if self.tags.get(commit.id.decode("UTF-8")) == from_tag:
+					break
+
+		if reverse:
+			# Only the commits since the tag have to be kept.
+			return reversed(list(walk()))
+		else:
+			return walk()
+
+	def log(
+			self,
+			max_entries: Optional[int] = None,
+			reverse: bool = False,
+			from_date: Optional[datetime] = None,
+			from_tag: Optional[str] = None,
+			colour: bool = True
+			) -> str:
+		"""
+		Return the formatted commit log.
+
+		:param max_entries: Maximum number of entries to display
+		:default max_entries: all entries
+		:param reverse: Print entries in reverse order.
+		:param from_date: Show commits after the given date.
+		:param from_tag: Show commits after the given tag.
+		:param colour: Show coloured output.
+		"""
+
+		return '\n'.join(self.iter_log(max_entries, reverse, from_date, from_tag, colour))
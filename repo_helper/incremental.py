@@ -0,0 +1,374 @@
+#!/usr/bin/env python
+#
+#  incremental.py
+"""
+Skip managers whose inputs have not changed since the last run.
+
+While a manager runs its access to the template globals, the templates it loads
+(and the variables those templates refer to), and the files it reads and writes are recorded.
+A hash of those inputs is stored in a cache file.
+On the next run the same inputs are hashed again, and if nothing has changed the manager is skipped.
+
+.. versionadded:: 2026.10.16
+"""
+#
+#  Copyright © 2026 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+
+# stdlib
+import hashlib
+import sys
+import threading
+from collections import ChainMap
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Set, Tuple
+
+# 3rd party
+import jinja2
+import jinja2.meta
+from domdf_python_tools.paths import PathPlus
+from domdf_python_tools.typing import PathLike
+
+# this package
+import repo_helper
+from repo_helper.files import Manager, get_dependencies
+from repo_helper.templates import Environment
+from repo_helper.utils import _stable_repr, cache_dir
+
+__all__ = [
+		"IncrementalCache",
+		"ManagerTrace",
+		"TracingGlobals",
+		"TracingLoader",
+		"trace_environment",
+		]
+
+
+class TracingGlobals(Dict[str, Any]):
+	"""
+	Dictionary of template globals which records the keys that are accessed.
+	"""
+
+	def __init__(self, *args, **kwargs):
+		super().__init__(*args, **kwargs)
+
+		#: The keys which have been accessed.
+		self.accessed: Set[str] = set()
+
+		#: Whether every key has been accessed, e.g. by iterating over the dictionary.
+		self.accessed_all: bool = False
+
+	def __getitem__(self, key: str) -> Any:
+		self.accessed.add(key)
+		return super().__getitem__(key)
+
+	def __contains__(self, key: object) -> bool:
+		self.accessed.add(key)  # type: ignore[arg-type]
+		return super().__contains__(key)
+
+	def get(self, key: str, default: Any = None) -> Any:  # noqa: D102
+		self.accessed.add(key)
+		return super().get(key, default)
+
+	def __iter__(self):  # noqa: MAN002
+		self.accessed_all = True
+		return super().__iter__()
+
+	def keys(self):  # noqa: D102,MAN002
+		self.accessed_all = True
+		return super().keys()
+
+	def values(self):  # noqa: D102,MAN002
+		self.accessed_all = True
+		return super().values()
+
+	def items(self):  # noqa: D102,MAN002
+		self.accessed_all = True
+		return super().items()
+
+	def copy(self) -> Dict[str, Any]:  # noqa: D102
+		self.accessed_all = True
+		return super().copy()
+
+
+class TracingLoader(jinja2.BaseLoader):
+	"""
+	Jinja2 loader which records the names of the templates it loads.
+
+	:param loader: The loader to obtain templates from.
+	"""
+
+	def __init__(self, loader: jinja2.BaseLoader):
+		self.loader = loader
+
+		#: The names of the templates which have been loaded.
+		self.loaded: Set[str] = set()
+
+	def get_source(  # noqa: D102
+			self,
+			environment: jinja2.Environment,
+			template: str,
+			) -> Tuple[str, Optional[str], Optional[Callable[[], bool]]]:
+		self.loaded.add(template)
+		return self.loader.get_source(environment, template)
+
+	def list_templates(self) -> List[str]:  # noqa: D102
+		return self.loader.list_templates()
+
+
+class _UntracedGlobals(Mapping[str, Any]):
+	"""
+	Read-only view of :class:`~.TracingGlobals` which does not record accesses.
+
+	Jinja2 copies every global into the context of each template it renders,
+	so the variables used by templates are instead found from their source code.
+	"""
+
+	def __init__(self, traced_globals: TracingGlobals):
+		self._globals = traced_globals
+
+	def __getitem__(self, key: str) -> Any:
+		return dict.__getitem__(self._globals, key)
+
+	def __contains__(self, key: object) -> bool:
+		return dict.__contains__(self._globals, key)
+
+	def __iter__(self) -> Iterator[str]:
+		return dict.__iter__(self._globals)
+
+	def __len__(self) -> int:
+		return dict.__len__(self._globals)
+
+
+def trace_environment(environment: Environment) -> Environment:
+	"""
+	Record accesses to the globals and templates of ``environment``.
+
+	The environment should not have loaded any templates yet, and should not be shared between managers.
+
+	:param environment:
+
+	:returns: The environment, with its globals replaced by :class:`~.TracingGlobals`
+		and its loader wrapped in a :class:`~.TracingLoader`.
+	"""
+
+	traced_globals = TracingGlobals(environment.globals)
+	environment.globals = traced_globals
+
+	def make_globals(d: Optional[Mapping[str, Any]] = None) -> ChainMap:
+		return ChainMap(dict(d or {}), _UntracedGlobals(traced_globals))  # type: ignore[arg-type]
+
+	# Shadows the method, so templates see changes to the globals without them being recorded.
+	environment.make_globals = make_globals  # type: ignore[assignment]
+
+	if environment.loader is not None:
+		environment.loader = TracingLoader(environment.loader)
+
+	return environment
+
+
+class ManagerTrace(NamedTuple):
+	"""
+	The inputs and outputs of a manager the last time it was run.
+	"""
+
+	#: The template globals read by the manager.
+	config_keys: Tuple[str, ...]
+
+	#: The templates loaded by the manager.
+	templates: Tuple[str, ...]
+
+	#: The files read or written by the manager, relative to the repository root.
+	files: Tuple[str, ...]
+
+	#: Hash of the values of :attr:`~.config_keys` and the contents of :attr:`~.templates` and :attr:`~.files`.
+	digest: str
+
+	#: The filenames returned by the manager.
+	outputs: Tuple[str, ...]
+
+
+class IncrementalCache:
+	"""
+	Stores the :class:`~.ManagerTrace` for each manager run for a repository.
+
+	:param repo_path: Path to the repository root.
+	:param working_tree: The directory the managers write files to, if not ``repo_path``.
+	"""
+
+	#: Path to the cache file.
+	filename: PathPlus
+
+	#: Mapping of manager names (``module:qualname``) to their traces.
+	traces: Dict[str, ManagerTrace]
+
+	def __init__(self, repo_path: PathLike, working_tree: Optional[PathLike] = None):
+		self.repo_path = PathPlus(repo_path).absolute()
+		self.working_tree = PathPlus(working_tree or self.repo_path)
+
+		repo_hash = hashlib.sha256(self.repo_path.as_posix().encode("UTF-8")).hexdigest()
+		self.filename = cache_dir() / "incremental" / f"{repo_hash}.json"
+		self.traces = {}
+		self._lock = threading.Lock()
+
+		if self.filename.is_file():
+			try:
+				raw_traces = self.filename.load_json()["traces"]
+				self.traces = {key: ManagerTrace(*map(_as_tuple, trace)) for key, trace in raw_traces.items()}
+			except (ValueError, KeyError, TypeError):
+				# Corrupt or from an older version.
+				self.traces = {}
+
+	def get_outputs(self, function: Manager, templates: Environment) -> Optional[List[str]]:
+		"""
+		Returns the output filenames of ``function`` if its inputs are unchanged since it was last run.
+
+		:param function: A registered function.
+		:param templates: The template environment, containing the configuration.
+
+		:returns: :py:obj:`None` if the function must be run.
+		"""
+
+		if get_dependencies(function) is None:
+			return None
+
+		trace = self.traces.get(_manager_name(function))
+		if trace is None:
+			return None
+
+		digest = self._digest(function, templates, trace.config_keys, trace.templates, trace.files)
+		if digest != trace.digest:
+			return None
+
+		return list(trace.outputs)
+
+	def record(
+			self,
+			function: Manager,
+			templates: Environment,
+			traced_environment: Environment,
+			outputs: Iterable[str],
+			) -> None:
+		"""
+		Record the inputs and outputs of ``function`` after running it.
+
+		:param function: A registered function.
+		:param templates: The template environment, containing the configuration as it was before the function ran.
+		:param traced_environment: The environment the function was run with,
+			as returned by :func:`~.trace_environment`.
+		:param outputs: The filenames returned by the function.
+		"""
+
+		dependencies = get_dependencies(function)
+		if dependencies is None:
+			return
+
+		traced_globals = traced_environment.globals
+		assert isinstance(traced_globals, TracingGlobals)
+		loader = traced_environment.loader
+		assert isinstance(loader, TracingLoader)
+
+		template_names = tuple(sorted(loader.loaded))
+
+		if traced_globals.accessed_all:
+			config_keys = tuple(sorted(templates.globals))
+		else:
+			accessed = set(traced_globals.accessed)
+			for name in template_names:
+				source = loader.get_source(traced_environment, name)[0]
+				accessed.update(jinja2.meta.find_undeclared_variables(traced_environment.parse(source)))
+			config_keys = tuple(sorted(accessed))
+
+		outputs = tuple(map(str, outputs))
+		resolved = dependencies.resolve(templates.globals)
+		files = tuple(sorted({*resolved.reads, *resolved.writes, *outputs}))
+		digest = self._digest(function, templates, config_keys, template_names, files)
+
+		with self._lock:
+			self.traces[_manager_name(function)
+						] = ManagerTrace(config_keys, template_names, files, digest, outputs)
+
+	def save(self) -> None:
+		"""
+		Write the cache to disk.
+		"""
+
+		self.filename.parent.maybe_make(parents=True)
+		self.filename.dump_json(
+				{
+						"traces": {key: list(trace)
+									for key, trace in sorted(self.traces.items())},
+						},
+				indent=2,
+				)
+
+	def _digest(
+			self,
+			function: Manager,
+			templates: Environment,
+			config_keys: Iterable[str],
+			template_names: Iterable[str],
+			files: Iterable[str],
+			) -> str:
+		digest = hashlib.sha256()
+		digest.update(repo_helper.__version__.encode("UTF-8"))
+		digest.update(_module_source(function))
+
+		for key in config_keys:
+			digest.update(f"\0{key}\0{_stable_repr(templates.globals.get(key, _Missing))}".encode("UTF-8"))
+
+		for name in template_names:
+			try:
+				source = templates.loader.get_source(templates, name)[0]  # type: ignore[union-attr]
+			except jinja2.TemplateNotFound:
+				source = repr(_Missing)
+
+			digest.update(f"\0{name}\0{source}".encode("UTF-8"))
+
+		for filename in files:
+			digest.update(f"\0{filename}\0".encode("UTF-8"))
+			file = self.working_tree / filename
+
+			if file.is_file():
+				digest.update(file.read_bytes())
+			else:
+				digest.update(repr(_Missing).encode("UTF-8"))
+
+		return digest.hexdigest()
+
+
+class _Missing:
+	pass
+
+
+def _as_tuple(value: Any) -> Any:
+	if isinstance(value, list):
+		return tuple(value)
+	return value
+
+
+def _manager_name(function: Manager) -> str:
+	return f"{function.__module__}:{function.__qualname__}"
+
+
+def _module_source(function: Manager) -> bytes:
+	module_file = getattr(sys.modules.get(function.__module__), "__file__", None)
+
+	if module_file is None:
+		return b''
+
+	return PathPlus(module_file).read_bytes()
@@ -0,0 +1,245 @@
+#!/usr/bin/env python
+#
+#  manifest.py
+"""
+Record of the files managed by ``repo_helper``, used to quickly check whether they are up to date.
+
+Each run writes ``.repo_helper_manifest.json`` to the repository, containing a hash of ``repo_helper.yml``,
+of the other files the managers read, and of every managed file.
+If the configuration and inputs are unchanged the managed files can be checked against the manifest
+without parsing the configuration or rendering any templates.
+
+The manifest doesn't record the version of ``repo_helper``, so upgrading doesn't change it.
+Files whose templates changed in the new version are updated the next time ``repo_helper`` is run.
+
+This module only uses ``click`` and the standard library on that path so it can be run as a fast ``pre-commit`` hook:
+
+.. code-block:: bash
+
+	python -m repo_helper.manifest
+
+.. versionadded:: 2026.10.16
+"""
+#
+#  Copyright © 2026 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+
+# stdlib
+import hashlib
+import json
+import os
+import pathlib
+import sys
+from typing import Dict, Iterable, List, NamedTuple, Optional, Union
+
+# 3rd party
+import click
+
+__all__ = ["MANIFEST_FILENAME", "Manifest", "echo_stale_files", "find_stale_files", "hash_file", "main"]
+
+#: The name of the manifest file, relative to the repository root.
+MANIFEST_FILENAME = ".repo_helper_manifest.json"
+
+_PathLike = Union[str, "os.PathLike[str]"]
+
+
+def hash_file(filename: _PathLike) -> Optional[str]:
+	"""
+	Returns the SHA-256 hash of the given file, or :py:obj:`None` if it does not exist.
+
+	:param filename:
+	"""
+
+	try:
+		return hashlib.sha256(pathlib.Path(filename).read_bytes()).hexdigest()
+	except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+		return None
+
+
+class Manifest(NamedTuple):
+	"""
+	Hashes of the inputs and outputs of a ``repo_helper`` run.
+	"""
+
+	#: The hash of ``repo_helper.yml``.
+	config: Optional[str]
+
+	#: Mapping of files read by the managers to their hashes.
+	#: :py:obj:`None` if not all managers declare the files they read,
+	#: in which case the manifest can never be used to skip rendering.
+	inputs: Optional[Dict[str, Optional[str]]]
+
+	#: Mapping of managed files to their hashes.
+	#: Files which should not exist (such as old configuration files which have been removed) are :py:obj:`None`.
+	files: Dict[str, Optional[str]]
+
+	@classmethod
+	def create(
+			cls,
+			repo_path: _PathLike,
+			inputs: Optional[Iterable[str]],
+			files: Iterable[str],
+			working_tree: Optional[_PathLike] = None,
+			) -> "Manifest":
+		"""
+		Create a manifest by hashing files in the repository.
+
+		:param repo_path: Path to the repository root, containing ``repo_helper.yml`` and the ``inputs``.
+		:param inputs: Files (relative to the repository root) read by the managers,
+			or :py:obj:`None` if they are not known.
+		:param files: The managed files, relative to the repository root.
+		:param working_tree: The directory to read the managed files from, if not ``repo_path``.
+		"""
+
+		repo_path = pathlib.Path(repo_path)
+		working_tree = pathlib.Path(working_tree or repo_path)
+
+		filenames = {pathlib.PurePath(filename).as_posix() for filename in files}
+		filenames -= {"repo_helper.yml", "git_helper.yml", MANIFEST_FILENAME}
+
+		managed_files = {}
+		for filename in sorted(filenames):
+			if not (working_tree / filename).is_dir():
+				managed_files[filename] = hash_file(working_tree / filename)
+
+		input_hashes: Optional[Dict[str, Optional[str]]] = None
+		if inputs is not None:
+			input_hashes = {
+					filename: hash_file(repo_path / filename)
+					for filename in sorted(set(inputs) - set(managed_files))
+					}
+
+		return cls(
+				config=hash_file(repo_path / "repo_helper.yml"),
+				inputs=input_hashes,
+				files=managed_files,
+				)
+
+	@classmethod
+	def load(cls, repo_path: _PathLike) -> Optional["Manifest"]:
+		"""
+		Load the manifest from the given repository.
+
+		:param repo_path: Path to the repository root.
+
+		:returns: :py:obj:`None` if the manifest does not exist or is invalid.
+		"""
+
+		try:
+			data = json.loads((pathlib.Path(repo_path) / MANIFEST_FILENAME).read_text(encoding="UTF-8"))
+			return cls(data["config"], data["inputs"], data["files"])
+		except (FileNotFoundError, ValueError, KeyError, TypeError):
+			return None
+
+	def dump(self, repo_path: _PathLike) -> None:
+		"""
+		Write the manifest to the given repository.
+
+		:param repo_path: Path to the repository root.
+		"""
+
+		content = json.dumps(self._asdict(), indent=2, sort_keys=True)
+		(pathlib.Path(repo_path) / MANIFEST_FILENAME).write_text(f"{content}\n", encoding="UTF-8")
+
+	def stale_files(self, repo_path: _PathLike) -> Optional[List[str]]:
+		"""
+		Returns the managed files which do not match the manifest.
+
+		:param repo_path: Path to the repository root.
+
+		:returns: :py:obj:`None` if the configuration or the files read by the managers have changed,
+			in which case the manifest cannot be used.
+		"""
+
+		repo_path = pathlib.Path(repo_path)
+
+		if self.inputs is None:
+			return None
+
+		if self.config != hash_file(repo_path / "repo_helper.yml"):
+			return None
+
+		for filename, digest in self.inputs.items():
+			if digest != hash_file(repo_path / filename):
+				return None
+
+		return [filename for filename, digest in self.files.items() if digest != hash_file(repo_path / filename)]
+
+
+def find_stale_files(repo_path: _PathLike) -> List[str]:
+	"""
+	Returns the files managed by ``repo_helper`` which are not up to date.
+
+	The files are compared with the manifest where possible.
+	Otherwise the files are rendered (without writing them to disk) and compared with the working tree.
+	The manifest itself is never included.
+
+	:param repo_path: Path to the repository root.
+	"""
+
+	manifest = Manifest.load(repo_path)
+
+	if manifest is not None:
+		stale_files = manifest.stale_files(repo_path)
+		if stale_files is not None:
+			return stale_files
+
+	# this package
+	from repo_helper.core import RepoHelper
+
+	rh = RepoHelper(repo_path)
+	rh.load_settings()
+	rh.run(dry_run=True)
+
+	# The manifest itself is out of date whenever it can't be used, but it's never edited by hand.
+	return [change.filename for change in rh.changes if change.filename != MANIFEST_FILENAME]
+
+
+def echo_stale_files(stale_files: Iterable[str]) -> None:
+	"""
+	Print the list of stale files to stderr, and how to update them.
+
+	:param stale_files: The stale files, as returned by :func:`~.find_stale_files`.
+	"""
+
+	click.echo("The following files managed by 'repo_helper' are out of date:", err=True)
+	for filename in stale_files:
+		click.echo(f"  {filename}", err=True)
+	click.echo("Run 'repo_helper' to update them.", err=True)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+	"""
+	Entry point for the ``pre-commit`` hook.
+
+	Checks the files in the repository in the current directory, and returns ``1`` if any are stale.
+
+	:param argv: Ignored. Filenames are passed by ``pre-commit`` but every managed file is checked.
+	"""
+
+	stale_files = find_stale_files(os.getcwd())
+
+	if not stale_files:
+		return 0
+
+	echo_stale_files(stale_files)
+	return 1
+
+
+if __name__ == "__main__":
+	sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,257 @@
+#!/usr/bin/env python
+#
+#  profiling.py
+"""
+Record where time is spent during a ``repo_helper`` run.
+
+.. code-block:: python
+
+	profiler = Profiler()
+	rh.run(profiler=profiler)
+	profiler.dump_chrome_trace("trace.json")  # open in chrome://tracing or https://ui.perfetto.dev
+	print(profiler.summary())
+
+.. versionadded:: 2026.10.16
+"""
+#
+#  Copyright © 2026 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+
+# stdlib
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from types import TracebackType
+from typing import Any, ContextManager, Dict, Iterable, Iterator, List, Optional, Tuple, Type
+
+# 3rd party
+from domdf_python_tools.paths import PathPlus
+from domdf_python_tools.typing import PathLike
+
+__all__ = ["Profiler", "Span", "current_profiler", "record_file_changes", "span"]
+
+
+class Span:
+	"""
+	A timed operation.
+
+	:param name: The name of the operation, such as the manager's ``exclude_name``.
+	:param category: The kind of operation, e.g. ``'manager'``, ``'git'``, ``'network'`` or ``'format'``.
+	:param start: The :func:`time.perf_counter` value when the operation started.
+	:param args: Additional information about the operation.
+	"""
+
+	#: The :func:`time.perf_counter` value when the operation finished.
+	end: Optional[float]
+
+	#: The identifier of the thread the operation ran in.
+	thread_id: int
+
+	def __init__(self, name: str, category: str, start: float, args: Optional[Dict[str, Any]] = None):
+		self.name: str = name
+		self.category: str = category
+		self.start: float = start
+		self.end = None
+		self.thread_id = threading.get_ident()
+		self.args: Dict[str, Any] = dict(args or {})
+
+	@property
+	def duration(self) -> float:
+		"""
+		The duration of the operation in seconds, or ``0`` if it has not finished.
+		"""
+
+		if self.end is None:
+			return 0
+		return self.end - self.start
+
+	def __repr__(self) -> str:
+		return f"<Span {self.category}:{self.name} {self.duration * 1000:.1f}ms>"
+
+
+class Profiler:
+	"""
+	Collects :class:`~.Span` objects while it is active.
+
+	Use as a context manager, or pass to :meth:`RepoHelper.run() <repo_helper.core.RepoHelper.run>`.
+	Only one profiler is active at a time; activating another replaces it until that one exits.
+	"""
+
+	#: The spans recorded so far.
+	spans: List[Span]
+
+	def __init__(self):
+		self.spans = []
+		self._origin = time.perf_counter()
+		self._lock = threading.Lock()
+		self._previous: List[Optional["Profiler"]] = []
+
+	def __enter__(self) -> "Profiler":
+		global _active_profiler
+		self._previous.append(_active_profiler)
+		_active_profiler = self
+		return self
+
+	def __exit__(
+			self,
+			exc_type: Optional[Type[BaseException]],
+			exc_val: Optional[BaseException],
+			exc_tb: Optional[TracebackType],
+			) -> None:
+		global _active_profiler
+		_active_profiler = self._previous.pop()
+
+	@contextmanager
+	def span(self, name: str, category: str, **args: Any) -> Iterator[Span]:
+		"""
+		Record the time taken by the body of the ``with`` block.
+
+		:param name:
+		:param category:
+		:param args: Additional information about the operation.
+			Further information can be added to :attr:`Span.args <.Span.args>` within the block.
+		"""
+
+		new_span = Span(name, category, time.perf_counter(), args)
+
+		try:
+			yield new_span
+		finally:
+			new_span.end = time.perf_counter()
+			with self._lock:
+				self.spans.append(new_span)
+
+	def chrome_trace(self) -> Dict[str, Any]:
+		"""
+		Returns the spans in the Chrome trace-event format.
+		"""
+
+		pid = os.getpid()
+		events = []
+
+		for recorded_span in sorted(self.spans, key=lambda s: s.start):
+			events.append({
+					"name": recorded_span.name,
+					"cat": recorded_span.category,
+					"ph": 'X',
+					"ts": round((recorded_span.start - self._origin) * 1_000_000, 1),
+					"dur": round(recorded_span.duration * 1_000_000, 1),
+					"pid": pid,
+					"tid": recorded_span.thread_id,
+					"args": recorded_span.args,
+					})
+
+		return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+	def dump_chrome_trace(self, filename: PathLike) -> None:
+		"""
+		Write the spans to ``filename`` in the Chrome trace-event format.
+
+		:param filename:
+		"""
+
+		PathPlus(filename).write_clean(json.dumps(self.chrome_trace(), indent=1, default=str))
+
+	def summary(self) -> str:
+		"""
+		Returns a table of the total time taken by each operation, slowest first.
+		"""
+
+		# 3rd party
+		from tabulate import tabulate
+
+		totals: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+		for recorded_span in self.spans:
+			row = totals.setdefault(
+					(recorded_span.category, recorded_span.name),
+					{"calls": 0, "total": 0.0, "bytes_written": None, "files_unchanged": None},
+					)
+			row["calls"] += 1
+			row["total"] += recorded_span.duration
+
+			for key in ("bytes_written", "files_unchanged"):
+				if key in recorded_span.args:
+					row[key] = (row[key] or 0) + recorded_span.args[key]
+
+		rows = []
+		for (category, name), row in sorted(totals.items(), key=lambda item: item[1]["total"], reverse=True):
+			rows.append([
+					category,
+					name,
+					row["calls"],
+					f"{row['total'] * 1000:.1f}",
+					row["bytes_written"],
+					row["files_unchanged"],
+					])
+
+		headers = ["Category", "Name", "Calls", "Total (ms)", "Bytes written", "Files unchanged"]
+		return tabulate(rows, headers=headers)
+
+
+_active_profiler: Optional[Profiler] = None
+
+
+def current_profiler() -> Optional[Profiler]:
+	"""
+	Returns the active :class:`~.Profiler`, if any.
+	"""
+
+	return _active_profiler
+
+
+def span(name: str, category: str, **args: Any) -> ContextManager[Optional[Span]]:
+	"""
+	Record the time taken by the body of the ``with`` block, if a :class:`~.Profiler` is active.
+
+	:param name:
+	:param category:
+	:param args: Additional information about the operation.
+
+	:returns: A context manager which gives the :class:`~.Span`, or :py:obj:`None` if profiling is not active.
+	"""
+
+	profiler = _active_profiler
+
+	if profiler is None:
+		return nullcontext()
+
+	return profiler.span(name, category, **args)
+
+
+def record_file_changes(changed_files: Dict[str, int]) -> None:
+	"""
+	Add the number of bytes written and files unchanged to each manager span which has recorded its outputs.
+
+	:param changed_files: Mapping of changed filenames to the number of bytes written.
+	"""
+
+	profiler = _active_profiler
+
+	if profiler is None:
+		return
+
+	for recorded_span in profiler.spans:
+		if recorded_span.category != "manager" or "bytes_written" in recorded_span.args:
+			continue
+
+		outputs: Iterable[str] = recorded_span.args.get("outputs", ())
+		recorded_span.args["bytes_written"] = sum(changed_files.get(output, 0) for output in outputs)
+		recorded_span.args["files_unchanged"] = sum(output not in changed_files for output in outputs)
@@ -0,0 +1,234 @@
+#!/usr/bin/env python
+#
+#  registry.py
+"""
+Cached record of the modules which register file managers and commands.
+
+Finding every manager and command means importing every module in :mod:`repo_helper.files`
+and :mod:`repo_helper.cli.commands`, and loading every ``repo_helper.command`` entry point.
+That is done once, and the modules which registered each manager and command are saved
+to ``registry.json`` in the :func:`cache directory <repo_helper.utils.cache_dir>`.
+Later invocations import only the modules they need.
+
+The cache is rebuilt when ``repo_helper`` is upgraded, when a package is installed or removed
+(detected from the modification times of the ``site-packages`` directories),
+or when a module in :mod:`repo_helper.files` or :mod:`repo_helper.cli.commands` is modified.
+
+.. versionadded:: 2026.10.16
+"""
+#
+#  Copyright © 2026 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+
+# stdlib
+import hashlib
+import importlib
+import json
+import os
+import site
+import sys
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# this package
+import repo_helper
+
+__all__ = ["Registry", "environment_key", "import_command", "import_managers", "load_registry"]
+
+_package_dir = os.path.dirname(os.path.abspath(repo_helper.__file__))
+_scanned_dirs = (
+		os.path.join(_package_dir, "files"),
+		os.path.join(_package_dir, "cli", "commands"),
+		)
+
+
+def environment_key() -> str:
+	"""
+	Returns a hash which changes when the registered managers and commands may have changed.
+	"""
+
+	parts: List[str] = [repo_helper.__version__, sys.version, sys.executable]
+
+	site_dirs = set(getattr(site, "getsitepackages", list)())
+	if site.ENABLE_USER_SITE:
+		site_dirs.add(site.getusersitepackages())
+
+	for directory in sys.path:
+		if directory not in site_dirs:
+			continue
+
+		try:
+			parts.append(f"{directory}:{os.stat(directory).st_mtime_ns}")
+		except OSError:
+			continue
+
+	for directory in _scanned_dirs:
+		with os.scandir(directory) as it:
+			for entry in sorted(it, key=lambda e: e.name):
+				if entry.name.endswith(".py"):
+					parts.append(f"{entry.path}:{entry.stat().st_mtime_ns}")
+
+	return hashlib.sha256('\n'.join(parts).encode("UTF-8")).hexdigest()
+
+
+class Registry(NamedTuple):
+	"""
+	The modules which register file managers and commands.
+	"""
+
+	#: The :func:`~.environment_key` when the registry was built.
+	key: str
+
+	#: The modules which register managers, in registration order, and the ``exclude_name`` of each manager.
+	managers: Tuple[Tuple[str, Tuple[str, ...]], ...]
+
+	#: Mapping of command names to the module which defines the command.
+	commands: Dict[str, str]
+
+	@classmethod
+	def build(cls) -> "Registry":
+		"""
+		Import every manager and command and record where they came from.
+		"""
+
+		# 3rd party
+		from consolekit.utils import import_commands
+		from domdf_python_tools.import_tools import discover, discover_entry_points
+
+		# this package
+		import repo_helper.cli.commands
+		import repo_helper.core
+		import repo_helper.files
+		from repo_helper.cli import cli
+		from repo_helper.files import is_registered, management
+
+		key = environment_key()
+
+		discover(repo_helper.files, is_registered)
+		discover_entry_points("repo_helper.command", is_registered)
+		import_commands(repo_helper.cli.commands, entry_point="repo_helper.command")
+
+		managers: Dict[str, List[str]] = {}
+		for function, exclude_name, _ in management:
+			managers.setdefault(function.__module__, []).append(exclude_name)
+
+		commands = {name: command.callback.__module__ for name, command in cli.commands.items()}
+
+		return cls(
+				key=key,
+				managers=tuple((module, tuple(names)) for module, names in managers.items()),
+				commands=commands,
+				)
+
+	@classmethod
+	def load(cls) -> Optional["Registry"]:
+		"""
+		Load the registry from the cache, if it exists and is up to date.
+		"""
+
+		# this package
+		from repo_helper.utils import cache_dir
+
+		filename = cache_dir() / "registry.json"
+
+		try:
+			data = json.loads(filename.read_text())
+			registry = cls(
+					key=data["key"],
+					managers=tuple((module, tuple(names)) for module, names in data["managers"]),
+					commands=dict(data["commands"]),
+					)
+		except (OSError, ValueError, KeyError, TypeError):
+			return None
+
+		if registry.key != environment_key():
+			return None
+
+		return registry
+
+	def dump(self) -> None:
+		"""
+		Save the registry to the cache.
+
+		Errors writing the file are ignored, as the registry can always be rebuilt.
+		"""
+
+		# this package
+		from repo_helper.utils import cache_dir
+
+		filename = cache_dir() / "registry.json"
+
+		try:
+			filename.parent.maybe_make(parents=True)
+			filename.write_clean(json.dumps(self._asdict(), indent=2))
+		except OSError:
+			pass
+
+
+_registry: Optional[Registry] = None
+
+
+def load_registry(rebuild: bool = False) -> Registry:
+	"""
+	Returns the registry, loading it from the cache or building it if necessary.
+
+	:param rebuild: Rebuild the registry even if the cache is up to date.
+	"""
+
+	global _registry
+
+	if not rebuild and _registry is not None:
+		return _registry
+
+	registry = None if rebuild else Registry.load()
+
+	if registry is None:
+		registry = Registry.build()
+		registry.dump()
+
+	_registry = registry
+	return registry
+
+
+def import_managers() -> None:
+	"""
+	Import the modules which register file managers.
+	"""
+
+	try:
+		for module, _ in load_registry().managers:
+			importlib.import_module(module)
+	except ImportError:
+		load_registry(rebuild=True)
+
+
+def import_command(name: str) -> None:
+	"""
+	Import the module which defines the command ``name``, if there is one.
+
+	:param name:
+	"""
+
+	module = load_registry().commands.get(name)
+
+	if module is None:
+		return
+
+	try:
+		importlib.import_module(module)
+	except ImportError:
+		load_registry(rebuild=True)
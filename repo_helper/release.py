@@ -36,10 +36,7 @@ from consolekit.terminal_colours import Fore
 from consolekit.utils import abort
 from domdf_python_tools.paths import PathPlus, in_directory, traverse_to_file
 from domdf_python_tools.typing import PathLike
-from dulwich.porcelain import tag_create
 from packaging.version import Version
-from southwark import assert_clean
-from southwark.repo import Repo
 from typing_extensions import TypedDict
 
 # this package
@@ -47,6 +44,7 @@ from repo_helper.cli.utils import commit_changed_files
 from repo_helper.configupdater2 import ConfigUpdater
 from repo_helper.core import RepoHelper
 from repo_helper.files.ci_cd import get_bumpversion_filenames
+from repo_helper.git import open_session
 
 __all__ = ["Bumper", "BumpversionFileConfig"]
 
@@ -78,7 +76,10 @@ class Bumper:
 
 		self.repo.load_settings()
 
-		if not assert_clean(self.repo.target_repo):
+		with open_session(self.repo.target_repo) as session:
+			clean = session.assert_clean()
+
+		if not clean:
 			if force:
 				click.echo(Fore.RED("Proceeding anyway"), err=True)
 			else:
@@ -160,13 +161,11 @@ class Bumper:
 			:class:`domdf_python_tools.versions.Version`.
 		"""
 
-		with in_directory(self.repo.target_repo):
+		with in_directory(self.repo.target_repo), open_session(self.repo.target_repo) as session:
 
 			new_version_str = str(new_version)
 
-			dulwich_repo = Repo(self.repo.target_repo)
-
-			if f"v{new_version_str}".encode() in dulwich_repo.refs.as_dict(b"refs/tags"):
+			if f"v{new_version_str}" in session.tags().values():
 				raise abort(f"The tag 'v{new_version_str}' already exists!")
 
 			bumpversion_config = self.get_bumpversion_config(str(self.current_version), new_version_str)
@@ -196,9 +195,10 @@ class Bumper:
 					commit=commit,
 					message=commit_message.encode("UTF-8"),
 					enable_pre_commit=False,
+					session=session,
 					):
 
-				tag_create(dulwich_repo, f"v{new_version_str}")
+				session.tag_create(f"v{new_version_str}")
 
 	def get_current_version(self) -> Version:
 		"""
@@ -4,6 +4,9 @@
 """
 Contains the :class:`pathlib.Path` objects representing the templates directory (:data:`template_dir`),
 and the directory representing the files used to initialise a new repository (:data:`init_repo_template_dir`).
+
+Also provides :func:`~.template_environment`, which loads those templates from memory
+and reuses their compiled bytecode between runs.
 """  # noqa: D400
 #
 #  Copyright © 2020 Dominic Davis-Foster <dominic@davis-foster.co.uk>
@@ -25,13 +28,23 @@ and the directory representing the files used to initialise a new repository (:d
 #
 
 # stdlib
-from typing import Any, Dict
+import os
+import tempfile
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 # 3rd party
 import jinja2
 from domdf_python_tools.paths import PathPlus
+from domdf_python_tools.typing import PathLike
+from jinja2.loaders import split_template_path
 
-__all__ = ["template_dir", "init_repo_template_dir"]
+__all__ = [
+		"template_dir",
+		"init_repo_template_dir",
+		"PackageTemplateLoader",
+		"TemplateBytecodeCache",
+		"template_environment",
+		]
 
 #: The templates directory.
 template_dir = (PathPlus(__file__).parent).absolute()
@@ -46,3 +59,153 @@ class Environment(jinja2.Environment):
 
 Environment.__module__ = jinja2.Environment.__module__
 Environment.__qualname__ = jinja2.Environment.__qualname__
+
+
+def _uptodate() -> bool:
+	return True
+
+
+class PackageTemplateLoader(jinja2.BaseLoader):
+	"""
+	Loads templates shipped with ``repo_helper`` from a directory, keeping their source in memory.
+
+	The templates do not change while ``repo_helper`` is running,
+	so each is read only once and is never reloaded.
+
+	:param directory: The directory containing the templates.
+
+	.. versionadded:: 2026.10.16
+	"""
+
+	def __init__(self, directory: PathLike):
+		self.directory = os.fspath(directory)
+		self._sources: Dict[str, Tuple[str, str]] = {}
+
+	def get_source(  # noqa: D102
+		self,
+		environment: jinja2.Environment,
+		template: str,
+		) -> Tuple[str, str, Callable[[], bool]]:
+
+		if template not in self._sources:
+			filename = os.path.join(self.directory, *split_template_path(template))
+
+			try:
+				with open(filename, encoding="UTF-8") as fp:
+					source = fp.read()
+			except OSError:
+				raise jinja2.TemplateNotFound(template)
+
+			self._sources[template] = (source, filename)
+
+		source, filename = self._sources[template]
+		return source, filename, _uptodate
+
+	def list_templates(self) -> List[str]:  # noqa: D102
+		templates = []
+
+		for dirpath, _, filenames in os.walk(self.directory):
+			for filename in filenames:
+				relative_path = os.path.relpath(os.path.join(dirpath, filename), self.directory)
+				templates.append(relative_path.replace(os.path.sep, '/'))
+
+		return sorted(templates)
+
+
+class TemplateBytecodeCache(jinja2.BytecodeCache):
+	"""
+	Jinja2 bytecode cache which keeps compiled templates in memory and on disk.
+
+	Compiled templates are written to the ``templates`` directory
+	in the :func:`cache directory <repo_helper.utils.cache_dir>`,
+	so templates are only compiled the first time they are used after ``repo_helper``
+	or Python is upgraded. Errors reading or writing the cache are ignored.
+
+	:param directory: The directory to store the compiled templates in.
+		Defaults to the ``templates`` directory in the cache directory.
+
+	.. versionadded:: 2026.10.16
+	"""
+
+	def __init__(self, directory: Optional[PathLike] = None):
+		if directory is None:
+			# this package
+			from repo_helper.utils import cache_dir
+
+			directory = cache_dir() / "templates"
+
+		#: The directory the compiled templates are stored in.
+		self.directory = os.fspath(directory)
+		self._cache: Dict[str, bytes] = {}
+
+	def _filename(self, key: str) -> str:
+		return os.path.join(self.directory, f"{key}.cache")
+
+	def load_bytecode(self, bucket: jinja2.bccache.Bucket) -> None:  # noqa: D102
+		if bucket.key not in self._cache:
+			try:
+				with open(self._filename(bucket.key), "rb") as fp:
+					self._cache[bucket.key] = fp.read()
+			except OSError:
+				return
+
+		bucket.bytecode_from_string(self._cache[bucket.key])
+
+	def dump_bytecode(self, bucket: jinja2.bccache.Bucket) -> None:  # noqa: D102
+		data = bucket.bytecode_to_string()
+		self._cache[bucket.key] = data
+
+		# Write to a temporary file first, as other processes may be reading the cache.
+		try:
+			os.makedirs(self.directory, exist_ok=True)
+			fd, tmp_filename = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+			try:
+				with os.fdopen(fd, "wb") as fp:
+					fp.write(data)
+				os.replace(tmp_filename, self._filename(bucket.key))
+			except BaseException:
+				os.unlink(tmp_filename)
+				raise
+		except OSError:
+			pass
+
+	def clear(self) -> None:  # noqa: D102
+		self._cache.clear()
+
+
+_loaders: Dict[str, PackageTemplateLoader] = {}
+_bytecode_caches: Dict[str, TemplateBytecodeCache] = {}
+
+
+def template_environment(directory: PathLike = template_dir) -> Environment:
+	"""
+	Returns a new :class:`jinja2.Environment` for the templates in ``directory``.
+
+	The template source and compiled templates are shared between environments,
+	and templates are not checked for changes once loaded.
+
+	:param directory: The directory containing the templates.
+		Defaults to :data:`~.template_dir`.
+
+	.. versionadded:: 2026.10.16
+	"""
+
+	directory = os.fspath(directory)
+
+	if directory not in _loaders:
+		_loaders[directory] = PackageTemplateLoader(directory)
+
+	# The cache directory may change, for example in tests.
+	# this package
+	from repo_helper.utils import cache_dir
+
+	bytecode_dir = os.fspath(cache_dir() / "templates")
+	if bytecode_dir not in _bytecode_caches:
+		_bytecode_caches[bytecode_dir] = TemplateBytecodeCache(bytecode_dir)
+
+	return Environment(  # nosec: B701
+		loader=_loaders[directory],
+		undefined=jinja2.StrictUndefined,
+		bytecode_cache=_bytecode_caches[bytecode_dir],
+		auto_reload=False,
+	)
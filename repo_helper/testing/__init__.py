@@ -37,7 +37,6 @@ import sys
 from pathlib import Path
 
 # 3rd party
-import jinja2
 import pytest  # nodep
 from apeye.url import URL
 from domdf_python_tools.paths import PathPlus
@@ -47,7 +46,7 @@ from southwark.repo import Repo
 # this package
 import repo_helper.utils
 from repo_helper.files.linting import lint_warn_list
-from repo_helper.templates import Environment, template_dir
+from repo_helper.templates import Environment, template_dir, template_environment
 from repo_helper.utils import brace
 
 __all__ = [
@@ -133,10 +132,7 @@ def demo_environment() -> Environment:
 			demo_environment.templates.globals["source_dir"] = "src"
 	"""
 
-	templates = Environment(  # nosec: B701
-		loader=jinja2.FileSystemLoader(str(template_dir)),
-		undefined=jinja2.StrictUndefined,
-	)
+	templates = template_environment(template_dir)
 
 	templates.globals.update(
 			dict(
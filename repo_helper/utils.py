@@ -25,10 +25,15 @@ General utilities.
 
 # stdlib
 import datetime
+import hashlib
+import json
 import os
 import pathlib
 import re
+import tempfile
 import textwrap
+import threading
+import time
 from datetime import date, timedelta
 from io import StringIO
 from types import ModuleType
@@ -36,11 +41,13 @@ from typing import (
 		Any,
 		Callable,
 		ContextManager,
+		Dict,
 		Iterable,
 		Iterator,
 		List,
 		Mapping,
 		Optional,
+		Sequence,
 		TypeVar,
 		Union,
 		no_type_check
@@ -51,6 +58,7 @@ import dulwich.repo
 import isort
 import isort.settings
 import jinja2
+import platformdirs
 import yapf_isort
 from apeye.requests_url import RequestsURL
 from domdf_python_tools.compat import importlib_resources
@@ -63,10 +71,13 @@ from domdf_python_tools.typing import PathLike
 from jinja2 import Environment
 from ruamel.yaml import YAML
 from shippinglabel import normalize
-from southwark import open_repo_closing, status
+from southwark import open_repo_closing
 
 # this package
+import repo_helper
 from repo_helper.configupdater2 import ConfigUpdater, Section
+from repo_helper.git import open_session
+from repo_helper.profiling import span
 
 __all__ = [
 		"resource",
@@ -85,7 +96,9 @@ __all__ = [
 		"commit_changes",
 		"stage_changes",
 		"get_license_text",
+		"license_cache_ttl",
 		"set_gh_actions_versions",
+		"cache_dir",
 		]
 
 KT = TypeVar("KT")
@@ -245,6 +258,8 @@ license_lookup = {
 
 _reverse_license_lookup = {v: k for k, v in reversed(list(license_lookup.items()))}
 
+_reformat_lock = threading.Lock()
+
 
 def reformat_file(filename: PathLike, yapf_style: str, isort_config_file: str) -> int:
 	"""
@@ -255,20 +270,22 @@ def reformat_file(filename: PathLike, yapf_style: str, isort_config_file: str) -
 	:param isort_config_file: The filename of the isort configuration file.
 	"""
 
-	old_isort_settings = isort.settings.CONFIG_SECTIONS.copy()
+	# isort and yapf both keep their configuration in global state.
+	with _reformat_lock, span("reformat_file", "format", filename=os.fspath(filename)):
+		old_isort_settings = isort.settings.CONFIG_SECTIONS.copy()
 
-	try:
-		isort.settings.CONFIG_SECTIONS["isort.cfg"] = ("settings", "isort")
+		try:
+			isort.settings.CONFIG_SECTIONS["isort.cfg"] = ("settings", "isort")
 
-		isort_config = isort.Config(settings_file=str(isort_config_file))
-		r = yapf_isort.Reformatter(filename, yapf_style, isort_config)
-		ret = r.run()
-		r.to_file()
+			isort_config = isort.Config(settings_file=str(isort_config_file))
+			r = yapf_isort.Reformatter(filename, yapf_style, isort_config)
+			ret = r.run()
+			r.to_file()
 
-		return ret
+			return ret
 
-	finally:
-		isort.settings.CONFIG_SECTIONS = old_isort_settings
+		finally:
+			isort.settings.CONFIG_SECTIONS = old_isort_settings
 
 
 def indent_join(iterable: Iterable[str]) -> str:
@@ -291,6 +308,11 @@ class IniConfigurator:
 	Base class to generate ``.ini`` configuration files.
 
 	:param base_path:
+
+	.. versionchanged:: 2026.10.16
+
+		Managed sections listed in :attr:`~.section_keys` are copied from the existing file
+		if their inputs are unchanged. The file is now only written if its content changed.
 	"""
 
 	managed_sections: List[str]
@@ -299,9 +321,21 @@ class IniConfigurator:
 	managed_message: str = "This file is managed by 'repo_helper'."
 	filename: str
 
+	#: The configuration keys each managed section depends on, which are looked up with ``self[key]``.
+	#:
+	#: If the values of the keys, and the section in the existing file, are the same as when the section was last generated,
+	#: the section is copied from the existing file rather than being generated again.
+	#: Sections which are not listed are always generated.
+	#:
+	#: .. versionadded:: 2026.10.16
+	section_keys: Dict[str, Sequence[str]] = {}
+
 	def __init__(self, base_path: pathlib.Path):
 		self.base_path = base_path
 		self._ini = ConfigUpdater()
+		self._existing: Optional[ConfigUpdater] = None
+		self._existing_text: Optional[str] = None
+		self._section_cache: Optional[_SectionCache] = None
 
 		self._output = StringList([
 				f"# {self.managed_message}",
@@ -316,6 +350,63 @@ class IniConfigurator:
 
 		self._output.blankline(ensure_single=True)
 
+	def read_existing(self, ini_file: pathlib.Path) -> Optional[ConfigUpdater]:
+		"""
+		Returns the existing ``.ini`` file, or :py:obj:`None` if it does not exist.
+
+		The file is only read and parsed once.
+
+		:param ini_file:
+
+		.. versionadded:: 2026.10.16
+		"""
+
+		if self._existing is None and ini_file.is_file():
+			self._existing_text = PathPlus(ini_file).read_text()
+			self._existing = ConfigUpdater()
+			self._existing.read_string(self._existing_text, source=os.fspath(ini_file))
+
+		return self._existing
+
+	def section_inputs(self, section_name: str) -> Dict[str, Any]:
+		"""
+		Returns the inputs to the given section, other than the code which generates it.
+
+		By default these are the values of the keys listed in :attr:`~.section_keys`.
+
+		:param section_name:
+
+		.. versionadded:: 2026.10.16
+		"""
+
+		return {key: self[key] for key in self.section_keys[section_name]}  # type: ignore[index]
+
+	def generate_sections(self, ini_file: pathlib.Path) -> None:
+		"""
+		Generate the managed sections, by calling the method with the same name as each section.
+
+		Sections whose inputs are unchanged since they were last generated are instead copied from ``ini_file``.
+
+		:param ini_file: The existing ``.ini`` file.
+
+		.. versionadded:: 2026.10.16
+		"""
+
+		existing_config = self.read_existing(ini_file)
+		cache = self._get_section_cache()
+
+		for section_name in self.managed_sections:
+			if (
+					existing_config is not None and section_name in self.section_keys
+					and section_name in existing_config and section_name in self._ini
+					):
+				section = existing_config[section_name]
+				if self._section_digest(section) in cache:
+					self._ini[section_name] = section
+					continue
+
+			getattr(self, re.sub("[:.-]", '_', section_name))()
+
 	def merge_existing(self, ini_file: pathlib.Path) -> None:
 		"""
 		Merge existing sections in the configuration file into the new configuration.
@@ -323,9 +414,8 @@ class IniConfigurator:
 		:param ini_file: The existing ``.ini`` file.
 		"""
 
-		if ini_file.is_file():
-			existing_config = ConfigUpdater()
-			existing_config.read(str(ini_file))
+		existing_config = self.read_existing(ini_file)
+		if existing_config is not None:
 			for section in existing_config.sections_blocks():
 				if section.name not in self.managed_sections:
 					self._ini.add_section(section)
@@ -337,12 +427,50 @@ class IniConfigurator:
 
 		ini_file = PathPlus(self.base_path / self.filename)
 
-		for section_name in self.managed_sections:
-			getattr(self, re.sub("[:.-]", '_', section_name))()
-
+		self.generate_sections(ini_file)
 		self.merge_existing(ini_file)
 		self._output.append(str(self._ini))
-		ini_file.write_lines(self._output)
+		self._write(ini_file)
+
+	def _write(self, ini_file: PathPlus) -> None:
+		"""
+		Write ``self._output`` to ``ini_file`` if its content changed, and record the managed sections which were written.
+		"""
+
+		# The same as PathPlus.write_lines
+		content = StringList('\n'.join(self._output))
+		content.blankline(ensure_single=True)
+		text = str(content)
+
+		if text != self._existing_text:
+			ini_file.write_text(text)
+
+		cache = self._get_section_cache()
+		for section_name in self.managed_sections:
+			if section_name in self.section_keys and section_name in self._ini:
+				cache.add(self._section_digest(self._ini[section_name]))
+		cache.save()
+
+	def _get_section_cache(self) -> "_SectionCache":
+		if self._section_cache is None:
+			self._section_cache = _SectionCache(type(self))
+		return self._section_cache
+
+	def _section_digest(self, section: Section) -> str:
+		"""
+		Returns a digest of the inputs to the given managed section, and the section's content.
+		"""
+
+		digest = hashlib.sha256(_generator_key().encode("UTF-8"))
+		digest.update(f"\0{type(self).__module__}.{type(self).__qualname__}\0{section.name}\0".encode("UTF-8"))
+
+		digest.update(_stable_repr(self.section_inputs(section.name)).encode("UTF-8"))
+
+		# Ignore whitespace which is removed when the file is written.
+		content = '\n'.join(line.rstrip() for line in str(section).splitlines()).rstrip()
+		digest.update(f"\0{content}".encode("UTF-8"))
+
+		return digest.hexdigest()
 
 	def copy_existing_value(self, section: Section, key: str) -> None:
 		"""
@@ -356,6 +484,103 @@ class IniConfigurator:
 			self._ini[section.name][key] = section[key].value
 
 
+def _generator_key() -> str:
+	"""
+	Returns a string which changes when the code generating ``.ini`` files may have changed.
+	"""
+
+	parts = [repo_helper.__version__]
+
+	package_dir = os.path.dirname(os.path.abspath(__file__))
+	files_dir = os.path.join(package_dir, "files")
+	filenames = [os.path.join(files_dir, f) for f in sorted(os.listdir(files_dir)) if f.endswith(".py")]
+	filenames.extend(os.path.join(package_dir, f) for f in ("configupdater2.py", "utils.py"))
+
+	for filename in filenames:
+		parts.append(f"{os.path.basename(filename)}:{os.stat(filename).st_mtime_ns}")
+
+	return '\n'.join(parts)
+
+
+def _stable_repr(value: Any) -> str:
+	"""
+	Returns a representation of ``value`` which is the same between runs.
+
+	:param value:
+	"""
+
+	if isinstance(value, Mapping):
+		items = sorted((_stable_repr(k), _stable_repr(v)) for k, v in value.items())
+		return f"{{{', '.join(f'{k}: {v}' for k, v in items)}}}"
+	elif isinstance(value, (set, frozenset)):
+		return f"{{{', '.join(sorted(map(_stable_repr, value)))}}}"
+	elif isinstance(value, (list, tuple)):
+		return f"[{', '.join(map(_stable_repr, value))}]"
+	elif isinstance(value, (str, int, float, bool)) or value is None:
+		return json.dumps(value)
+	elif isinstance(value, type) or callable(value):
+		return f"<{getattr(value, '__module__', '')}.{getattr(value, '__qualname__', type(value).__qualname__)}>"
+	else:
+		return repr(value)
+
+
+class _SectionCache:
+	"""
+	The digests of the sections last written by an :class:`~.IniConfigurator` subclass.
+
+	The digests are of the section's content, so the cache is shared by all repositories.
+
+	:param configurator: The :class:`~.IniConfigurator` subclass.
+	"""
+
+	#: The maximum number of digests to keep.
+	max_entries: int = 5000
+
+	def __init__(self, configurator: type):
+		self.filename = cache_dir() / "ini_sections" / f"{configurator.__module__}.{configurator.__qualname__}.json"
+
+		try:
+			self.digests: Dict[str, None] = dict.fromkeys(self.filename.load_json()["digests"])
+		except (OSError, ValueError, KeyError, TypeError):
+			# Missing, corrupt, or from an older version.
+			self.digests = {}
+
+	def __contains__(self, digest: str) -> bool:
+		return digest in self.digests
+
+	def add(self, digest: str) -> None:
+		"""
+		Record the digest of a section which was written.
+
+		:param digest:
+		"""
+
+		# Keep the most recently written digests at the end.
+		self.digests.pop(digest, None)
+		self.digests[digest] = None
+
+	def save(self) -> None:
+		"""
+		Write the cache to disk.
+		"""
+
+		digests = list(self.digests)[-self.max_entries:]
+
+		# Write to a temporary file first, as other processes may be reading the cache.
+		try:
+			self.filename.parent.maybe_make(parents=True)
+			fd, tmp_filename = tempfile.mkstemp(dir=self.filename.parent, suffix=".tmp")
+			try:
+				with os.fdopen(fd, 'w', encoding="UTF-8") as fp:
+					json.dump({"digests": digests}, fp)
+				os.replace(tmp_filename, self.filename)
+			except BaseException:
+				os.unlink(tmp_filename)
+				raise
+		except OSError:
+			pass
+
+
 def easter_egg() -> None:  # noqa: D103  # pragma: no cover
 	easter = calc_easter(today.year)
 	easter_margin = timedelta(days=7)
@@ -396,32 +621,14 @@ def stage_changes(
 		Not all files in ``files`` will have been changed, and only changes are staged.
 
 	.. versionadded:: 2020.11.23
-	"""
-
-	with open_repo_closing(repo) as repo:
-		stat = status(repo)
-		unstaged_changes = stat.unstaged
-		untracked_files = stat.untracked
 
-		staged_files = []
+	.. versionchanged:: 2026.10.16
 
-		for filename in files:
-			filename = PathPlus(filename)
-
-			if filename.is_absolute():
-				filename = filename.relative_to(repo.path)
-
-			if filename in unstaged_changes or filename in untracked_files:
-				repo.stage(os.path.normpath(filename))
-				staged_files.append(filename)
-
-			elif (
-					filename in stat.staged["add"] or filename in stat.staged["modify"]
-					or filename in stat.staged["delete"]
-					):
-				staged_files.append(filename)
+		Only the given files are checked for changes, using :meth:`repo_helper.git.GitSession.stage_changes`.
+	"""
 
-	return staged_files
+	with open_session(repo) as session:
+		return session.stage_changes(files)
 
 
 def commit_changes(
@@ -439,7 +646,7 @@ def commit_changes(
 	.. versionadded:: 2020.11.23
 	"""
 
-	with open_repo_closing(repo) as repo:
+	with open_repo_closing(repo) as repo, span("commit", "git"):
 		current_time = datetime.datetime.now(datetime.timezone.utc).astimezone()
 
 		tzinfo = current_time.tzinfo
@@ -520,14 +727,34 @@ def set_gh_actions_versions(py_versions: Iterable[str]) -> List[str]:
 
 _yaml_round_trip_dumper = YAML(typ="rt")
 _yaml_round_trip_dumper.default_flow_style = False
+_yaml_round_trip_lock = threading.Lock()
 
 
 def _round_trip_dump(obj: Any) -> str:
 	stream = StringIO()
-	_yaml_round_trip_dumper.dump(obj, stream=stream)
+
+	with _yaml_round_trip_lock:
+		_yaml_round_trip_dumper.dump(obj, stream=stream)
+
 	return stream.getvalue()
 
 
+def cache_dir() -> PathPlus:
+	"""
+	Returns the directory in which ``repo_helper`` stores cached data.
+
+	This is the user's cache directory for the platform,
+	unless overridden by the ``REPO_HELPER_CACHE_DIR`` environment variable.
+
+	.. versionadded:: 2026.10.16
+	"""
+
+	if os.environ.get("REPO_HELPER_CACHE_DIR"):
+		return PathPlus(os.environ["REPO_HELPER_CACHE_DIR"])
+
+	return PathPlus(platformdirs.user_cache_dir("repo_helper"))
+
+
 @no_type_check
 def resource(
 		package: Union[str, ModuleType],
@@ -570,11 +797,16 @@ license_file_lookup = dict([
 		])
 
 
+#: How long, in seconds, a license template downloaded by :func:`~.get_license_text` is reused for.
+license_cache_ttl: float = 7 * 24 * 60 * 60
+
+
 def get_license_text(
 		license_name: str,
 		copyright_years: Union[str, int],
 		author: str,
 		project_name: str,
+		fetch: Optional[bool] = None,
 		) -> str:
 	"""
 	Obtain the license text for the given license.
@@ -588,8 +820,16 @@ def get_license_text(
 		Not supported by all licenses.
 	:param project_name: The name of the project to display in the license.
 		Not supported by all licenses.
+	:param fetch: Whether to download the latest version of the license template.
+		If :py:obj:`None` the ``REPO_HELPER_FETCH_LICENSES`` environment variable is used, which defaults to off.
 
 	Licenses are obtained from https://github.com/licenses/license-templates.
+
+	.. versionchanged:: 2026.10.16
+
+		The license templates are bundled with ``repo_helper``, and are only downloaded if ``fetch`` is :py:obj:`True`.
+		Downloaded templates are cached in the :func:`cache directory <repo_helper.utils.cache_dir>`
+		for :data:`~.license_cache_ttl` seconds. The bundled template is used if the download fails.
 	"""
 
 	if license_name in license_lookup:
@@ -608,20 +848,15 @@ def get_license_text(
 	elif license_name == "Apache Software License":
 		license_url = base_license_url / "apache.txt"
 
-	if license_url is not None:
-		for attempt in [1, 2]:
+	if fetch is None:
+		fetch = os.environ.get("REPO_HELPER_FETCH_LICENSES", '').lower() in {"1", "true", "yes"}
 
-			try:
-				response = license_url.get()
-			except Exception:
-				# except requests.exceptions.RequestException:
-				if attempt == 1:
-					continue
-				else:
-					raise
+	if license_url is not None:
+		if fetch:
+			license_text = _fetch_license_template(license_url)
 
-			if response.status_code == 200:
-				license_text = response.text
+		if not license_text:
+			license_text = _bundled_license_template(license_url)
 
 	license_template = Environment(
 			loader=jinja2.BaseLoader(),
@@ -635,6 +870,49 @@ def get_license_text(
 			)
 
 
+def _bundled_license_template(license_url: RequestsURL) -> str:
+	# The templates are named as at the URL they were downloaded from.
+	template = importlib_resources.files(repo_helper) / "licenses" / license_url.name
+
+	try:
+		return template.read_text(encoding="UTF-8")
+	except FileNotFoundError:
+		return ''
+
+
+def _fetch_license_template(license_url: RequestsURL) -> str:
+	cache_file = cache_dir() / "licenses" / f"{hashlib.sha256(str(license_url).encode()).hexdigest()}.txt"
+
+	try:
+		if time.time() - cache_file.stat().st_mtime < license_cache_ttl:
+			return cache_file.read_text(encoding="UTF-8")
+	except OSError:
+		pass
+
+	for attempt in [1, 2]:
+
+		try:
+			with span(f"GET {license_url}", "network"):
+				response = license_url.get()
+		except Exception:
+			# except requests.exceptions.RequestException:
+			if attempt == 1:
+				continue
+			else:
+				return ''
+
+		if response.status_code == 200:
+			try:
+				cache_file.parent.maybe_make(parents=True)
+				cache_file.write_text(response.text, encoding="UTF-8")
+			except OSError:
+				pass
+
+			return response.text
+
+	return ''
+
+
 def get_keys(mapping: Mapping[KT, VT], *keys: KT) -> Iterator[VT]:
 	r"""
 	Returns an iterator over ``\*keys`` from ``mapping``.
@@ -0,0 +1,271 @@
+#!/usr/bin/env python
+#
+#  vfs.py
+"""
+Staging area for the files written by ``repo_helper``, which are only written to the repository if they changed.
+
+Managers are run against a temporary copy of the files they read and write.
+Once all managers have run the copies are compared with the repository,
+and only files whose contents differ are written back, so unchanged files keep their modification times.
+
+.. versionadded:: 2026.10.16
+"""
+#
+#  Copyright © 2026 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+
+# stdlib
+import difflib
+import os
+import posixpath
+import shutil
+import tempfile
+from types import TracebackType
+from typing import Dict, Iterable, List, NamedTuple, Optional, Type
+
+# 3rd party
+from consolekit.utils import coloured_diff
+from domdf_python_tools.paths import PathPlus
+from domdf_python_tools.typing import PathLike
+
+__all__ = ["FileChange", "VirtualFileSystem", "unified_diff"]
+
+#: Directories which are not copied by :meth:`VirtualFileSystem.load_tree`.
+_IGNORED_DIRECTORIES = frozenset({
+		".git",
+		".hg",
+		".tox",
+		".nox",
+		".venv",
+		"venv",
+		"__pycache__",
+		".mypy_cache",
+		".pytest_cache",
+		"node_modules",
+		})
+
+
+class FileChange(NamedTuple):
+	"""
+	A file which differs between the staging area and the repository.
+	"""
+
+	#: The filename, relative to the repository root, in POSIX form.
+	filename: str
+
+	#: The contents of the file in the repository, or :py:obj:`None` if it does not exist.
+	old: Optional[bytes]
+
+	#: The contents of the file in the staging area, or :py:obj:`None` if it was deleted.
+	new: Optional[bytes]
+
+
+class VirtualFileSystem:
+	"""
+	Temporary copy of part of a repository, which managers write to instead of the repository itself.
+
+	Must be used as a context manager; the staging area is removed on exit.
+
+	:param repo_path: Path to the repository root.
+
+	.. code-block:: python
+
+		with VirtualFileSystem(repo_path) as vfs:
+			vfs.load("tox.ini")
+			make_tox(vfs.root, templates)
+			vfs.flush()
+	"""
+
+	#: The repository the files will be written to.
+	repo_path: PathPlus
+
+	def __init__(self, repo_path: PathLike):
+		self.repo_path = PathPlus(repo_path)
+		self._tmpdir: Optional[tempfile.TemporaryDirectory] = None
+		self._loaded: Dict[str, Optional[bytes]] = {}
+
+	@property
+	def root(self) -> PathPlus:
+		"""
+		The root of the staging area, which should be passed to managers in place of :attr:`~.repo_path`.
+		"""
+
+		if self._tmpdir is None:
+			raise RuntimeError("The staging area only exists inside the 'with' block.")
+
+		return PathPlus(self._tmpdir.name)
+
+	def __enter__(self) -> "VirtualFileSystem":
+		self._tmpdir = tempfile.TemporaryDirectory(prefix="repo_helper_")
+		self._loaded = {}
+		return self
+
+	def __exit__(
+			self,
+			exc_type: Optional[Type[BaseException]],
+			exc_val: Optional[BaseException],
+			exc_tb: Optional[TracebackType],
+			) -> None:
+		if self._tmpdir is not None:
+			self._tmpdir.cleanup()
+			self._tmpdir = None
+
+	def load(self, *filenames: str) -> None:
+		"""
+		Copy files from the repository into the staging area.
+
+		Files deleted from the staging area are deleted from the repository by :meth:`~.flush`,
+		but only if they were loaded.
+
+		:param filenames: Filenames relative to the repository root.
+			Files which do not exist in the repository are ignored.
+		"""
+
+		for filename in filenames:
+			filename = posixpath.normpath(filename)
+			if filename in self._loaded:
+				continue
+
+			source = self.repo_path / filename
+
+			if source.is_file():
+				destination = self.root / filename
+				destination.parent.maybe_make(parents=True)
+				shutil.copy2(source, destination)
+				self._loaded[filename] = source.read_bytes()
+			else:
+				self._loaded[filename] = None
+
+	def load_tree(self) -> None:
+		"""
+		Copy every file in the repository into the staging area.
+
+		This is needed for managers which have not declared the files they read.
+		Version control and virtualenv directories are skipped.
+		"""
+
+		for dirpath, dirnames, filenames in os.walk(self.repo_path):
+			dirnames[:] = [d for d in dirnames if d not in _IGNORED_DIRECTORIES]
+			relative_dir = PathPlus(dirpath).relative_to(self.repo_path)
+			self.load(*((relative_dir / filename).as_posix() for filename in filenames))
+
+	def changes(self) -> List[FileChange]:
+		"""
+		Returns the files which differ between the staging area and the repository, sorted by filename.
+		"""
+
+		changes = []
+		staged = set()
+
+		for file in self.root.rglob('*'):
+			if not file.is_file():
+				continue
+
+			filename = file.relative_to(self.root).as_posix()
+			staged.add(filename)
+			new = file.read_bytes()
+
+			if filename in self._loaded:
+				old = self._loaded[filename]
+			elif (self.repo_path / filename).is_file():
+				old = (self.repo_path / filename).read_bytes()
+			else:
+				old = None
+
+			if old != new:
+				changes.append(FileChange(filename, old, new))
+
+		for filename, old in self._loaded.items():
+			if old is not None and filename not in staged:
+				changes.append(FileChange(filename, old, None))
+
+		return sorted(changes)
+
+	def flush(self) -> List[FileChange]:
+		"""
+		Write the files which have changed to the repository, and delete those which were deleted.
+
+		Files whose contents are unchanged are not touched.
+
+		:returns: The changes which were written.
+		"""
+
+		changes = self.changes()
+
+		for change in changes:
+			target = self.repo_path / change.filename
+
+			if change.new is None:
+				target.unlink(missing_ok=True)
+				self._remove_empty_parents(target)
+			else:
+				target.parent.maybe_make(parents=True)
+				target.write_bytes(change.new)
+				shutil.copymode(self.root / change.filename, target)
+
+			self._loaded[change.filename] = change.new
+
+		for directory in self.root.rglob('*'):
+			if directory.is_dir():
+				(self.repo_path / directory.relative_to(self.root)).maybe_make(parents=True)
+
+		return changes
+
+	def _remove_empty_parents(self, target: PathPlus) -> None:
+		# Remove directories which the managers removed, if they are now empty in the repository.
+		for parent in target.relative_to(self.repo_path).parents:
+			if parent == PathPlus('.') or (self.root / parent).is_dir():
+				break
+
+			directory = self.repo_path / parent
+			if not directory.is_dir() or any(directory.iterdir()):
+				break
+
+			directory.rmdir()
+
+
+def unified_diff(changes: Iterable[FileChange], coloured: bool = False) -> str:
+	"""
+	Returns a unified diff of the given changes.
+
+	:param changes:
+	:param coloured: Whether to colour added and removed lines.
+	"""
+
+	output = []
+
+	for filename, old, new in changes:
+		fromfile = f"a/{filename}" if old is not None else "/dev/null"
+		tofile = f"b/{filename}" if new is not None else "/dev/null"
+
+		try:
+			old_lines = (old or b'').decode("UTF-8").splitlines()
+			new_lines = (new or b'').decode("UTF-8").splitlines()
+		except UnicodeDecodeError:
+			output.append(f"Binary files {fromfile} and {tofile} differ\n")
+			continue
+
+		if coloured:
+			output.append(coloured_diff(old_lines, new_lines, fromfile, tofile, lineterm=''))
+		else:
+			output.extend(
+					f"{line}\n"
+					for line in difflib.unified_diff(old_lines, new_lines, fromfile, tofile, lineterm='')
+					)
+
+	return ''.join(output)
@@ -0,0 +1,354 @@
+#!/usr/bin/env python
+#
+#  watch.py
+"""
+Update the managed files whenever ``repo_helper.yml`` or a file the managers read changes.
+
+Each run is :mod:`incremental <repo_helper.incremental>`, so only managers whose inputs changed are run.
+Changes are written to the working tree but never staged or committed.
+
+On Linux the repository is watched with inotify. Elsewhere, or if inotify is not available,
+the files are polled.
+
+.. versionadded:: 2026.10.16
+"""
+#
+#  Copyright © 2026 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+
+# stdlib
+import ctypes
+import ctypes.util
+import os
+import posixpath
+import select
+import sys
+import time
+from abc import ABC, abstractmethod
+from types import TracebackType
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Type
+
+# 3rd party
+from domdf_python_tools.paths import PathPlus
+from domdf_python_tools.typing import PathLike
+
+# this package
+from repo_helper.configuration import _parse_yaml, migrate_config
+from repo_helper.core import RepoHelper
+from repo_helper.daemon import WarmState
+from repo_helper.vfs import FileChange
+
+__all__ = ["InotifyWatcher", "PollingWatcher", "Watcher", "snapshot", "watch", "watched_files"]
+
+#: The modification time and size of a file, or :py:obj:`None` if it does not exist.
+FileState = Optional[Tuple[int, int]]
+
+
+def watched_files(rh: RepoHelper) -> List[str]:
+	"""
+	Returns the files which affect the output of ``rh``, relative to the repository root.
+
+	:param rh: A :class:`~repo_helper.core.RepoHelper` whose settings have been loaded.
+	"""
+
+	# The configuration file and the requirements files it refers to, such as those for extras.
+	config_files = [
+			filename.relative_to(rh.target_repo).as_posix()
+			for filename in _parse_yaml(rh.target_repo)[1]
+			]
+
+	return sorted({"repo_helper.yml", *config_files, *map(posixpath.normpath, rh.input_files())})
+
+
+def snapshot(repo_path: PathLike, filenames: Iterable[str]) -> Dict[str, FileState]:
+	"""
+	Returns the modification time and size of each file.
+
+	:param repo_path: Path to the repository root.
+	:param filenames: Filenames relative to the repository root.
+	"""
+
+	states: Dict[str, FileState] = {}
+
+	for filename in filenames:
+		try:
+			stat = os.stat(os.path.join(repo_path, filename))
+			states[filename] = (stat.st_mtime_ns, stat.st_size)
+		except OSError:
+			states[filename] = None
+
+	return states
+
+
+class Watcher(ABC):
+	"""
+	Base class for objects which wait for files to change.
+
+	A watcher may report changes which did not affect the files,
+	so the caller should compare a :func:`~.snapshot` of the files before and after.
+
+	:param repo_path: Path to the repository root.
+	:param filenames: The files to watch, relative to the repository root.
+	"""
+
+	def __init__(self, repo_path: PathLike, filenames: Iterable[str]):
+		self.repo_path = PathPlus(repo_path)
+		self.filenames = list(filenames)
+
+	@abstractmethod
+	def wait(self, timeout: Optional[float] = None) -> bool:
+		"""
+		Wait until a file may have changed.
+
+		:param timeout: The maximum number of seconds to wait. :py:obj:`None` to wait indefinitely.
+
+		:returns: :py:obj:`False` if the timeout expired first.
+		"""
+
+	def close(self) -> None:
+		"""
+		Stop watching the files.
+		"""
+
+	def __enter__(self) -> "Watcher":
+		return self
+
+	def __exit__(
+			self,
+			exc_type: Optional[Type[BaseException]],
+			exc_val: Optional[BaseException],
+			exc_tb: Optional[TracebackType],
+			) -> None:
+		self.close()
+
+
+class PollingWatcher(Watcher):
+	"""
+	Watches files by checking their modification time and size at a regular interval.
+
+	:param repo_path: Path to the repository root.
+	:param filenames: The files to watch, relative to the repository root.
+	:param interval: The number of seconds between checks.
+	"""
+
+	def __init__(self, repo_path: PathLike, filenames: Iterable[str], interval: float = 0.5):
+		super().__init__(repo_path, filenames)
+		self.interval = interval
+		self._states = snapshot(self.repo_path, self.filenames)
+
+	def wait(self, timeout: Optional[float] = None) -> bool:  # noqa: D102
+		deadline = None if timeout is None else time.monotonic() + timeout
+
+		while True:
+			states = snapshot(self.repo_path, self.filenames)
+			if states != self._states:
+				self._states = states
+				return True
+
+			if deadline is None:
+				time.sleep(self.interval)
+			elif time.monotonic() >= deadline:
+				return False
+			else:
+				time.sleep(min(self.interval, max(deadline - time.monotonic(), 0)))
+
+
+# From <sys/inotify.h>
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_MASK = _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+
+
+class InotifyWatcher(Watcher):
+	"""
+	Watches files using the Linux inotify API.
+
+	The directories containing the files are watched, so files which are replaced
+	(as many editors do when saving) or created are noticed.
+
+	:param repo_path: Path to the repository root.
+	:param filenames: The files to watch, relative to the repository root.
+
+	:raises: :exc:`OSError` if inotify is not available.
+	"""
+
+	def __init__(self, repo_path: PathLike, filenames: Iterable[str]):
+		super().__init__(repo_path, filenames)
+
+		if not sys.platform.startswith("linux"):
+			raise OSError("inotify is only available on Linux")
+
+		libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+		self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+		if self._fd < 0:
+			errno = ctypes.get_errno()
+			raise OSError(errno, os.strerror(errno))
+
+		for directory in self._directories():
+			if libc.inotify_add_watch(self._fd, os.fsencode(directory), _IN_MASK) < 0:
+				errno = ctypes.get_errno()
+				self.close()
+				raise OSError(errno, os.strerror(errno), directory)
+
+	def _directories(self) -> List[str]:
+		"""
+		Returns the directories to watch, using the nearest existing parent for directories which don't exist.
+		"""
+
+		directories = set()
+
+		for filename in self.filenames:
+			directory = (self.repo_path / filename).parent
+			while not directory.is_dir() and directory != self.repo_path:
+				directory = directory.parent
+			directories.add(os.fspath(directory))
+
+		return sorted(directories)
+
+	def wait(self, timeout: Optional[float] = None) -> bool:  # noqa: D102
+		readable, _, _ = select.select([self._fd], [], [], timeout)
+		if not readable:
+			return False
+
+		# Discard the events; the caller compares snapshots of the files.
+		try:
+			while os.read(self._fd, 65536):
+				pass
+		except BlockingIOError:
+			pass
+
+		return True
+
+	def close(self) -> None:  # noqa: D102
+		if self._fd >= 0:
+			os.close(self._fd)
+			self._fd = -1
+
+
+def _make_watcher(repo_path: PathLike, filenames: Iterable[str], poll: bool = False) -> Watcher:
+	if not poll:
+		try:
+			return InotifyWatcher(repo_path, filenames)
+		except (OSError, AttributeError):
+			# AttributeError if libc does not have the inotify functions.
+			pass
+
+	return PollingWatcher(repo_path, filenames)
+
+
+def watch(
+		repo_path: PathLike,
+		jobs: int = 1,
+		debounce: float = 0.2,
+		poll: bool = False,
+		on_run: Optional[Callable[[List[FileChange]], None]] = None,
+		on_error: Optional[Callable[[Exception], None]] = None,
+		max_runs: Optional[int] = None,
+		) -> None:
+	"""
+	Run ``repo_helper``, then run it again each time its inputs change.
+
+	Runs until interrupted, or until ``max_runs`` runs have completed.
+
+	:param repo_path: Path to the repository root.
+	:param jobs: The number of managers to run concurrently.
+	:param debounce: The number of seconds to wait for further changes before running,
+		so a burst of changes results in a single run.
+	:param poll: Poll the files for changes rather than using inotify.
+	:param on_run: Called with the changes made by each run.
+	:param on_error: Called if a run raises an exception, for example because ``repo_helper.yml`` is invalid.
+		If not given the exception is raised.
+	:param max_runs: The maximum number of runs, including the first.
+	"""
+
+	repo_path = PathPlus(repo_path)
+	filenames = ["repo_helper.yml"]
+	runs = 0
+
+	with WarmState():
+		while max_runs is None or runs < max_runs:
+			# Update the configuration file first, so that doesn't trigger another run.
+			migrate_config(repo_path)
+
+			# Files edited while repo_helper is running must still trigger another run.
+			before_run = snapshot(repo_path, filenames)
+			rh = RepoHelper(repo_path)
+
+			try:
+				rh.load_settings()
+
+				# Also record the files this configuration reads which weren't watched before,
+				# such as the requirements file for a new extra.
+				before_run.update(snapshot(repo_path, set(watched_files(rh)).difference(before_run)))
+
+				rh.run(jobs=jobs, incremental=True)
+			except Exception as e:
+				if on_error is None:
+					raise
+				on_error(e)
+			else:
+				if on_run is not None:
+					on_run(rh.changes)
+
+			runs += 1
+			if max_runs is not None and runs >= max_runs:
+				break
+
+			try:
+				filenames = watched_files(rh)
+			except Exception:  # pylint: disable=broad-except
+				# The configuration is invalid; wait for it to be fixed.
+				filenames = ["repo_helper.yml"]
+
+			# Ignore the changes made by repo_helper itself.
+			written = {change.filename for change in rh.changes}
+			before = snapshot(repo_path, filenames)
+			for filename in before:
+				if filename in before_run and filename not in written:
+					before[filename] = before_run[filename]
+
+			with _make_watcher(repo_path, filenames, poll=poll) as watcher:
+				while _settled_snapshot(watcher, debounce) == before:
+					watcher.wait()
+
+
+def _settled_snapshot(watcher: Watcher, debounce: float) -> Dict[str, FileState]:
+	"""
+	Returns a :func:`~.snapshot` of the watched files once they have stopped changing.
+
+	:param watcher:
+	:param debounce: The number of seconds the files must be unchanged for.
+	"""
+
+	states = snapshot(watcher.repo_path, watcher.filenames)
+
+	while True:
+		while watcher.wait(debounce):
+			pass
+
+		# A file may have been changed between the watcher returning and the snapshot.
+		latest = snapshot(watcher.repo_path, watcher.filenames)
+		if latest == states:
+			return states
+
+		states = latest
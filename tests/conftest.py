@@ -26,6 +26,8 @@ from typing import Iterator
 
 # 3rd party
 import pytest
+from domdf_python_tools.paths import PathPlus
+from southwark.repo import Repo
 
 # this package
 from repo_helper.configuration import metadata
@@ -33,6 +35,30 @@ from repo_helper.configuration import metadata
 pytest_plugins = ("coincidence", "repo_helper.testing")
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_pathplus, monkeypatch) -> None:
+	monkeypatch.setenv("REPO_HELPER_CACHE_DIR", str(tmp_pathplus / ".repo_helper_cache"))
+
+
+@pytest.fixture()
+def repo_path(temp_repo: Repo) -> PathPlus:
+	"""
+	A git repository containing the example ``repo_helper.yml``
+	and the files ``repo_helper`` expects to find, so it can be run.
+	"""
+
+	repo_path = PathPlus(temp_repo.path)
+	(repo_path / "requirements.txt").touch()
+	(repo_path / "tests").maybe_make()
+	(repo_path / "tests" / "requirements.txt").touch()
+	(repo_path / "README.rst").touch()
+	(repo_path / "doc-source").mkdir()
+	(repo_path / "doc-source" / "index.rst").touch()
+	(repo_path / ".pre-commit-config.yaml").touch()
+
+	return repo_path
+
+
 @pytest.fixture()
 def fixed_version_number(monkeypatch) -> Iterator[None]:
 	monkeypatch.setattr(metadata.version, "validator", lambda *args: "2020.12.18")
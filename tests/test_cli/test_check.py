@@ -0,0 +1,36 @@
+# 3rd party
+from consolekit.testing import CliRunner, Result
+from domdf_python_tools.paths import PathPlus, in_directory
+
+# this package
+from repo_helper.cli.commands.check import check
+from repo_helper.core import RepoHelper
+
+
+def test_check(repo_path: PathPlus):
+	with in_directory(repo_path):
+		runner = CliRunner(mix_stderr=False)
+
+		# No manifest yet, so the files are rendered.
+		result: Result = runner.invoke(check, catch_exceptions=False)
+		assert result.exit_code == 1
+		assert "  tox.ini" in result.stderr.splitlines()
+		assert "  .repo_helper_manifest.json" not in result.stderr.splitlines()
+
+		rh = RepoHelper(repo_path)
+		rh.load_settings()
+		rh.run()
+
+		result = runner.invoke(check, catch_exceptions=False)
+		assert result.exit_code == 0
+		assert result.stdout == "All files are up to date.\n"
+
+		(repo_path / "setup.cfg").write_text("[metadata]\n")
+
+		result = runner.invoke(check, catch_exceptions=False)
+		assert result.exit_code == 1
+		assert result.stderr.splitlines() == [
+				"The following files managed by 'repo_helper' are out of date:",
+				"  setup.cfg",
+				"Run 'repo_helper' to update them.",
+				]
@@ -0,0 +1,75 @@
+# 3rd party
+import pytest
+from consolekit.testing import CliRunner, Result
+from domdf_python_tools.paths import PathPlus, in_directory
+
+# this package
+from repo_helper.cli.commands.config import parse_edit, set_
+from repo_helper.configuration import migrate_config, parse_yaml
+
+
+@pytest.mark.parametrize(
+		"edit, expected",
+		[
+				("enable_docs=false", ("enable_docs", '=', False)),
+				("version=1.2.3", ("version", '=', "1.2.3")),
+				("short_desc=a: b", ("short_desc", '=', "a: b")),
+				("python_versions+=3.10", ("python_versions", "+=", "3.10")),
+				("python_versions+=[3.10, '3.11']", ("python_versions", "+=", ["3.10", "3.11"])),
+				("keywords-=foo", ("keywords", "-=", "foo")),
+				("docs_url=", ("docs_url", '=', '')),
+				],
+		)
+def test_parse_edit(edit: str, expected):
+	assert parse_edit(edit) == expected
+
+
+def test_config_set(tmp_pathplus: PathPlus, example_config: str):
+	(tmp_pathplus / "repo_helper.yml").write_text(example_config)
+
+	with in_directory(tmp_pathplus):
+		runner = CliRunner()
+		result: Result = runner.invoke(
+				set_,
+				args=[
+						"enable_docs=false",
+						"python_versions+=[3.13]",
+						"python_versions-=3.6",
+						"keywords+=[yaml, configuration]",
+						"--sort",
+						"-d",
+						"conda_channels",
+						],
+				)
+		assert result.exit_code == 0, result.stdout
+
+	config = parse_yaml(tmp_pathplus)
+	assert not config["enable_docs"]
+	assert "3.13" in config["python_versions"]
+	assert "3.6" not in config["python_versions"]
+	assert config["keywords"] == ["configuration", "yaml"]
+	assert "conda_channels:" not in (tmp_pathplus / "repo_helper.yml").read_text()
+
+
+@pytest.mark.parametrize(
+		"args, message",
+		[
+				(["not_a_key=1"], "'not_a_key' was unexpected"),
+				(["modname=[1]"], "Invalid configuration for 'modname'"),
+				(["-d", "docs_url"], "Cannot delete 'docs_url' as it is not set."),
+				(["keywords-=foo"], "Cannot remove values from 'keywords' as it is not set."),
+				(["modname"], "is not in the form KEY=VALUE"),
+				],
+		)
+def test_config_set_errors(tmp_pathplus: PathPlus, example_config: str, args, message: str):
+	(tmp_pathplus / "repo_helper.yml").write_text(example_config)
+	migrate_config(tmp_pathplus)
+	before = (tmp_pathplus / "repo_helper.yml").read_text()
+
+	with in_directory(tmp_pathplus):
+		runner = CliRunner()
+		result: Result = runner.invoke(set_, args=["enable_docs=false", *args])
+		assert result.exit_code != 0
+		assert message in result.stdout
+
+	assert (tmp_pathplus / "repo_helper.yml").read_text() == before
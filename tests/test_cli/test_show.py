@@ -1,6 +1,9 @@
 # stdlib
+import json
+import shutil
 import string
 import sys
+from typing import List
 
 # 3rd party
 import pytest
@@ -10,6 +13,7 @@ from consolekit.testing import CliRunner, Result
 from domdf_python_tools.paths import PathPlus, in_directory
 
 # this package
+from repo_helper.cli import cli
 from repo_helper.cli.commands import show
 from tests import pypy_windows_dulwich
 
@@ -39,6 +43,75 @@ def test_version(
 	result.check_stdout(advanced_file_regression)
 
 
+@pypy_windows_dulwich
+def test_version_json(tmp_repo: PathPlus):
+	(tmp_repo / "repo_helper.yml").write_lines([
+			"modname: repo_helper",
+			'copyright_years: "2020"',
+			'author: "Dominic Davis-Foster"',
+			'email: "dominic@davis-foster.co.uk"',
+			'version: "2.0.0"',
+			'username: "domdfcoding"',
+			"license: 'LGPLv3+'",
+			"short_desc: 'Update multiple configuration files, build scripts etc. from a single location.'",
+			])
+
+	expected = {"version": "2.0.0", "tag": "v2.0.0", "commits_since_release": 1}
+
+	with in_directory(tmp_repo):
+		runner = CliRunner()
+
+		result: Result = runner.invoke(show.version, args=["--json"], catch_exceptions=False)
+		assert result.exit_code == 0
+		assert json.loads(result.stdout) == expected
+
+		# The second time the count comes from the cache.
+		result = runner.invoke(show.version, args=["--json", "--quiet"], catch_exceptions=False)
+		assert result.exit_code == 0
+		assert json.loads(result.stdout) == expected
+
+		(tmp_repo / "repo_helper.yml").write_text(
+				(tmp_repo / "repo_helper.yml").read_text().replace("2.0.0", "3.0.0"),
+				)
+		result = runner.invoke(show.version, args=["--json"], catch_exceptions=False)
+		assert result.exit_code == 0
+		assert json.loads(result.stdout) == {"version": "3.0.0", "tag": None, "commits_since_release": None}
+
+
+@pypy_windows_dulwich
+@pytest.mark.parametrize("backend", ["dulwich", "git"])
+def test_version_git_backend(tmp_repo: PathPlus, backend: str):
+	if backend == "git" and shutil.which("git") is None:
+		pytest.skip("git is not installed")
+
+	(tmp_repo / "repo_helper.yml").write_lines([
+			"modname: repo_helper",
+			'copyright_years: "2020"',
+			'author: "Dominic Davis-Foster"',
+			'email: "dominic@davis-foster.co.uk"',
+			'version: "2.0.0"',
+			'username: "domdfcoding"',
+			"license: 'LGPLv3+'",
+			"short_desc: 'Update multiple configuration files, build scripts etc. from a single location.'",
+			])
+
+	with in_directory(tmp_repo):
+		runner = CliRunner()
+
+		result: Result = runner.invoke(
+				cli,
+				args=["--git-backend", backend, "show", "version", "--json"],
+				obj={},
+				catch_exceptions=False,
+				)
+		assert result.exit_code == 0
+		assert json.loads(result.stdout)["commits_since_release"] == 1
+
+		result = runner.invoke(cli, args=["--git-backend", "svn", "show", "version"], obj={})
+		assert result.exit_code == 2
+		assert "Invalid value for '--git-backend': Choose from: dulwich, git" in result.stdout
+
+
 @pypy_windows_dulwich
 def test_changelog(
 		tmp_repo: PathPlus,
@@ -183,3 +256,45 @@ def test_log(
 
 	assert result.exit_code == 0
 	result.check_stdout(advanced_file_regression)
+
+
+@pypy_windows_dulwich
+@pytest.mark.parametrize(
+		"args, expected",
+		[
+				pytest.param([], ["v2.0.1", "v2.0.0", "v1.0.0"], id="all"),
+				pytest.param(["-n", '2'], ["v2.0.1", "v2.0.0"], id="entries"),
+				pytest.param(["-n", '2', "--reverse"], ["v2.0.0", "v2.0.1"], id="entries_reverse"),
+				pytest.param(["--from-tag", "v2.0.0"], ["v2.0.1", "v2.0.0"], id="from_tag"),
+				pytest.param(["--from-tag", "v2.0.0", "--reverse"], ["v2.0.0", "v2.0.1"], id="from_tag_reverse"),
+				pytest.param(["--from-date", "2000-01-01"], ["v2.0.1", "v2.0.0", "v1.0.0"], id="from_date"),
+				],
+		)
+def test_log_options(tmp_repo: PathPlus, args: List[str], expected: List[str]):
+	with in_directory(tmp_repo):
+		runner = CliRunner()
+		result: Result = runner.invoke(show.log, args=[*args, "--no-colour"], catch_exceptions=False)
+		assert result.exit_code == 0
+
+		tags = [line.split("tag: ")[1].rstrip(')') for line in result.stdout.splitlines() if "tag: " in line]
+		assert tags == expected
+		assert result.stdout.count("commit: ") == len(expected)
+
+		# The output is the same with and without the pager.
+		no_pager = runner.invoke(show.log, args=[*args, "--no-colour", "--no-pager"], catch_exceptions=False)
+		assert no_pager.exit_code == 0
+		assert no_pager.stdout == result.stdout
+
+
+@pypy_windows_dulwich
+def test_log_errors(tmp_repo: PathPlus):
+	with in_directory(tmp_repo):
+		runner = CliRunner()
+
+		result: Result = runner.invoke(show.log, args=["--from-tag", "v3.0.0"])
+		assert result.exit_code == 1
+		assert result.stdout == "ERROR: No such tag 'v3.0.0'\nAborted!\n"
+
+		result = runner.invoke(show.log, args=["--from-tag", "v2.0.0", "--from-date", "2000-01-01"])
+		assert result.exit_code == 1
+		assert result.stdout == "ERROR: 'from_date' and 'from_tag' are exclusive.\nAborted!\n"
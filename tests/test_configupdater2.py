@@ -0,0 +1,143 @@
+# 3rd party
+import pytest
+
+# this package
+from repo_helper.configupdater2 import ConfigUpdater, DuplicateSectionError, NoSectionError, Section
+
+example_ini = """\
+[metadata]
+name = demo
+version = 0.0.1
+
+[options]
+install_requires =
+    foo
+    bar
+
+[options.entry_points]
+console_scripts = demo = demo.__main__:main
+"""
+
+
+@pytest.fixture()
+def updater() -> ConfigUpdater:
+	updater = ConfigUpdater()
+	updater.read_string(example_ini)
+	return updater
+
+
+def test_round_trip(updater: ConfigUpdater):
+	assert str(updater) == example_ini + '\n'
+	assert updater.sections() == ["metadata", "options", "options.entry_points"]
+
+
+def test_lookups(updater: ConfigUpdater):
+	assert "metadata" in updater
+	assert "missing" not in updater
+	assert ["unhashable"] not in updater  # type: ignore[operator]
+	assert updater["options"].name == "options"
+
+	with pytest.raises(KeyError, match="missing"):
+		updater["missing"]  # pylint: disable=pointless-statement
+
+	with pytest.raises(NoSectionError):
+		updater.get("missing", "name")
+
+	assert "version" in updater["metadata"]
+	assert "missing" not in updater["metadata"]
+	assert updater["metadata"]["version"].value == "0.0.1"
+	assert updater.get("options", "install_requires").value == "foo\nbar"
+
+	with pytest.raises(KeyError, match="missing"):
+		updater["metadata"]["missing"]  # pylint: disable=pointless-statement
+
+
+def test_lookups_after_changes(updater: ConfigUpdater):
+	# Renaming
+	updater["metadata"].name = "meta"
+	assert "metadata" not in updater
+	assert updater["meta"]["name"].value == "demo"
+
+	updater["meta"]["name"].key = "project"
+	assert "name" not in updater["meta"]
+	assert updater["meta"]["project"].value == "demo"
+
+	# Removing
+	assert updater.remove_section("options")
+	assert not updater.remove_section("options")
+	assert updater["options.entry_points"]["console_scripts"].value == "demo = demo.__main__:main"
+
+	assert updater.remove_option("meta", "project")
+	assert not updater.remove_option("meta", "project")
+	assert updater["meta"].options() == ["version"]
+	assert updater["meta"]["version"].value == "0.0.1"
+
+	# Adding
+	updater["meta"]["name"] = "demo"
+	assert updater["meta"].options() == ["version", "name"]
+	assert updater["meta"]["name"].value == "demo"
+
+	updater.add_section("tool")
+	assert updater["tool"].name == "tool"
+	with pytest.raises(DuplicateSectionError):
+		updater.add_section("tool")
+
+	# Replacing
+	replacement = Section("tool", container=None)
+	updater["meta"] = replacement
+	assert updater.sections() == ["tool", "options.entry_points", "tool"]
+	assert updater["tool"] is replacement
+
+	del updater["tool"]
+	assert updater.sections() == ["options.entry_points", "tool"]
+
+
+def test_section_from_another_updater(updater: ConfigUpdater):
+	other = ConfigUpdater()
+	other.add_section(updater["options"])
+
+	other["options"].name = "renamed"
+	assert other.sections() == ["renamed"]
+	assert "renamed" in other
+	assert "options" not in other
+
+
+def test_blocks_have_no_dict(updater: ConfigUpdater):
+	for section in updater.sections_blocks():
+		assert not hasattr(section, "__dict__")
+		for block in section:
+			assert not hasattr(block, "__dict__")
+
+
+def test_spans(updater: ConfigUpdater):
+	option = updater["options"]["install_requires"]
+	assert option.lines == ["install_requires =\n", "    foo\n", "    bar\n"]
+	assert len(option) == 3
+	assert str(option) == "install_requires =\n    foo\n    bar\n"
+
+	option.add_line("    baz\n")
+	assert option.value == "foo\nbar\nbaz"
+	assert str(updater["options"]) == "[options]\ninstall_requires =\n    foo\n    bar\n    baz\n\n"
+
+
+def test_serialisation_cache(updater: ConfigUpdater):
+	assert str(updater) is str(updater)
+
+	updater["metadata"]["version"].value = "0.1.0"
+	assert "version = 0.1.0\n" in str(updater)
+	assert str(updater) is str(updater)
+
+	updater["options.entry_points"].name = "entry_points"
+	assert "\n[entry_points]\n" in str(updater)
+
+	updater["options"]["install_requires"].key = "requires"
+	assert "\nrequires = foo\n" in str(updater)
+
+	updater["metadata"].add_comment("# A comment\n")
+	assert "# A comment\n" in str(updater)
+
+	del updater["metadata"]["name"]
+	assert "name = demo" not in str(updater)
+
+	updater.remove_section("options")
+	assert "[options]" not in str(updater)
@@ -2,12 +2,20 @@
 from typing import List
 
 # 3rd party
+import jsonschema
 import pytest
 from coincidence.regressions import AdvancedDataRegressionFixture
 from domdf_python_tools.paths import PathPlus
 
 # this package
-from repo_helper.configuration import get_tox_python_versions, parse_yaml
+from repo_helper.configuration import (
+		RepoHelperParser,
+		YamlEditor,
+		get_tox_python_versions,
+		load_config,
+		migrate_config,
+		parse_yaml
+		)
 
 
 @pytest.mark.parametrize(
@@ -37,3 +45,171 @@ def test_parse_yaml(
 		):
 	(tmp_pathplus / "repo_helper.yml").write_text(example_config)
 	advanced_data_regression.check(parse_yaml(tmp_pathplus))
+
+
+@pytest.fixture()
+def count_parses(monkeypatch) -> List[int]:
+	calls: List[int] = []
+	original_run = RepoHelperParser.run
+
+	def run(self, filename):  # noqa: MAN001,MAN002
+		calls.append(1)
+		return original_run(self, filename)
+
+	monkeypatch.setattr(RepoHelperParser, "run", run)
+	return calls
+
+
+def test_parse_yaml_cached(tmp_pathplus: PathPlus, example_config: str, count_parses: List[int]):
+	repo_path = tmp_pathplus / "repo"
+	repo_path.maybe_make()
+	(repo_path / "repo_helper.yml").write_text(example_config)
+
+	config = parse_yaml(repo_path)
+	assert len(count_parses) == 1
+
+	assert parse_yaml(repo_path) == config
+	assert len(count_parses) == 1
+
+	# The result can be modified without affecting the cache.
+	parse_yaml(repo_path)["modname"] = "hello_world"
+	assert parse_yaml(repo_path) == config
+	assert len(count_parses) == 1
+
+	# Allowing unknown keys is cached separately.
+	assert parse_yaml(repo_path, allow_unknown_keys=True) == config
+	assert len(count_parses) == 2
+
+	(repo_path / "repo_helper.yml").write_text(example_config.replace("repo_helper_demo", "hello_world"))
+	assert parse_yaml(repo_path)["modname"] == "hello_world"
+	assert len(count_parses) == 3
+
+
+def test_parse_yaml_cached_referenced_files(tmp_pathplus: PathPlus, example_config: str, count_parses: List[int]):
+	repo_path = tmp_pathplus / "repo"
+	repo_path.maybe_make()
+	config = example_config.replace("extras_require:\n", "extras_require:\n  testing: testing.txt\n")
+	(repo_path / "repo_helper.yml").write_text(config)
+
+	# The file doesn't exist yet, so the value is a single requirement.
+	assert parse_yaml(repo_path)["extras_require"]["testing"] == ["testing.txt"]
+	assert len(count_parses) == 1
+
+	(repo_path / "testing.txt").write_text("pytest\n")
+	assert parse_yaml(repo_path)["extras_require"]["testing"] == ["pytest"]
+	assert len(count_parses) == 2
+
+	assert parse_yaml(repo_path)["extras_require"]["testing"] == ["pytest"]
+	assert len(count_parses) == 2
+
+	(repo_path / "testing.txt").write_text("pytest>=6.0\n")
+	assert parse_yaml(repo_path)["extras_require"]["testing"] == ["pytest>=6.0"]
+	assert len(count_parses) == 3
+
+	(repo_path / "repo_helper_demo").mkdir()
+	(repo_path / "repo_helper_demo" / "py.typed").touch()
+	assert "Typing :: Typed" in parse_yaml(repo_path)["classifiers"]
+	assert len(count_parses) == 4
+
+
+def test_parse_yaml_read_only(tmp_pathplus: PathPlus, example_config: str):
+	# The example configuration contains 'travis_pypi_secure', which is no longer used.
+	assert "travis_pypi_secure" in example_config
+	(tmp_pathplus / "git_helper.yml").write_text(example_config)
+
+	config = parse_yaml(tmp_pathplus)
+	assert config["modname"] == "repo_helper_demo"
+	assert "travis_pypi_secure" not in config
+
+	assert (tmp_pathplus / "git_helper.yml").read_text() == example_config
+	assert not (tmp_pathplus / "repo_helper.yml").exists()
+
+	assert load_config(tmp_pathplus / "git_helper.yml")["modname"] == "repo_helper_demo"
+	assert "travis_pypi_secure" not in load_config(tmp_pathplus / "git_helper.yml")
+
+
+def test_migrate_config(tmp_pathplus: PathPlus, example_config: str):
+	(tmp_pathplus / "git_helper.yml").write_text(example_config)
+	config = parse_yaml(tmp_pathplus)
+
+	assert migrate_config(tmp_pathplus)
+	assert not (tmp_pathplus / "git_helper.yml").exists()
+	lines = (tmp_pathplus / "repo_helper.yml").read_lines()
+	assert not any(line.startswith("travis_pypi_secure") for line in lines)
+	assert parse_yaml(tmp_pathplus) == config
+
+	assert not migrate_config(tmp_pathplus)
+
+
+def test_parse_yaml_invalid(tmp_pathplus: PathPlus, example_config: str):
+	(tmp_pathplus / "repo_helper.yml").write_text(example_config + "\nnot_a_key: 1\n")
+
+	with pytest.raises(jsonschema.ValidationError, match="'not_a_key' was unexpected"):
+		parse_yaml(tmp_pathplus)
+
+	assert parse_yaml(tmp_pathplus, allow_unknown_keys=True)["modname"] == "repo_helper_demo"
+
+	(tmp_pathplus / "repo_helper.yml").write_text(example_config.replace("modname: repo_helper_demo", "modname: 1"))
+
+	with pytest.raises(jsonschema.ValidationError, match="1 is not of type 'string'"):
+		parse_yaml(tmp_pathplus)
+
+
+def test_yaml_transaction(tmp_pathplus: PathPlus):
+	(tmp_pathplus / "config.yml").write_lines([
+			"# A comment",
+			"name: foo",
+			"items:",
+			"  - b",
+			"  - a",
+			])
+
+	editor = YamlEditor()
+
+	# Only new keys, so they are appended.
+	with editor.edit(tmp_pathplus / "config.yml") as transaction:
+		transaction["version"] = "1.2.3"
+		transaction.merge("tags", ["y", 'x'], sort=True)
+		transaction["removed"] = True
+		del transaction["removed"]
+
+	assert (tmp_pathplus / "config.yml").read_lines() == [
+			"# A comment",
+			"name: foo",
+			"items:",
+			"  - b",
+			"  - a",
+			'',
+			"version: 1.2.3",
+			"tags:",
+			" - x",
+			" - y",
+			'',
+			]
+
+	with editor.edit(tmp_pathplus / "config.yml") as transaction:
+		assert transaction["name"] == "foo"
+		assert "tags" in transaction
+		transaction["name"] = "bar"
+		transaction.merge("items", ['c', 'a'], sort=True)
+		transaction.remove("tags", ['x'])
+		del transaction["version"]
+
+	assert editor.load_file(tmp_pathplus / "config.yml") == {"name": "bar", "items": ['a', 'b', 'c'], "tags": ['y']}
+
+	# Nothing is written if there are no changes, or if an exception is raised.
+	before = (tmp_pathplus / "config.yml").read_text()
+
+	with editor.edit(tmp_pathplus / "config.yml"):
+		pass
+
+	with pytest.raises(ValueError, match="Oops"):
+		with editor.edit(tmp_pathplus / "config.yml") as transaction:
+			transaction["name"] = "baz"
+			raise ValueError("Oops")
+
+	assert (tmp_pathplus / "config.yml").read_text() == before
+
+	(tmp_pathplus / "list.yml").write_lines(["- a", "- b"])
+	with pytest.raises(TypeError, match="Only YAML files containing a mapping can be edited."):
+		editor.edit(tmp_pathplus / "list.yml")
@@ -117,3 +117,36 @@ def test_not_repo_dir(tmp_pathplus: PathPlus, capsys):
 		run_repo_helper(tmp_pathplus, force=False, initialise=False, commit=False, message='')
 
 	assert capsys.readouterr().err.startswith("Unable to run 'repo_helper'.\nThe error was:\n")
+
+
+def test_run_concurrently(tmp_pathplus: PathPlus, example_config: str):
+	serial_repo = tmp_pathplus / "serial"
+	concurrent_repo = tmp_pathplus / "concurrent"
+
+	for repo_path in (serial_repo, concurrent_repo):
+		repo_path.maybe_make()
+		(repo_path / "repo_helper.yml").write_text(example_config)
+		(repo_path / "requirements.txt").touch()
+		(repo_path / "tests").maybe_make()
+		(repo_path / "tests" / "requirements.txt").touch()
+		(repo_path / "README.rst").touch()
+		(repo_path / "doc-source").mkdir()
+		(repo_path / "doc-source" / "index.rst").touch()
+		(repo_path / ".pre-commit-config.yaml").touch()
+
+	rh = RepoHelper(serial_repo)
+	rh.load_settings()
+	serial_managed_files = rh.run()
+
+	rh = RepoHelper(concurrent_repo)
+	rh.load_settings()
+	concurrent_managed_files = rh.run(jobs=4)
+
+	assert concurrent_managed_files == serial_managed_files
+
+	serial_outputs = sorted(p.relative_to(serial_repo) for p in serial_repo.rglob('*') if p.is_file())
+	concurrent_outputs = sorted(p.relative_to(concurrent_repo) for p in concurrent_repo.rglob('*') if p.is_file())
+	assert concurrent_outputs == serial_outputs
+
+	for filename in serial_outputs:
+		assert (concurrent_repo / filename).read_bytes() == (serial_repo / filename).read_bytes()
@@ -0,0 +1,155 @@
+# stdlib
+import os
+import sys
+import threading
+from typing import Iterator
+
+# 3rd party
+import pytest
+from domdf_python_tools.paths import PathPlus, in_directory
+
+# this package
+import repo_helper.configuration
+from repo_helper import daemon
+from repo_helper.core import RepoHelper
+from repo_helper.daemon import DaemonServer, WarmState, current_warm_state, default_socket_path, send_request
+
+
+@pytest.fixture()
+def socket_path(tmp_pathplus: PathPlus, monkeypatch) -> PathPlus:
+	path = tmp_pathplus / "daemon.sock"
+	monkeypatch.setenv("REPO_HELPER_DAEMON_SOCKET", str(path))
+	return path
+
+
+@pytest.fixture()
+def server(socket_path: PathPlus) -> Iterator[DaemonServer]:
+	server = DaemonServer(socket_path, idle_timeout=30)
+	thread = threading.Thread(target=server.serve)
+	thread.start()
+
+	yield server
+
+	send_request({"command": "stop"}, socket_path)
+	thread.join()
+	assert not socket_path.exists()
+
+
+def test_warm_state(tmp_pathplus: PathPlus, example_config: str, monkeypatch):
+	(tmp_pathplus / "repo_helper.yml").write_text(example_config)
+
+	parsed = []
+	original = repo_helper.configuration._parse_yaml
+
+	def parse_yaml(*args, **kwargs):
+		parsed.append(args)
+		return original(*args, **kwargs)
+
+	monkeypatch.setattr(repo_helper.configuration, "_parse_yaml", parse_yaml)
+
+	assert current_warm_state() is None
+
+	with WarmState() as state:
+		assert current_warm_state() is state
+
+		rh = RepoHelper(tmp_pathplus)
+		rh.load_settings()
+		rh.templates.globals["modname"] = "changed"
+
+		rh = RepoHelper(tmp_pathplus)
+		rh.load_settings()
+		assert rh.templates.globals["modname"] == "repo_helper_demo"
+		assert len(parsed) == 1
+
+		(tmp_pathplus / "repo_helper.yml").write_text(example_config.replace("repo_helper_demo", "hello_world"))
+		rh = RepoHelper(tmp_pathplus)
+		rh.load_settings()
+		assert rh.templates.globals["modname"] == "hello_world"
+		assert len(parsed) == 2
+
+		# The requirements files the configuration refers to are checked too.
+		(tmp_pathplus / "repo_helper.yml").write_text(
+				example_config.replace("repo_helper_demo", "hello_world").replace("  schema:\n    - lxml", "  web: extra.txt"),
+				)
+		(tmp_pathplus / "extra.txt").write_text("foo>=1\n")
+		rh = RepoHelper(tmp_pathplus)
+		rh.load_settings()
+		assert rh.templates.globals["extras_require"]["web"] == ["foo>=1"]
+		assert len(parsed) == 3
+
+		(tmp_pathplus / "extra.txt").write_text("foo>=1\nbar>=2\n")
+		rh = RepoHelper(tmp_pathplus)
+		rh.load_settings()
+		assert rh.templates.globals["extras_require"]["web"] == ["bar>=2", "foo>=1"]
+		assert len(parsed) == 4
+
+		rh = RepoHelper(tmp_pathplus)
+		rh.load_settings()
+		assert len(parsed) == 4
+
+	assert current_warm_state() is None
+
+
+def test_daemon(server: DaemonServer, socket_path: PathPlus, tmp_pathplus: PathPlus, example_config: str):
+	(tmp_pathplus / "repo_helper.yml").write_text(example_config)
+
+	response = send_request({"argv": ["show", "version", "-q"], "cwd": str(tmp_pathplus)}, socket_path)
+	assert response == {"stdout": "v0.0.1\n", "stderr": '', "exit_code": 0}
+
+	response = send_request({"argv": ["show", "nothing"], "cwd": str(tmp_pathplus)}, socket_path)
+	assert response is not None
+	assert response["exit_code"] == 2
+	assert "No such command 'nothing'" in response["stderr"]
+
+	response = send_request({"argv": ["init"], "cwd": str(tmp_pathplus)}, socket_path)
+	assert response is not None
+	assert response["exit_code"] == 2
+	assert response["stderr"] == "Cannot forward ['init'] to the daemon.\n"
+
+
+def test_client(server: DaemonServer, tmp_pathplus: PathPlus, example_config: str, capsys):
+	(tmp_pathplus / "repo_helper.yml").write_text(example_config)
+
+	with in_directory(tmp_pathplus):
+		assert daemon.main(["show", "version", "-q"]) == 0
+
+	assert capsys.readouterr().out == "v0.0.1\n"
+
+
+@pytest.mark.usefixtures("socket_path")
+def test_client_fallback(tmp_pathplus: PathPlus, example_config: str, capsys):
+	(tmp_pathplus / "repo_helper.yml").write_text(example_config)
+
+	with in_directory(tmp_pathplus):
+		assert daemon.main(["show", "version", "-q"]) == 0
+		assert daemon.main(["wizard"]) == 2
+
+	assert capsys.readouterr().out == "v0.0.1\n"
+
+
+def test_already_running(server: DaemonServer, socket_path: PathPlus):
+	with pytest.raises(OSError, match="The repo_helper daemon is already running at "):
+		DaemonServer(socket_path)
+
+
+def test_default_socket_path(tmp_pathplus: PathPlus, monkeypatch):
+	monkeypatch.delenv("REPO_HELPER_DAEMON_SOCKET", raising=False)
+
+	monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_pathplus / "runtime"))
+	assert default_socket_path() == str(tmp_pathplus / "runtime" / "repo_helper.sock")
+
+	monkeypatch.delenv("XDG_RUNTIME_DIR")
+	monkeypatch.setenv("REPO_HELPER_CACHE_DIR", str(tmp_pathplus / "cache"))
+	assert default_socket_path() == str(tmp_pathplus / "cache" / "daemon" / "repo_helper.sock")
+
+	if sys.platform != "win32":
+		assert (tmp_pathplus / "cache" / "daemon").stat().st_mode & 0o777 == 0o700
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="Requires os.getuid")
+def test_client_other_user(server: DaemonServer, socket_path: PathPlus, monkeypatch):
+	assert send_request({"command": "ping"}, socket_path) == {"exit_code": 0}
+
+	with monkeypatch.context() as m:
+		m.setattr(os, "getuid", lambda: socket_path.stat().st_uid + 1)
+		assert send_request({"command": "ping"}, socket_path) is None
@@ -0,0 +1,93 @@
+# stdlib
+import pathlib
+from typing import List
+
+# 3rd party
+import pytest
+from domdf_python_tools.paths import PathPlus, in_directory
+
+# this package
+from repo_helper.core import RepoHelper
+from repo_helper.files import Management, dependency_graph, get_dependencies, topological_sort
+from repo_helper.templates import Environment
+
+
+def _make_managers() -> Management:
+	management = Management()
+
+	@management.register("first", writes=["requirements.txt"])
+	def first(repo_path: pathlib.Path, templates: Environment) -> List[str]:
+		return []
+
+	@management.register("second", reads=["{docs_dir}/requirements.txt"], writes=["tox.ini"])
+	def second(repo_path: pathlib.Path, templates: Environment) -> List[str]:
+		return []
+
+	@management.register("third", writes=["{docs_dir}/requirements.txt"], after=["first"])
+	def third(repo_path: pathlib.Path, templates: Environment) -> List[str]:
+		return []
+
+	@management.register("fourth", writes=["justfile"])
+	def fourth(repo_path: pathlib.Path, templates: Environment) -> List[str]:
+		return []
+
+	return management
+
+
+def test_register_dependencies():
+	management = _make_managers()
+
+	dependencies = get_dependencies(management[2][0])
+	assert dependencies is not None
+	assert dependencies.writes == ("{docs_dir}/requirements.txt", )
+	assert dependencies.after == ("first", )
+	assert dependencies.resolve({"docs_dir": "doc-source"}).writes == ("doc-source/requirements.txt", )
+
+	@management.register("undeclared")
+	def undeclared(repo_path: pathlib.Path, templates: Environment) -> List[str]:
+		return []
+
+	assert get_dependencies(undeclared) is None
+
+
+def test_dependency_graph():
+	management = _make_managers()
+	managers = [(function, exclude_name) for function, exclude_name, _ in management]
+
+	graph = dependency_graph(managers, {"docs_dir": "doc-source"})
+	assert graph == {0: set(), 1: {2}, 2: {0}, 3: set()}
+	assert topological_sort(graph) == [0, 2, 1, 3]
+
+
+def test_dependency_graph_undeclared():
+	management = _make_managers()
+
+	@management.register("undeclared")
+	def undeclared(repo_path: pathlib.Path, templates: Environment) -> List[str]:
+		return []
+
+	management.insert(1, management.pop())
+	managers = [(function, exclude_name) for function, exclude_name, _ in management]
+
+	graph = dependency_graph(managers, {"docs_dir": "doc-source"})
+	assert graph == {0: set(), 1: {0}, 2: {1, 3}, 3: {0, 1}, 4: {1}}
+	assert topological_sort(graph) == [0, 1, 3, 2, 4]
+
+
+def test_topological_sort_cycle():
+	with pytest.raises(ValueError, match=r"^Circular dependency between managers \[0, 1\]$"):
+		topological_sort({0: {1}, 1: {0}, 2: set()})
+
+
+def test_declared_writes(repo_path: PathPlus):
+	with in_directory(repo_path):
+		rh = RepoHelper(repo_path)
+		rh.load_settings()
+
+		for function, exclude_name, _ in rh.files:
+			dependencies = get_dependencies(function)
+			assert dependencies is not None, exclude_name
+
+			writes = dependencies.resolve(rh.templates.globals).writes
+			for filename in function(rh.target_repo, rh.templates):
+				assert pathlib.PurePosixPath(filename).as_posix() in writes, exclude_name
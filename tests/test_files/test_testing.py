@@ -22,7 +22,8 @@
 
 # stdlib
 import posixpath
-from typing import List, Sequence
+import re
+from typing import List, Sequence, Type
 
 # 3rd party
 import pytest
@@ -30,9 +31,19 @@ from coincidence.regressions import AdvancedFileRegressionFixture
 from domdf_python_tools.paths import PathPlus
 
 # this package
+from repo_helper.files.packaging import SetupCfgConfig
 from repo_helper.files.pre_commit import make_pre_commit
-from repo_helper.files.testing import ensure_tests_requirements, make_formate_toml, make_isort, make_tox, make_yapf
+from repo_helper.files.testing import (
+		ToxConfig,
+		ensure_tests_requirements,
+		make_formate_toml,
+		make_isort,
+		make_tox,
+		make_yapf
+		)
+from repo_helper.incremental import TracingGlobals
 from repo_helper.templates import Environment
+from repo_helper.utils import IniConfigurator
 
 
 def boolean_option(name: str, id: str):  # noqa: A002,MAN002  # pylint: disable=redefined-builtin
@@ -207,6 +218,82 @@ class TestMakeTox:
 		advanced_file_regression.check_file(tmp_pathplus / "tox.ini")
 
 
+	def test_tox_reuses_sections(
+			self,
+			tmp_pathplus: PathPlus,
+			demo_environment: Environment,
+			monkeypatch,
+			):
+		self.set_globals(demo_environment)
+		make_tox(tmp_pathplus, demo_environment)
+		expected = (tmp_pathplus / "tox.ini").read_text()
+		mtime = (tmp_pathplus / "tox.ini").stat().st_mtime_ns
+
+		generated = []
+		original_testenv = ToxConfig.testenv
+
+		def testenv(self: ToxConfig) -> None:
+			generated.append("testenv")
+			original_testenv(self)
+
+		monkeypatch.setattr(ToxConfig, "testenv", testenv)
+
+		# Nothing changed, so the section is copied and the file is not rewritten.
+		make_tox(tmp_pathplus, demo_environment)
+		assert (tmp_pathplus / "tox.ini").read_text() == expected
+		assert (tmp_pathplus / "tox.ini").stat().st_mtime_ns == mtime
+		assert generated == []
+
+		# The configuration changed.
+		demo_environment.globals["tox_testenv_extras"] = "all"
+		make_tox(tmp_pathplus, demo_environment)
+		assert generated == ["testenv"]
+		assert "extras = all" in (tmp_pathplus / "tox.ini").read_text()
+
+		# The section was edited by hand.
+		generated.clear()
+		(tmp_pathplus / "tox.ini").write_text((tmp_pathplus / "tox.ini").read_text().replace("extras = all", ''))
+		make_tox(tmp_pathplus, demo_environment)
+		assert generated == ["testenv"]
+		assert "extras = all" in (tmp_pathplus / "tox.ini").read_text()
+
+
+@pytest.mark.parametrize("configurator", [ToxConfig, SetupCfgConfig])
+def test_section_keys(demo_environment: Environment, tmp_pathplus: PathPlus, configurator: Type[IniConfigurator]):
+	# Each section declared in section_keys must only depend on the keys listed.
+	TestMakeTox.set_globals(demo_environment)
+	demo_environment.globals["third_party_version_matrix"] = {"attrs": ["19.3", "20.1"]}
+	demo_environment.globals["console_scripts"] = ["hello = hello:main"]
+	demo_environment.globals["author"] = "Joe Bloggs"
+	demo_environment.globals["version"] = "1.2.3"
+	demo_environment.globals["email"] = "j.bloggs@example.com"
+	demo_environment.globals["license"] = "MIT"
+	demo_environment.globals["keywords"] = ["awesome", "python", "project"]
+	demo_environment.globals["classifiers"] = []
+	demo_environment.globals["mypy_plugins"] = ["pydantic.mypy"]
+	demo_environment.globals["entry_points"] = {"foo": ["bar = baz:main"]}
+
+	demo_environment.globals = TracingGlobals(demo_environment.globals)
+	ini = configurator(tmp_pathplus, demo_environment)  # type: ignore[call-arg]
+
+	for section_name in ini.managed_sections:
+		before = {section.name: str(section) for section in ini._ini.sections_blocks()}
+		demo_environment.globals.accessed.clear()
+		getattr(ini, re.sub("[:.-]", '_', section_name))()
+
+		if section_name not in ini.section_keys:
+			continue
+
+		assert not demo_environment.globals.accessed_all
+		assert demo_environment.globals.accessed <= set(ini.section_keys[section_name]), section_name
+
+		# Other sections are not modified.
+		after = {section.name: str(section) for section in ini._ini.sections_blocks()}
+		before.pop(section_name, None)
+		after.pop(section_name, None)
+		assert before == after, section_name
+
+
 def test_make_yapf(
 		tmp_pathplus: PathPlus,
 		demo_environment: Environment,
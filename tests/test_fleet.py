@@ -0,0 +1,75 @@
+# stdlib
+import json
+import shutil
+
+# 3rd party
+import pytest
+from consolekit.testing import CliRunner, Result
+from domdf_python_tools.paths import PathPlus
+
+# this package
+from repo_helper.cli.commands.fleet import fleet
+from repo_helper.fleet import expand_paths, run_fleet, summarise
+
+
+@pytest.fixture()
+def repos(tmp_pathplus: PathPlus, repo_path: PathPlus) -> PathPlus:
+	repos = tmp_pathplus / "repos"
+
+	for name in ("alpha", "beta"):
+		shutil.copytree(repo_path, repos / name)
+
+	# Invalid configuration
+	(repos / "broken").maybe_make()
+	(repos / "broken" / "repo_helper.yml").write_text("modname: broken\n")
+
+	# Not a repository
+	(repos / "other").maybe_make()
+
+	return repos
+
+
+def test_expand_paths(repos: PathPlus):
+	expected = [str(repos / "alpha"), str(repos / "beta"), str(repos / "broken")]
+	assert expand_paths([str(repos / '*')]) == expected
+	assert expand_paths([str(repos / "beta"), str(repos / "b*"), str(repos / "other")]) == expected[1:]
+
+
+def test_run_fleet(repos: PathPlus):
+	paths = expand_paths([str(repos / '*')])
+	results = {result.path: result for result in run_fleet(paths, processes=2, max_tasks_per_child=1)}
+
+	assert results[str(repos / "alpha")].status == "changed"
+	assert "tox.ini" in results[str(repos / "alpha")].changed_files
+	assert (repos / "alpha" / "tox.ini").is_file()
+	assert results[str(repos / "broken")].status == "failed"
+	assert results[str(repos / "broken")].error
+
+	report = summarise(results.values(), 1.5)
+	assert report["summary"] == {"changed": 2, "unchanged": 0, "failed": 1, "total": 3, "duration": 1.5}
+	assert [repo["path"] for repo in report["repositories"]] == paths
+
+	results = {result.path: result for result in run_fleet(paths[:2], processes=2)}
+	assert results[str(repos / "alpha")].status == "unchanged"
+	assert results[str(repos / "alpha")].changed_files == []
+
+
+def test_fleet_command(repos: PathPlus):
+	runner = CliRunner()
+
+	result: Result = runner.invoke(fleet, args=["--dry-run", "--json", "-p", '2', str(repos / '*')])
+	assert result.exit_code == 1
+
+	report = json.loads(result.stdout)
+	assert report["summary"]["changed"] == 2
+	assert report["summary"]["failed"] == 1
+	assert not (repos / "alpha" / "tox.ini").exists()
+
+	result = runner.invoke(fleet, args=[str(repos / "alpha")])
+	assert result.exit_code == 0
+	assert result.stdout.startswith(f"changed   {repos / 'alpha'} (")
+	assert result.stdout.rstrip().splitlines()[-1].startswith("1 changed, 0 unchanged, 0 failed in ")
+
+	result = runner.invoke(fleet, args=[str(repos / "other")])
+	assert result.exit_code == 2
+	assert "No repositories with a 'repo_helper.yml' file were found." in result.stdout
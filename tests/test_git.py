@@ -0,0 +1,400 @@
+# stdlib
+import os
+import shutil
+from datetime import datetime
+
+# 3rd party
+import click
+import pytest
+from domdf_python_tools.paths import PathPlus, in_directory
+from dulwich.index import Index
+from southwark import status
+from southwark.repo import Repo
+
+# this package
+from repo_helper.git import (
+		DulwichSession,
+		GitCLISession,
+		GitSession,
+		SessionLog,
+		_read_index_entries_dulwich,
+		managed_status,
+		open_session,
+		read_index_entries
+		)
+from repo_helper.utils import stage_changes
+
+
+@pytest.fixture(params=["dulwich", "git"])
+def backend(request, monkeypatch) -> str:
+	if request.param == "git":
+		if shutil.which("git") is None:
+			pytest.skip("git is not installed")
+
+		# Don't use the user's git configuration.
+		monkeypatch.setenv("GIT_CONFIG_GLOBAL", os.devnull)
+		monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", '1')
+
+	return request.param
+
+
+# Repo.stage and Repo.do_commit are deprecated in newer versions of dulwich
+@pytest.mark.filterwarnings("ignore:.* is deprecated and will be removed in:DeprecationWarning")
+def test_managed_status(temp_empty_repo: Repo):
+	repo_path = PathPlus(temp_empty_repo.path)
+
+	for filename in ("unchanged.txt", "modified.txt", "deleted.txt", "removed.txt", "restaged.txt"):
+		(repo_path / filename).write_text(filename)
+	(repo_path / ".gitignore").write_text("ignored.txt\n")
+	temp_empty_repo.stage(["unchanged.txt", "modified.txt", "deleted.txt", "removed.txt", "restaged.txt", ".gitignore"])
+	temp_empty_repo.do_commit(b"Initial commit")
+
+	(repo_path / "modified.txt").write_text("changed")
+	(repo_path / "deleted.txt").unlink()
+	(repo_path / "removed.txt").unlink()
+	temp_empty_repo.stage(["removed.txt"])
+	(repo_path / "restaged.txt").write_text("changed")
+	temp_empty_repo.stage(["restaged.txt"])
+	(repo_path / "added.txt").write_text("added")
+	temp_empty_repo.stage(["added.txt"])
+	(repo_path / "untracked.txt").write_text("untracked")
+	(repo_path / "ignored.txt").write_text("ignored")
+	(repo_path / "unrelated.txt").write_text("unrelated")
+
+	files = [
+			"unchanged.txt",
+			"modified.txt",
+			"deleted.txt",
+			"removed.txt",
+			"restaged.txt",
+			"added.txt",
+			"untracked.txt",
+			"ignored.txt",
+			repo_path / "missing.txt",
+			]
+
+	stat = managed_status(temp_empty_repo, files)
+	assert stat.staged == {
+			"add": [PathPlus("added.txt")],
+			"delete": [PathPlus("removed.txt")],
+			"modify": [PathPlus("restaged.txt")],
+			}
+	assert stat.unstaged == [PathPlus("modified.txt"), PathPlus("deleted.txt")]
+	assert stat.untracked == [PathPlus("untracked.txt")]
+
+	# The same as the status of the whole repository, for the given files.
+	full_stat = status(temp_empty_repo)
+	assert {k: sorted(v) for k, v in stat.staged.items()} == {k: sorted(v) for k, v in full_stat.staged.items()}
+	assert sorted(stat.unstaged) == sorted(full_stat.unstaged)
+	assert sorted(stat.untracked) == sorted(set(full_stat.untracked) - {PathPlus("unrelated.txt")})
+
+	assert stage_changes(temp_empty_repo, files) == [
+			PathPlus("modified.txt"),
+			PathPlus("deleted.txt"),
+			PathPlus("removed.txt"),
+			PathPlus("restaged.txt"),
+			PathPlus("added.txt"),
+			PathPlus("untracked.txt"),
+			]
+
+	stat = managed_status(temp_empty_repo, files)
+	assert not stat.unstaged
+	assert not stat.untracked
+	assert stat.staged["delete"] == [PathPlus("deleted.txt"), PathPlus("removed.txt")]
+	assert PathPlus("unrelated.txt") in status(temp_empty_repo).untracked
+
+
+@pytest.mark.filterwarnings("ignore:.* is deprecated and will be removed in:DeprecationWarning")
+def test_read_index_entries(temp_empty_repo: Repo):
+	repo_path = PathPlus(temp_empty_repo.path)
+	paths = [b"file.txt", b"a/b/c.py", b"long/" + b"x" * 200 + b".txt", b"z.txt"]
+
+	for path in paths:
+		(repo_path / path.decode()).parent.maybe_make(parents=True)
+		(repo_path / path.decode()).write_text(path.decode())
+
+	temp_empty_repo.stage([path.decode() for path in paths])
+	index_path = temp_empty_repo.index_path()
+
+	entries = read_index_entries(index_path, [*paths, b"missing.txt"])
+	assert list(entries) == sorted(paths)
+	assert entries == _read_index_entries_dulwich(index_path, paths)
+	assert read_index_entries(index_path, [b"z.txt"]) == {b"z.txt": entries[b"z.txt"]}
+
+
+@pytest.mark.filterwarnings("ignore:.* is deprecated and will be removed in:DeprecationWarning")
+def test_git_session(temp_empty_repo: Repo, backend: str, capsys):
+	repo_path = PathPlus(temp_empty_repo.path)
+	(repo_path / "repo_helper.yml").write_text("modname: foo")
+	(repo_path / "tox.ini").write_text("[tox]")
+	temp_empty_repo.stage(["repo_helper.yml", "tox.ini"])
+	temp_empty_repo.do_commit(b"Initial commit")
+
+	with open_session(temp_empty_repo, backend) as session:
+		(repo_path / "repo_helper.yml").write_text("modname: bar")
+		(repo_path / "untracked.txt").write_text("untracked")
+		assert session.assert_clean(allow_config=["repo_helper.yml"])
+
+		# Untracked files are only looked for if the repository isn't clean.
+		assert session._untracked is None
+
+		assert session.managed_status(["tox.ini"]).unstaged == []
+
+		if isinstance(session, DulwichSession):
+			# The index is only read once.
+			index = session.index
+			assert session.managed_status(["tox.ini"]).unstaged == []
+			assert session.index is index
+
+		(repo_path / "tox.ini").write_text("[tox]\nenvlist = py38")
+		assert session.assert_clean(allow_config=["repo_helper.yml"])  # cached
+		session.invalidate()
+		assert not session.assert_clean(allow_config=["repo_helper.yml"])
+		assert "M tox.ini" in capsys.readouterr().err
+		assert session.untracked() == [PathPlus("untracked.txt")]
+
+		assert session.stage_changes(["tox.ini", repo_path / "untracked.txt"]) == [
+				PathPlus("tox.ini"),
+				PathPlus("untracked.txt"),
+				]
+		assert session.staged() == {
+				"add": [PathPlus("untracked.txt")],
+				"delete": [],
+				"modify": [PathPlus("tox.ini")],
+				}
+
+		session.commit("Update")
+		assert session.status() == ({"add": [], "delete": [], "modify": []}, [PathPlus("repo_helper.yml")], [])
+
+	assert temp_empty_repo[b"HEAD"].message == b"Update"  # type: ignore[attr-defined]
+
+
+def test_pre_commit_installed(temp_empty_repo: Repo, backend: str):
+	pytest.importorskip("pre_commit")
+
+	# 3rd party
+	import pre_commit.main  # type: ignore[import-untyped]
+
+	(PathPlus(temp_empty_repo.path) / ".pre-commit-config.yaml").write_text("repos: []")
+
+	with open_session(temp_empty_repo, backend) as session:
+		assert not session.pre_commit_installed()
+
+		with in_directory(temp_empty_repo.path):
+			pre_commit.main.main(["install"])
+
+		assert session.pre_commit_installed()
+
+		hook = PathPlus(temp_empty_repo.controldir()) / "hooks" / "pre-commit"
+		hook.write_text(hook.read_text().replace("INSTALL_PYTHON=", "INSTALL_PYTHON=/usr/bin/python3 #"))
+		assert not session.pre_commit_installed()
+
+		session.install_pre_commit()
+		assert session.pre_commit_installed()
+
+
+@pytest.mark.filterwarnings("ignore:.* is deprecated and will be removed in:DeprecationWarning")
+def test_stage_batch(temp_empty_repo: Repo, monkeypatch):
+	repo_path = PathPlus(temp_empty_repo.path)
+	for filename in ("modified.txt", "deleted.txt", "unchanged.txt"):
+		(repo_path / filename).write_text(filename)
+	temp_empty_repo.stage(["modified.txt", "deleted.txt", "unchanged.txt"])
+	temp_empty_repo.do_commit(b"Initial commit")
+
+	(repo_path / "modified.txt").write_text("changed")
+	(repo_path / "deleted.txt").unlink()
+	(repo_path / "added").mkdir()
+	(repo_path / "added" / "file.txt").write_text("added")
+
+	writes = []
+	write = Index.write
+	monkeypatch.setattr(Index, "write", lambda self: writes.append(self.path) or write(self))
+
+	with DulwichSession(temp_empty_repo) as session:
+		files = ["modified.txt", "deleted.txt", "unchanged.txt", "added/file.txt", "missing.txt"]
+		assert session.stage_changes(files) == [
+				PathPlus("modified.txt"),
+				PathPlus("deleted.txt"),
+				PathPlus("added/file.txt"),
+				]
+		assert len(writes) == 1
+
+		assert session.staged() == {
+				"add": [PathPlus("added/file.txt")],
+				"delete": [PathPlus("deleted.txt")],
+				"modify": [PathPlus("modified.txt")],
+				}
+		assert session.unstaged() == []
+
+	# The same as staging the files with dulwich.
+	assert status(temp_empty_repo) == ({
+			"add": [PathPlus("added/file.txt")],
+			"delete": [PathPlus("deleted.txt")],
+			"modify": [PathPlus("modified.txt")],
+			}, [], [])
+
+
+@pytest.mark.filterwarnings("ignore:.* is deprecated and will be removed in:DeprecationWarning")
+def test_git_cli_session(temp_empty_repo: Repo, backend: str):
+	repo_path = PathPlus(temp_empty_repo.path)
+	for filename in ("modified.txt", "deleted.txt", "restaged.txt", "unchanged.txt"):
+		(repo_path / filename).write_text(filename)
+	(repo_path / ".gitignore").write_text("ignored.txt\n")
+	temp_empty_repo.stage(["modified.txt", "deleted.txt", "restaged.txt", "unchanged.txt", ".gitignore"])
+	temp_empty_repo.do_commit(b"Initial commit")
+
+	(repo_path / "modified.txt").write_text("changed")
+	(repo_path / "deleted.txt").unlink()
+	(repo_path / "restaged.txt").write_text("changed")
+	temp_empty_repo.stage(["restaged.txt"])
+	(repo_path / "untracked.txt").write_text("untracked")
+	(repo_path / "ignored.txt").write_text("ignored")
+
+	files = ["untracked.txt", "unchanged.txt", "modified.txt", "deleted.txt", "restaged.txt", "ignored.txt"]
+
+	# The git executable gives the same results as dulwich.
+	with DulwichSession(temp_empty_repo) as expected, open_session(temp_empty_repo, backend) as session:
+		assert session.status() == expected.status()
+		assert session.managed_status(files) == expected.managed_status(files)
+
+		assert session.stage_changes(files) == [
+				PathPlus("untracked.txt"),
+				PathPlus("modified.txt"),
+				PathPlus("deleted.txt"),
+				PathPlus("restaged.txt"),
+				]
+		assert session.status() == ({
+				"add": [PathPlus("untracked.txt")],
+				"delete": [PathPlus("deleted.txt")],
+				"modify": [PathPlus("modified.txt"), PathPlus("restaged.txt")],
+				}, [], [])
+
+		sha = session.commit("Second commit\n\nWith a body.")
+		session.tag_create("v1.0.0")
+
+		assert session.tags() == {sha: "v1.0.0"}
+		assert session.current_branch() == "master"
+		assert session.refs() == {"HEAD": sha, "refs/heads/master": sha}
+
+		commits = list(session.iter_commits())
+		assert [commit.message for commit in commits] == [b"Second commit\n\nWith a body.", b"Initial commit"]
+		assert commits[0].id == sha.encode("UTF-8")
+		assert commits[0].parents == [commits[1].id]
+		assert commits[0].author == b"Guido <guido@python.org>"
+		assert list(session.iter_commits(max_entries=1, reverse=True)) == commits[:1]
+		assert list(session.iter_commits(reverse=True)) == commits[::-1]
+
+		expected.invalidate()
+		assert commits == list(expected.iter_commits())
+
+		log = SessionLog(session).log(colour=False)
+		assert log.startswith(f"commit: {sha} (HEAD -> master, tag: v1.0.0)\nAuthor: Guido <guido@python.org>")
+		assert log == SessionLog(expected).log(colour=False)
+		assert SessionLog(session).log(from_tag="v1.0.0", colour=False).count("commit: ") == 1
+		assert SessionLog(session).log(from_date=datetime(2000, 1, 1), colour=False) == log
+
+		with pytest.raises(ValueError, match="No such tag 'v2.0.0'"):
+			SessionLog(session).log(from_tag="v2.0.0")
+
+
+def test_open_session(temp_empty_repo: Repo, monkeypatch):
+	monkeypatch.delenv("REPO_HELPER_GIT_BACKEND", raising=False)
+
+	with open_session(temp_empty_repo) as session:
+		assert isinstance(session, DulwichSession)
+		assert list(session.iter_commits()) == []
+
+	if shutil.which("git") is not None:
+		monkeypatch.setenv("REPO_HELPER_GIT_BACKEND", "git")
+
+		with open_session(temp_empty_repo.path) as session:
+			assert isinstance(session, GitCLISession)
+			assert session.path == PathPlus(temp_empty_repo.path)
+			assert list(session.iter_commits()) == []
+
+	with pytest.raises(ValueError, match="Unknown git backend 'svn'"):
+		open_session(temp_empty_repo, "svn")
+
+	# The backend chosen with the --git-backend option takes precedence over the environment variable.
+	monkeypatch.setenv("REPO_HELPER_GIT_BACKEND", "svn")
+	with click.Context(click.Command("repo_helper"), obj={"git_backend": "dulwich"}):
+		with open_session(temp_empty_repo) as session:
+			assert isinstance(session, DulwichSession)
+
+	with pytest.raises(TypeError, match="abstract"):
+		GitSession(temp_empty_repo.path)  # type: ignore[abstract]
+
+
+@pytest.mark.filterwarnings("ignore:.* is deprecated and will be removed in:DeprecationWarning")
+def test_commits_since(temp_empty_repo: Repo, backend: str, monkeypatch):
+	repo_path = PathPlus(temp_empty_repo.path)
+
+	shas = []
+	for idx in range(5):
+		(repo_path / "file.txt").write_text(str(idx))
+		temp_empty_repo.stage(["file.txt"])
+		shas.append(temp_empty_repo.do_commit(f"Commit {idx}".encode()).decode("ASCII"))
+
+	# A commit which isn't an ancestor of HEAD.
+	(repo_path / "file.txt").write_text("branch")
+	temp_empty_repo.stage(["file.txt"])
+	branch_sha = temp_empty_repo.do_commit(b"Branch", ref=b"refs/heads/branch").decode("ASCII")
+
+	with open_session(temp_empty_repo, backend) as session:
+		assert session.head() == shas[-1]
+		assert session.commits_since(shas[1]) == 3
+		assert session.commits_since(shas[0]) == 4
+		assert session.commits_since(shas[-1]) == 0
+		assert session.commits_since(branch_sha) is None
+
+		# The counts are cached on disk.
+		monkeypatch.setattr(type(session), "_count_commits_since", lambda *args: pytest.fail("Not cached"))
+		assert session.commits_since(shas[1]) == 3
+		assert session.commits_since(branch_sha) is None
+
+
+@pytest.mark.filterwarnings("ignore:.* is deprecated and will be removed in:DeprecationWarning")
+def test_iter_log_stops_early(temp_empty_repo: Repo, backend: str):
+	repo_path = PathPlus(temp_empty_repo.path)
+
+	for idx in range(10):
+		(repo_path / "file.txt").write_text(str(idx))
+		temp_empty_repo.stage(["file.txt"])
+		temp_empty_repo.do_commit(f"Commit {idx}".encode())
+		if idx == 6:
+			temp_empty_repo.refs[b"refs/tags/v1.0.0"] = temp_empty_repo.head()
+
+	with open_session(temp_empty_repo, backend) as session:
+		read = []
+		iter_commits = session.iter_commits
+
+		def record(*args, **kwargs):
+			for commit in iter_commits(*args, **kwargs):
+				read.append(commit.message)
+				yield commit
+
+		session.iter_commits = record  # type: ignore[assignment]
+		commit_log = SessionLog(session)
+
+		# Nothing is read until the entries are needed.
+		entries = commit_log.iter_log(from_tag="v1.0.0", colour=False)
+		assert read == []
+
+		assert next(entries).startswith("commit: ")
+		assert read == [b"Commit 9"]
+
+		assert len(list(entries)) == 3
+		assert read == [b"Commit 9", b"Commit 8", b"Commit 7", b"Commit 6"]
+
+		read.clear()
+		entries = commit_log.iter_log(from_tag="v1.0.0", reverse=True, colour=False)
+		assert [entry.splitlines()[-1].strip() for entry in entries] == ["Commit 6", "Commit 7", "Commit 8", "Commit 9"]
+		assert read == [b"Commit 9", b"Commit 8", b"Commit 7", b"Commit 6"]
+
+		# Stopping part way through.
+		commits = iter_commits()
+		assert next(commits).message == b"Commit 9"
+		commits.close()  # type: ignore[attr-defined]
+
+		with pytest.raises(ValueError, match="No such tag 'v2.0.0'"):
+			commit_log.iter_log(from_tag="v2.0.0")
@@ -0,0 +1,107 @@
+# stdlib
+from typing import Dict, List
+
+# 3rd party
+from domdf_python_tools.paths import PathPlus
+
+# this package
+from repo_helper.core import RepoHelper
+from repo_helper.incremental import IncrementalCache, TracingGlobals, trace_environment
+from repo_helper.templates import Environment
+
+
+def _run(repo_path: PathPlus) -> Dict[str, int]:
+	"""
+	Run ``repo_helper`` incrementally, and return the number of times each manager was run.
+	"""
+
+	rh = RepoHelper(repo_path)
+	rh.load_settings()
+
+	calls: Dict[str, int] = {}
+
+	for idx, (function, exclude_name, other_requirements) in enumerate(rh.files):
+
+		def wrapper(*args, function=function, exclude_name=exclude_name) -> List[str]:  # noqa: MAN001
+			calls[exclude_name] = calls.get(exclude_name, 0) + 1
+			return function(*args)
+
+		wrapper._repo_helper_dependencies = function._repo_helper_dependencies  # type: ignore[attr-defined]
+		wrapper.__module__ = function.__module__
+		wrapper.__qualname__ = function.__qualname__
+		rh.files[idx] = (wrapper, exclude_name, other_requirements)
+
+	rh.run(incremental=True)
+	return calls
+
+
+def test_tracing_globals():
+	traced_globals = TracingGlobals({"version": "1.2.3", "username": "octocat", "docs_dir": "doc-source"})
+	assert traced_globals["version"] == "1.2.3"
+	assert traced_globals.get("docs_dir") == "doc-source"
+	assert "modname" not in traced_globals
+	assert traced_globals.accessed == {"version", "docs_dir", "modname"}
+	assert not traced_globals.accessed_all
+
+	assert len(list(traced_globals.items())) == 3
+	assert traced_globals.accessed_all
+
+
+def test_trace_environment():
+	environment = Environment()
+	environment.globals["version"] = "1.2.3"
+	environment.globals["username"] = "octocat"
+	traced = trace_environment(environment)
+	assert traced.from_string("{{ version }}").render() == "1.2.3"
+
+	# Rendering a template does not count as accessing every global.
+	assert isinstance(traced.globals, TracingGlobals)
+	assert not traced.globals.accessed_all
+
+
+def test_incremental_run(repo_path: PathPlus):
+	serial_repo = repo_path.parent / "serial"
+	serial_repo.maybe_make()
+	for filename in repo_path.rglob('*'):
+		if filename.is_file():
+			(serial_repo / filename.relative_to(repo_path)).parent.maybe_make(parents=True)
+			(serial_repo / filename.relative_to(repo_path)).write_bytes(filename.read_bytes())
+
+	rh = RepoHelper(serial_repo)
+	rh.load_settings()
+	rh.run()
+
+	first_run = _run(repo_path)
+	assert first_run
+	assert IncrementalCache(repo_path).traces
+
+	# Output identical to a non-incremental run.
+	for filename in serial_repo.rglob('*'):
+		if filename.is_file():
+			assert (repo_path / filename.relative_to(serial_repo)).read_bytes() == filename.read_bytes()
+
+	# Nothing has changed, so nothing is run.
+	assert _run(repo_path) == {}
+
+
+def test_incremental_run_config_changed(repo_path: PathPlus):
+	_run(repo_path)
+
+	config = (repo_path / "repo_helper.yml").read_text()
+	(repo_path / "repo_helper.yml").write_text(config.replace('version: "0.0.1"', 'version: "0.1.0"'))
+
+	second_run = _run(repo_path)
+	assert "bumpversion" in second_run
+	assert "setup_cfg" in second_run
+	assert "gitignore" not in second_run
+	assert "pre-commit" not in second_run
+
+
+def test_incremental_run_output_edited(repo_path: PathPlus):
+	_run(repo_path)
+
+	gitignore = (repo_path / ".gitignore").read_text()
+	(repo_path / ".gitignore").write_text("*.pyc\n")
+
+	assert _run(repo_path) == {"gitignore": 1}
+	assert (repo_path / ".gitignore").read_text() == gitignore
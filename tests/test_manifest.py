@@ -0,0 +1,104 @@
+# stdlib
+import json
+
+# 3rd party
+import pytest
+from domdf_python_tools.paths import PathPlus, in_directory
+
+# this package
+from repo_helper.core import RepoHelper
+from repo_helper.manifest import MANIFEST_FILENAME, Manifest, find_stale_files, hash_file, main
+
+
+@pytest.fixture()
+def repo_path(repo_path: PathPlus) -> PathPlus:
+	rh = RepoHelper(repo_path)
+	rh.load_settings()
+	rh.run()
+
+	return repo_path
+
+
+def test_hash_file(tmp_pathplus: PathPlus):
+	(tmp_pathplus / "file.txt").write_text("hello world")
+	assert hash_file(
+			tmp_pathplus / "file.txt"
+			) == "b94d27b9934d3e08a52e52d7da7dabfac484efe37a5380ee9088f7ace2efcde9"
+	assert hash_file(tmp_pathplus / "missing.txt") is None
+	assert hash_file(tmp_pathplus) is None
+
+
+def test_manifest(repo_path: PathPlus):
+	manifest = Manifest.load(repo_path)
+	assert manifest is not None
+	assert manifest.files["tox.ini"] == hash_file(repo_path / "tox.ini")
+	assert manifest.config == hash_file(repo_path / "repo_helper.yml")
+	assert manifest.inputs is not None
+	assert "requirements.txt" in manifest.inputs
+	assert "tests/requirements.txt" not in manifest.inputs  # It's managed
+	assert MANIFEST_FILENAME not in manifest.files
+	assert "repo_helper.yml" not in manifest.files
+
+	assert manifest.stale_files(repo_path) == []
+	assert find_stale_files(repo_path) == []
+
+	(repo_path / "tox.ini").write_text("[tox]\n")
+	(repo_path / "pyproject.toml").unlink()
+	assert manifest.stale_files(repo_path) == ["pyproject.toml", "tox.ini"]
+
+
+def test_manifest_version(repo_path: PathPlus):
+	# The version of repo_helper isn't recorded, so upgrading it doesn't change the committed manifest.
+	content = (repo_path / MANIFEST_FILENAME).read_text()
+	assert "version" not in json.loads(content)
+
+	# Manifests written by earlier versions can still be used.
+	data = json.loads(content)
+	data["version"] = "2020.1.1"
+	(repo_path / MANIFEST_FILENAME).write_text(json.dumps(data))
+
+	manifest = Manifest.load(repo_path)
+	assert manifest is not None
+	assert manifest.stale_files(repo_path) == []
+
+
+def test_manifest_config_changed(repo_path: PathPlus):
+	manifest = Manifest.load(repo_path)
+	assert manifest is not None
+
+	config = (repo_path / "repo_helper.yml").read_text()
+	(repo_path / "repo_helper.yml").write_text(config.replace('version: "0.0.1"', 'version: "0.1.0"'))
+	assert manifest.stale_files(repo_path) is None
+
+	stale_files = find_stale_files(repo_path)
+	assert MANIFEST_FILENAME not in stale_files
+	assert ".bumpversion.cfg" in stale_files
+	assert "tox.ini" not in stale_files
+
+	# The dry run doesn't update the manifest
+	assert Manifest.load(repo_path) == manifest
+
+
+def test_manifest_input_changed(repo_path: PathPlus):
+	manifest = Manifest.load(repo_path)
+	assert manifest is not None
+
+	(repo_path / "requirements.txt").write_text("click>=7.1.2\n")
+	assert manifest.stale_files(repo_path) is None
+
+	# Only the manifest itself records the requirements, and it isn't reported.
+	assert find_stale_files(repo_path) == []
+
+
+def test_main(repo_path: PathPlus, capsys):
+	with in_directory(repo_path):
+		assert main([]) == 0
+
+		(repo_path / "tox.ini").write_text("[tox]\n")
+		assert main([]) == 1
+
+	assert capsys.readouterr().err.splitlines() == [
+			"The following files managed by 'repo_helper' are out of date:",
+			"  tox.ini",
+			"Run 'repo_helper' to update them.",
+			]
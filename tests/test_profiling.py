@@ -0,0 +1,84 @@
+# stdlib
+import json
+import time
+
+# 3rd party
+from domdf_python_tools.paths import PathPlus
+
+# this package
+from repo_helper.core import RepoHelper
+from repo_helper.profiling import Profiler, current_profiler, record_file_changes, span
+
+
+def test_span_inactive():
+	assert current_profiler() is None
+
+	with span("status", "git") as git_span:
+		assert git_span is None
+
+
+def test_profiler(tmp_pathplus: PathPlus):
+	profiler = Profiler()
+
+	with profiler:
+		assert current_profiler() is profiler
+
+		with span("tox", "manager", outputs=["tox.ini", "setup.cfg"]) as manager_span:
+			assert manager_span is not None
+			time.sleep(0.01)
+
+		with span("status", "git"):
+			pass
+
+		record_file_changes({"tox.ini": 42})
+
+	assert current_profiler() is None
+
+	assert [s.name for s in profiler.spans] == ["tox", "status"]
+	assert profiler.spans[0].duration >= 0.01
+	assert profiler.spans[0].args["bytes_written"] == 42
+	assert profiler.spans[0].args["files_unchanged"] == 1
+	assert "bytes_written" not in profiler.spans[1].args
+
+	profiler.dump_chrome_trace(tmp_pathplus / "trace.json")
+	trace = json.loads((tmp_pathplus / "trace.json").read_text())
+	assert [event["name"] for event in trace["traceEvents"]] == ["tox", "status"]
+	assert {event["ph"] for event in trace["traceEvents"]} == {'X'}
+	assert trace["traceEvents"][0]["dur"] >= 10_000
+
+	summary = profiler.summary().splitlines()
+	assert summary[0].split() == [
+			"Category",
+			"Name",
+			"Calls",
+			"Total",
+			"(ms)",
+			"Bytes",
+			"written",
+			"Files",
+			"unchanged",
+			]
+	assert summary[2].split()[:3] == ["manager", "tox", '1']
+	assert summary[2].split()[-2:] == ["42", '1']
+
+
+def test_run_profiled(repo_path: PathPlus):
+	rh = RepoHelper(repo_path)
+	rh.load_settings()
+
+	profiler = Profiler()
+	rh.run(profiler=profiler)
+	assert current_profiler() is None
+
+	manager_spans = {s.name: s for s in profiler.spans if s.category == "manager"}
+	assert "tox" in manager_spans
+	assert "tox.ini" in manager_spans["tox"].args["outputs"]
+	assert manager_spans["tox"].args["bytes_written"] > 0
+	assert {"format", "io"} <= {s.category for s in profiler.spans}
+
+	# Nothing has changed on the second run.
+	profiler = Profiler()
+	rh.run(profiler=profiler)
+	manager_spans = {s.name: s for s in profiler.spans if s.category == "manager"}
+	assert manager_spans["tox"].args["bytes_written"] == 0
+	assert manager_spans["tox"].args["files_unchanged"] == len(manager_spans["tox"].args["outputs"])
@@ -0,0 +1,68 @@
+# stdlib
+import json
+
+# 3rd party
+import pytest
+from domdf_python_tools.paths import PathPlus
+
+# this package
+from repo_helper import registry
+from repo_helper.cli import cli
+from repo_helper.core import RepoHelper, import_registered_functions
+from repo_helper.files import management
+from repo_helper.registry import Registry, import_command, load_registry
+
+
+@pytest.fixture()
+def no_registry(monkeypatch):
+	monkeypatch.setattr(registry, "_registry", None)
+
+
+@pytest.mark.usefixtures("no_registry")
+def test_load_registry(tmp_pathplus: PathPlus):
+	built = load_registry()
+	assert registry._registry is built
+
+	cached = json.loads((tmp_pathplus / ".repo_helper_cache" / "registry.json").read_text())
+	assert cached["key"] == built.key
+
+	modules = dict(built.managers)
+	assert "tox" in modules["repo_helper.files.testing"]
+	assert "rtfd" in modules["repo_helper.files.docs"]
+	assert built.commands["show"] == "repo_helper.cli.commands.show"
+	assert built.commands["make-recipe"] == "repo_helper.cli.commands.conda_recipe"
+
+	assert Registry.load() == built
+
+
+@pytest.mark.usefixtures("no_registry")
+def test_load_registry_stale(tmp_pathplus: PathPlus):
+	load_registry()
+
+	filename = tmp_pathplus / ".repo_helper_cache" / "registry.json"
+	data = json.loads(filename.read_text())
+	data["key"] = "stale"
+	filename.write_text(json.dumps(data))
+	assert Registry.load() is None
+
+	filename.write_text("{")
+	assert Registry.load() is None
+
+
+@pytest.mark.usefixtures("no_registry")
+def test_import_command():
+	import_command("make-schema")
+	assert "make-schema" in cli.commands
+
+	# Unknown commands are ignored
+	import_command("not-a-command")
+
+
+@pytest.mark.usefixtures("no_registry")
+def test_import_registered_functions(tmp_pathplus: PathPlus):
+	(tmp_pathplus / "repo_helper.yml").write_text("modname: foo")
+
+	rh = RepoHelper(tmp_pathplus)
+	functions = import_registered_functions()
+	assert functions == [function for function, *_ in management]
+	assert [function for function, *_ in rh.files] == functions
@@ -0,0 +1,77 @@
+# 3rd party
+import jinja2
+import pytest
+from domdf_python_tools.paths import PathPlus
+
+# this package
+from repo_helper.templates import (
+		Environment,
+		PackageTemplateLoader,
+		TemplateBytecodeCache,
+		init_repo_template_dir,
+		template_dir,
+		template_environment
+		)
+
+
+def test_package_template_loader(tmp_pathplus: PathPlus):
+	(tmp_pathplus / "greeting.txt").write_text("Hello {{ name }}")
+	(tmp_pathplus / "subdir").mkdir()
+	(tmp_pathplus / "subdir" / "farewell.txt").write_text("Goodbye {{ name }}")
+
+	loader = PackageTemplateLoader(tmp_pathplus)
+	environment = Environment(loader=loader)  # nosec: B701
+
+	assert environment.get_template("greeting.txt").render(name="World") == "Hello World"
+	assert environment.get_template("subdir/farewell.txt").render(name="World") == "Goodbye World"
+	assert loader.list_templates() == ["greeting.txt", "subdir/farewell.txt"]
+
+	# The source is kept in memory, and not reloaded.
+	(tmp_pathplus / "greeting.txt").write_text("Hi {{ name }}")
+	assert Environment(loader=loader).get_template("greeting.txt").render(name="World") == "Hello World"
+
+	with pytest.raises(jinja2.TemplateNotFound):
+		environment.get_template("missing.txt")
+
+	with pytest.raises(jinja2.TemplateNotFound):
+		environment.get_template("../greeting.txt")
+
+
+def test_template_bytecode_cache(tmp_pathplus: PathPlus, monkeypatch):
+	(tmp_pathplus / "templates").mkdir()
+	(tmp_pathplus / "templates" / "greeting.txt").write_text("Hello {{ name }}")
+
+	environment = Environment(  # nosec: B701
+		loader=PackageTemplateLoader(tmp_pathplus / "templates"),
+		bytecode_cache=TemplateBytecodeCache(tmp_pathplus / "cache"),
+	)
+	assert environment.get_template("greeting.txt").render(name="World") == "Hello World"
+	assert len(list((tmp_pathplus / "cache").iterdir())) == 1
+
+	# A new process loads the compiled template from disk rather than compiling it.
+	environment = Environment(  # nosec: B701
+		loader=PackageTemplateLoader(tmp_pathplus / "templates"),
+		bytecode_cache=TemplateBytecodeCache(tmp_pathplus / "cache"),
+	)
+
+	def compile(*args, **kwargs):  # noqa: A001,MAN001,MAN002  # pylint: disable=redefined-builtin
+		raise AssertionError("Template was recompiled")
+
+	monkeypatch.setattr(environment, "compile", compile)
+	assert environment.get_template("greeting.txt").render(name="World") == "Hello World"
+
+
+def test_template_environment():
+	environment = template_environment()
+	assert not environment.auto_reload
+	assert isinstance(environment.undefined(), jinja2.StrictUndefined)
+	assert environment.loader is template_environment(template_dir).loader
+	assert environment.bytecode_cache is template_environment(init_repo_template_dir).bytecode_cache
+	assert environment.loader is not template_environment(init_repo_template_dir).loader
+
+	assert "setup._py" in environment.list_templates()
+	assert "generic._py" in template_environment(init_repo_template_dir).list_templates()
+
+	# Each environment has its own globals.
+	environment.globals["name"] = "World"
+	assert "name" not in template_environment().globals
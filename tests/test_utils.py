@@ -26,11 +26,13 @@ from typing import Tuple
 
 # 3rd party
 import pytest
+from apeye.requests_url import RequestsURL
 from coincidence import AdvancedDataRegressionFixture, AdvancedFileRegressionFixture
 
 # this package
+from repo_helper import utils
 from repo_helper.configuration.utils import get_version_classifiers
-from repo_helper.utils import get_license_text, indent_with_tab, pformat_tabs
+from repo_helper.utils import get_license_text, indent_with_tab, license_file_lookup, pformat_tabs
 
 
 def test_indent_with_tab():
@@ -112,3 +114,53 @@ def test_get_license_text(
 		advanced_file_regression: AdvancedFileRegressionFixture,
 		):
 	advanced_file_regression.check(get_license_text(license_name, copyright_years, "Joe Bloggs", "hello-world.c"))
+
+
+@pytest.mark.parametrize("license_name", [*license_file_lookup, "BSD License", "Apache Software License"])
+def test_get_license_text_offline(license_name: str, monkeypatch):
+	monkeypatch.delenv("REPO_HELPER_FETCH_LICENSES", raising=False)
+	monkeypatch.setattr(RequestsURL, "get", lambda *args, **kwargs: pytest.fail("Network accessed"))
+
+	license_text = get_license_text(license_name, 2020, "Joe Bloggs", "hello-world.c")
+	assert license_text.strip()
+	assert "{{" not in license_text
+
+
+def test_get_license_text_fetch(monkeypatch):
+	requests = []
+
+	class Response:
+		status_code = 200
+		text = "Fetched\nCopyright (c) {{ year }} {{ organization }}"
+
+	def get(url: RequestsURL, *args, **kwargs) -> Response:
+		requests.append(url)
+		return Response()
+
+	monkeypatch.setattr(RequestsURL, "get", get)
+
+	bundled = get_license_text("MIT", 2020, "Joe Bloggs", "hello-world.c")
+	assert bundled.startswith("Copyright (c) 2020 Joe Bloggs")
+	assert requests == []
+
+	# The downloaded template is cached.
+	assert get_license_text("MIT", 2020, "Joe Bloggs", "hello-world.c", fetch=True) == Response.text.replace(
+			"{{ year }} {{ organization }}", "2020 Joe Bloggs"
+			)
+	monkeypatch.setenv("REPO_HELPER_FETCH_LICENSES", '1')
+	assert get_license_text("MIT", 2021, "Joe Bloggs", "hello-world.c").startswith("Fetched")
+	assert len(requests) == 1
+
+	# Until it expires.
+	monkeypatch.setattr(utils, "license_cache_ttl", 0)
+	assert get_license_text("MIT", 2021, "Joe Bloggs", "hello-world.c").startswith("Fetched")
+	assert len(requests) == 2
+
+	# The bundled template is used if the download fails.
+	def fail(url: RequestsURL, *args, **kwargs) -> None:
+		requests.append(url)
+		raise ConnectionError
+
+	monkeypatch.setattr(RequestsURL, "get", fail)
+	assert get_license_text("MIT", 2020, "Joe Bloggs", "hello-world.c") == bundled
+	assert len(requests) == 4
@@ -0,0 +1,102 @@
+# stdlib
+import os
+from typing import List
+
+# 3rd party
+import pytest
+from domdf_python_tools.paths import PathPlus
+
+# this package
+from repo_helper.core import RepoHelper
+from repo_helper.vfs import FileChange, VirtualFileSystem, unified_diff
+
+
+def test_vfs(tmp_pathplus: PathPlus):
+	(tmp_pathplus / "unchanged.txt").write_text("unchanged\n")
+	(tmp_pathplus / "changed.txt").write_text("old\n")
+	(tmp_pathplus / "old" / "workflow.yml").parent.mkdir()
+	(tmp_pathplus / "old" / "workflow.yml").write_text("removed\n")
+	os.utime(tmp_pathplus / "unchanged.txt", (0, 0))
+
+	with VirtualFileSystem(tmp_pathplus) as vfs:
+		vfs.load("unchanged.txt", "changed.txt", "old/workflow.yml", "missing.txt")
+
+		(vfs.root / "unchanged.txt").write_text("unchanged\n")
+		(vfs.root / "changed.txt").write_text("new\n")
+		(vfs.root / "added.txt").write_text("added\n")
+		(vfs.root / "old" / "workflow.yml").unlink()
+		(vfs.root / "old").rmdir()
+
+		expected = [
+				FileChange("added.txt", None, b"added\n"),
+				FileChange("changed.txt", b"old\n", b"new\n"),
+				FileChange("old/workflow.yml", b"removed\n", None),
+				]
+		assert vfs.changes() == expected
+
+		# Nothing is written until the changes are flushed.
+		assert (tmp_pathplus / "changed.txt").read_text() == "old\n"
+		assert vfs.flush() == expected
+		assert vfs.changes() == []
+
+	assert (tmp_pathplus / "changed.txt").read_text() == "new\n"
+	assert (tmp_pathplus / "added.txt").read_text() == "added\n"
+	assert not (tmp_pathplus / "old").exists()
+	assert (tmp_pathplus / "unchanged.txt").stat().st_mtime == 0
+
+	with pytest.raises(RuntimeError, match="The staging area only exists inside the 'with' block."):
+		vfs.root  # pylint: disable=pointless-statement
+
+
+def test_unified_diff():
+	changes = [
+			FileChange("added.txt", None, b"added\n"),
+			FileChange("changed.txt", b"old\nunchanged\n", b"new\nunchanged\n"),
+			FileChange("image.png", b"\x89PNG\xff", None),
+			]
+
+	assert unified_diff(changes) == '\n'.join([
+			"--- /dev/null",
+			"+++ b/added.txt",
+			"@@ -0,0 +1 @@",
+			"+added",
+			"--- a/changed.txt",
+			"+++ b/changed.txt",
+			"@@ -1,2 +1,2 @@",
+			"-old",
+			"+new",
+			" unchanged",
+			"Binary files a/image.png and /dev/null differ",
+			'',
+			])
+
+
+def test_run_dry_run(repo_path: PathPlus):
+	def list_files() -> List[PathPlus]:
+		return sorted(repo_path.rglob('*'))
+
+	before = list_files()
+
+	rh = RepoHelper(repo_path)
+	rh.load_settings()
+	managed_files = rh.run(dry_run=True)
+
+	assert list_files() == before
+	assert "tox.ini" in managed_files
+	assert "tox.ini" in {change.filename for change in rh.changes}
+
+	rh.run()
+	assert (repo_path / "tox.ini").is_file()
+	assert rh.changes
+
+	for filename in managed_files:
+		if (repo_path / filename).is_file():
+			os.utime(repo_path / filename, (0, 0))
+
+	# Nothing has changed, so nothing is written.
+	rh.run()
+	assert rh.changes == []
+
+	for filename in managed_files:
+		if (repo_path / filename).is_file():
+			assert (repo_path / filename).stat().st_mtime == 0, filename
@@ -0,0 +1,157 @@
+# stdlib
+import os
+import sys
+import threading
+from typing import Callable, List
+
+# 3rd party
+import pytest
+from domdf_python_tools.paths import PathPlus
+
+# this package
+from repo_helper.core import RepoHelper
+from repo_helper.vfs import FileChange
+from repo_helper.watch import InotifyWatcher, PollingWatcher, Watcher, snapshot, watch, watched_files
+
+
+def test_snapshot(tmp_pathplus: PathPlus):
+	(tmp_pathplus / "a.txt").write_text("hello")
+	states = snapshot(tmp_pathplus, ["a.txt", "missing.txt"])
+	assert states["a.txt"] is not None
+	assert states["a.txt"][1] == 5
+	assert states["missing.txt"] is None
+
+	(tmp_pathplus / "a.txt").write_text("hello world")
+	assert snapshot(tmp_pathplus, ["a.txt", "missing.txt"]) != states
+
+
+def test_watched_files(repo_path: PathPlus):
+	rh = RepoHelper(repo_path)
+	rh.load_settings()
+
+	filenames = watched_files(rh)
+	assert "repo_helper.yml" in filenames
+	assert "requirements.txt" in filenames
+	assert filenames == sorted(set(filenames))
+
+	(repo_path / "repo_helper.yml").write_text(
+			(repo_path / "repo_helper.yml").read_text().replace("  schema:\n    - lxml", "  web: extra.txt"),
+			)
+	rh = RepoHelper(repo_path)
+	rh.load_settings()
+	assert "extra.txt" in watched_files(rh)
+
+
+def test_watcher_abstract(tmp_pathplus: PathPlus):
+	with pytest.raises(TypeError, match="abstract"):
+		Watcher(tmp_pathplus, ["a.txt"])  # type: ignore[abstract]
+
+
+def test_polling_watcher(tmp_pathplus: PathPlus):
+	(tmp_pathplus / "a.txt").write_text("hello")
+
+	with PollingWatcher(tmp_pathplus, ["a.txt", "b.txt"], interval=0.01) as watcher:
+		assert not watcher.wait(0.05)
+
+		(tmp_pathplus / "b.txt").write_text("created")
+		assert watcher.wait(1)
+		assert not watcher.wait(0.05)
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is only available on Linux")
+def test_inotify_watcher(tmp_pathplus: PathPlus):
+	(tmp_pathplus / "a.txt").write_text("hello")
+
+	with InotifyWatcher(tmp_pathplus, ["a.txt", "subdir/b.txt"]) as watcher:
+		assert not watcher.wait(0.05)
+
+		(tmp_pathplus / "a.txt").write_text("world")
+		assert watcher.wait(1)
+		assert not watcher.wait(0.05)
+
+		# The directory doesn't exist, so its parent is watched.
+		(tmp_pathplus / "subdir").mkdir()
+		assert watcher.wait(1)
+
+
+def test_watch_single_run(repo_path: PathPlus):
+	runs: List[List[FileChange]] = []
+	watch(repo_path, on_run=runs.append, max_runs=1)
+
+	assert len(runs) == 1
+	assert "setup.cfg" in {change.filename for change in runs[0]}
+	assert (repo_path / "setup.cfg").is_file()
+
+
+def test_watch_invalid_config(repo_path: PathPlus):
+	(repo_path / "repo_helper.yml").write_text("modname: foo\n")
+
+	errors: List[Exception] = []
+	watch(repo_path, on_error=errors.append, max_runs=1)
+	assert len(errors) == 1
+
+	with pytest.raises(Exception):  # noqa: PT011
+		watch(repo_path, max_runs=1)
+
+
+def _replace_file(filename: PathPlus, content: str) -> None:
+	# Write the new content to a temporary file first, so the watcher never sees a truncated file.
+	temp_file = filename.with_name(filename.name + ".tmp")
+	temp_file.write_text(content)
+	os.replace(temp_file, filename)
+
+
+def _watch_and_edit(repo_path: PathPlus, poll: bool, edit: Callable[[], None]) -> List[List[FileChange]]:
+	runs: List[List[FileChange]] = []
+	first_run = threading.Event()
+
+	def on_run(changes: List[FileChange]) -> None:
+		runs.append(changes)
+		first_run.set()
+
+	thread = threading.Thread(
+			target=watch,
+			args=(repo_path, ),
+			kwargs={"on_run": on_run, "max_runs": 2, "poll": poll, "debounce": 0.05},
+			daemon=True,
+			)
+	thread.start()
+	assert first_run.wait(60)
+
+	edit()
+
+	thread.join(60)
+	assert not thread.is_alive()
+
+	assert len(runs) == 2
+	return runs
+
+
+@pytest.mark.parametrize("poll", [True, False])
+def test_watch_config_changed(repo_path: PathPlus, poll: bool):
+	config_file = repo_path / "repo_helper.yml"
+	config = config_file.read_text()
+
+	def edit() -> None:
+		_replace_file(config_file, config.replace('version: "0.0.1"', 'version: "0.1.0"'))
+
+	runs = _watch_and_edit(repo_path, poll, edit)
+
+	second_run = {change.filename for change in runs[1]}
+	assert "setup.cfg" in second_run
+	assert ".gitignore" not in second_run
+
+
+@pytest.mark.parametrize("poll", [True, False])
+def test_watch_extras_changed(repo_path: PathPlus, poll: bool):
+	config_file = repo_path / "repo_helper.yml"
+	config_file.write_text(config_file.read_text().replace("  schema:\n    - lxml", "  web: extra.txt"))
+	(repo_path / "extra.txt").write_text("foo>=1\n")
+
+	def edit() -> None:
+		_replace_file(repo_path / "extra.txt", "foo>=1\nbar>=2\n")
+
+	runs = _watch_and_edit(repo_path, poll, edit)
+
+	assert "pyproject.toml" in {change.filename for change in runs[1]}
+	assert "bar>=2" in (repo_path / "pyproject.toml").read_text()